@@ -0,0 +1,93 @@
+"""Compare the full and API-only settings profiles of one service.
+
+Each measurement runs in a fresh interpreter so import costs are real:
+
+* startup: time to import Django, run ``django.setup()`` and build the WSGI
+  application, repeated ``--startups`` times;
+* per-request: median latency of ``--requests`` GETs against ``--path``
+  through the full middleware stack, using Django's test client on a
+  throwaway migrated test database.
+
+Examples::
+
+    python scripts/benchmark_settings.py clubs_service --path /clubs/
+    python scripts/benchmark_settings.py notifications_service --path /api/notifications/
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+
+SERVICES_DIR = Path(__file__).resolve().parent.parent / 'services'
+
+STARTUP_SNIPPET = """
+import json, time
+started = time.perf_counter()
+from django.core.wsgi import get_wsgi_application
+get_wsgi_application()
+print(json.dumps({'startup': time.perf_counter() - started}))
+"""
+
+REQUEST_SNIPPET = """
+import json, sys, time
+import django
+django.setup()
+from django.test.utils import setup_databases, setup_test_environment, teardown_databases
+from django.test import Client
+setup_test_environment()
+old_config = setup_databases(verbosity=0, interactive=False)
+client = Client()
+path, count = sys.argv[1], int(sys.argv[2])
+for _ in range(50):
+    client.get(path)
+samples = []
+for _ in range(count):
+    started = time.perf_counter()
+    response = client.get(path, HTTP_ACCEPT='application/json')
+    samples.append(time.perf_counter() - started)
+assert response.status_code == 200, response.status_code
+teardown_databases(old_config, verbosity=0)
+print(json.dumps({'samples': samples}))
+"""
+
+
+def run_snippet(service_dir, settings_module, snippet, *args):
+    env = dict(os.environ, DJANGO_SETTINGS_MODULE=settings_module)
+    env.setdefault('DJANGO_SECRET_KEY', 'benchmark')
+    result = subprocess.run(
+        [sys.executable, '-c', snippet, *args],
+        cwd=service_dir, env=env, capture_output=True, text=True, check=True,
+    )
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('service', help="Service directory, e.g. 'clubs_service'")
+    parser.add_argument('--path', required=True, help='GET endpoint to time')
+    parser.add_argument('--startups', type=int, default=10)
+    parser.add_argument('--requests', type=int, default=2000)
+    args = parser.parse_args()
+
+    service_dir = SERVICES_DIR / args.service
+    package = args.service
+    print(f"{args.service}: GET {args.path}")
+    for label, module in (('full', f'{package}.settings'), ('api-only', f'{package}.settings_api')):
+        startups = [
+            run_snippet(service_dir, module, STARTUP_SNIPPET)['startup']
+            for _ in range(args.startups)
+        ]
+        samples = run_snippet(service_dir, module, REQUEST_SNIPPET, args.path, str(args.requests))['samples']
+        print(
+            f"  {label:<9} startup median {statistics.median(startups) * 1000:7.1f} ms   "
+            f"request median {statistics.median(samples) * 1e6:7.0f} us   "
+            f"mean {statistics.mean(samples) * 1e6:7.0f} us"
+        )
+
+
+if __name__ == '__main__':
+    main()
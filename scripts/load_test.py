@@ -0,0 +1,82 @@
+"""Minimal HTTP load generator for comparing server modes.
+
+Runs ``--concurrency`` threads, each with its own keep-alive session, against
+one URL for ``--duration`` seconds and reports throughput and latency
+percentiles.  Only depends on ``requests``, which is already a project
+requirement.
+
+Examples::
+
+    python scripts/load_test.py http://localhost:8001/clubs/
+    python scripts/load_test.py http://localhost:8003/orders/ --method POST \\
+        --data '{"userId": "u1", "items": [{"ticketTypeId": "...", "quantity": 1}]}'
+"""
+
+import argparse
+import json
+import statistics
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import requests
+
+
+def run_worker(url, method, payload, deadline):
+    """Issue requests until ``deadline`` and return (latencies, errors)."""
+    latencies = []
+    errors = 0
+    session = requests.Session()
+    while time.perf_counter() < deadline:
+        started = time.perf_counter()
+        try:
+            response = session.request(method, url, json=payload, timeout=30)
+            ok = response.status_code < 400
+        except requests.RequestException:
+            ok = False
+        if ok:
+            latencies.append(time.perf_counter() - started)
+        else:
+            errors += 1
+    session.close()
+    return latencies, errors
+
+
+def percentile(samples, fraction):
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * fraction))]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('url')
+    parser.add_argument('--method', default='GET')
+    parser.add_argument('--data', help='JSON request body')
+    parser.add_argument('--concurrency', type=int, default=16)
+    parser.add_argument('--duration', type=float, default=15.0, help='Seconds to run')
+    args = parser.parse_args()
+
+    payload = json.loads(args.data) if args.data else None
+    deadline = time.perf_counter() + args.duration
+    with ThreadPoolExecutor(max_workers=args.concurrency) as pool:
+        futures = [
+            pool.submit(run_worker, args.url, args.method.upper(), payload, deadline)
+            for _ in range(args.concurrency)
+        ]
+        results = [future.result() for future in futures]
+
+    latencies = [latency for worker_latencies, _ in results for latency in worker_latencies]
+    errors = sum(worker_errors for _, worker_errors in results)
+    print(f"{args.method.upper()} {args.url} concurrency={args.concurrency} duration={args.duration:.0f}s")
+    print(f"  requests ok: {len(latencies)}  errors: {errors}")
+    print(f"  throughput: {len(latencies) / args.duration:.1f} req/s")
+    if latencies:
+        print(
+            f"  latency ms: mean {statistics.mean(latencies) * 1000:.1f}  "
+            f"p50 {percentile(latencies, 0.50) * 1000:.1f}  "
+            f"p95 {percentile(latencies, 0.95) * 1000:.1f}  "
+            f"p99 {percentile(latencies, 0.99) * 1000:.1f}"
+        )
+
+
+if __name__ == '__main__':
+    main()
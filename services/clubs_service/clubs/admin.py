@@ -1,5 +1,5 @@
 from django.contrib import admin
-from .models import Club, Membership
+from .models import Club, Membership, OutboxEvent
 
 @admin.register(Club)
 class ClubAdmin(admin.ModelAdmin):
@@ -10,4 +10,10 @@ class ClubAdmin(admin.ModelAdmin):
 class MembershipAdmin(admin.ModelAdmin):
     list_display = ("id", "club", "user_name", "role", "join_date")
     search_fields = ("user_name",)
-    list_filter = ("role",)
\ No newline at end of file
+    list_filter = ("role",)
+
+
+@admin.register(OutboxEvent)
+class OutboxEventAdmin(admin.ModelAdmin):
+    list_display = ("id", "event_type", "created_at")
+    list_filter = ("event_type",)
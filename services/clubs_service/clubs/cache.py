@@ -0,0 +1,87 @@
+"""Response cache for the club list endpoint.
+
+Cached pages are keyed on a generation token plus the full request URL, which
+covers the status filter, cursor and page size.  Any write that can change a
+listed club replaces the generation token once its transaction commits,
+orphaning every cached page at once; orphaned entries then expire after
+``CLUB_LIST_CACHE_TIMEOUT`` seconds.
+
+The cache backend comes from ``CACHES`` and must be shared by every worker,
+since a generation bump only reaches the processes that can see it.  The
+default file-based cache is shared by all workers of one container;
+per-process backends such as ``LocMemCache`` switch the list cache off.
+"""
+
+import hashlib
+import json
+import uuid
+from typing import Any, Optional, Tuple
+
+from django.conf import settings
+from django.core.cache import DEFAULT_CACHE_ALIAS, cache, caches
+from django.core.cache.backends.dummy import DummyCache
+from django.core.cache.backends.locmem import LocMemCache
+from django.db import transaction
+from django.utils.http import parse_etags
+
+GENERATION_KEY = 'clubs:list:generation'
+
+
+def _generation() -> str:
+    generation = cache.get(GENERATION_KEY)
+    if generation is None:
+        cache.add(GENERATION_KEY, uuid.uuid4().hex, timeout=None)
+        generation = cache.get(GENERATION_KEY)
+    return generation
+
+
+def list_cache_enabled() -> bool:
+    """Whether club list pages may be cached with the configured backend."""
+    if settings.CLUB_LIST_CACHE_TIMEOUT <= 0:
+        return False
+    return not isinstance(caches[DEFAULT_CACHE_ALIAS], (LocMemCache, DummyCache))
+
+
+def list_cache_key(url: str) -> str:
+    """Cache key for the list page at ``url`` under the current generation.
+
+    Build the key once per request and use it for both the lookup and the
+    store, so a page computed before an invalidation is never filed under
+    the generation that invalidation created.
+    """
+    digest = hashlib.md5(url.encode('utf-8')).hexdigest()
+    return f'clubs:list:{_generation()}:{digest}'
+
+
+def get_cached_list(key: str) -> Optional[Tuple[str, Any]]:
+    """Return ``(etag, data)`` stored under ``key``, or ``None``."""
+    return cache.get(key)
+
+
+def set_cached_list(key: str, etag: str, data: Any) -> None:
+    cache.set(key, (etag, data), timeout=settings.CLUB_LIST_CACHE_TIMEOUT)
+
+
+def compute_etag(data: Any) -> str:
+    """Strong ETag over the canonical JSON form of a response payload."""
+    body = json.dumps(data, sort_keys=True, separators=(',', ':'), default=str)
+    return f'"{hashlib.md5(body.encode("utf-8")).hexdigest()}"'
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """Weak comparison of an ``If-None-Match`` header against ``etag``."""
+    if not if_none_match:
+        return False
+    candidates = parse_etags(if_none_match)
+    return '*' in candidates or any(
+        candidate.removeprefix('W/') == etag for candidate in candidates
+    )
+
+
+def _bump_generation() -> None:
+    cache.set(GENERATION_KEY, uuid.uuid4().hex, timeout=None)
+
+
+def invalidate_club_list() -> None:
+    """Drop every cached club list page once the current transaction commits."""
+    transaction.on_commit(_bump_generation)
@@ -0,0 +1,68 @@
+"""Django management command to relay outbox events to RabbitMQ."""
+
+import logging
+import time
+
+from django.core.management.base import BaseCommand
+from django.db import close_old_connections
+
+from clubs.messaging import EventPublisher
+from clubs.outbox import relay_batch
+
+logger = logging.getLogger(__name__)
+
+
+class Command(BaseCommand):
+    help = 'Drain the transactional outbox to the RabbitMQ events queue'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=100,
+                            help='Maximum number of events published per batch')
+        parser.add_argument('--interval', type=float, default=1.0,
+                            help='Seconds to sleep when the outbox is empty or a batch fails')
+        parser.add_argument('--once', action='store_true',
+                            help='Drain the outbox once and exit')
+        parser.add_argument('--metrics-every', type=int, default=100,
+                            help='Log publisher metrics every N relayed batches (0 logs them only on exit)')
+
+    def handle(self, *args, **options):
+        batch_size = options['batch_size']
+        metrics_every = options['metrics_every']
+        batches = 0
+        publisher = EventPublisher(pool_size=1, confirm_delivery=True)
+        self.stdout.write(self.style.SUCCESS('Starting outbox relay...'))
+
+        try:
+            while True:
+                try:
+                    sent = relay_batch(publisher, batch_size=batch_size)
+                except Exception as e:
+                    if options['once']:
+                        raise
+                    # Keep relaying through broker or database outages; the
+                    # batch stays in the outbox and is retried next pass.
+                    logger.error(f"Outbox relay batch failed: {e}")
+                    close_old_connections()
+                    time.sleep(options['interval'])
+                    continue
+                if sent:
+                    batches += 1
+                    if metrics_every and batches % metrics_every == 0:
+                        self.log_metrics(publisher)
+                if sent < batch_size:
+                    if options['once']:
+                        break
+                    time.sleep(options['interval'])
+        except KeyboardInterrupt:
+            self.stdout.write(self.style.SUCCESS('Outbox relay stopped.'))
+        finally:
+            self.log_metrics(publisher)
+            publisher.close()
+
+    def log_metrics(self, publisher):
+        metrics = publisher.metrics.snapshot()
+        logger.info(
+            f"Publisher metrics: published={metrics['published']} failed={metrics['failed']} "
+            f"reconnects={metrics['reconnects']} avg_latency_ms={metrics['avg_latency_ms']:.2f} "
+            f"max_latency_ms={metrics['max_latency_ms']:.2f}"
+        )
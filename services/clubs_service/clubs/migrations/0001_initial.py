@@ -0,0 +1,60 @@
+# Generated by Django 4.2.30 on 2026-10-17 17:36
+
+from django.db import migrations, models
+import django.db.models.deletion
+import uuid
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Club',
+            fields=[
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('name', models.CharField(max_length=200)),
+                ('description', models.TextField(blank=True)),
+                ('status', models.CharField(choices=[('active', 'Active'), ('pending_approval', 'Pending Approval'), ('inactive', 'Inactive')], default='pending_approval', max_length=20)),
+                ('member_count', models.IntegerField(default=0)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+        ),
+        migrations.CreateModel(
+            name='OutboxEvent',
+            fields=[
+                ('id', models.BigAutoField(primary_key=True, serialize=False)),
+                ('event_type', models.CharField(max_length=50)),
+                ('payload', models.JSONField()),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+            ],
+        ),
+        migrations.CreateModel(
+            name='Membership',
+            fields=[
+                ('id', models.AutoField(primary_key=True, serialize=False)),
+                ('user_id', models.CharField(max_length=100)),
+                ('user_name', models.CharField(max_length=200)),
+                ('role', models.CharField(choices=[('member', 'Member'), ('officer', 'Officer'), ('advisor', 'Advisor')], default='member', max_length=20)),
+                ('join_date', models.DateTimeField(auto_now_add=True)),
+                ('club', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='members', to='clubs.club')),
+            ],
+        ),
+        migrations.AddIndex(
+            model_name='club',
+            index=models.Index(fields=['status', 'created_at'], name='clubs_club_status_3cc7a9_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='membership',
+            index=models.Index(fields=['club', 'join_date'], name='clubs_membe_club_id_e60842_idx'),
+        ),
+        migrations.AlterUniqueTogether(
+            name='membership',
+            unique_together={('club', 'user_id')},
+        ),
+    ]
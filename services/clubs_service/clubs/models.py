@@ -1,5 +1,8 @@
 import uuid
 from django.db import models
+from django.utils import timezone
+
+from .cache import invalidate_club_list
 
 
 class Club(models.Model):
@@ -20,6 +23,12 @@ class Club(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    class Meta:
+        indexes = [
+            # Keyset pagination of the status-filtered club list.
+            models.Index(fields=['status', 'created_at']),
+        ]
+
     def __str__(self) -> str:
         return self.name
 
@@ -40,12 +49,33 @@ class Membership(models.Model):
 
     class Meta:
         unique_together = ('club', 'user_id')
+        indexes = [
+            models.Index(fields=['club', 'join_date']),
+        ]
 
     def save(self, *args, **kwargs) -> None:
         creating = self.pk is None
         super().save(*args, **kwargs)
         if creating:
-            Club.objects.filter(pk=self.club_id).update(member_count=models.F('member_count') + 1)
+            Club.objects.filter(pk=self.club_id).update(
+                member_count=models.F('member_count') + 1,
+                updated_at=timezone.now(),
+            )
+            invalidate_club_list()
+
+    def __str__(self) -> str:
+        return f"{self.user_name} ({self.role})"
+
+class OutboxEvent(models.Model):
+    """A domain event waiting to be relayed to the RabbitMQ 'events' queue.
+
+    Rows are written in the same transaction as the domain change and removed
+    by the ``relay_outbox`` command once the broker has confirmed them.
+    """
+    id = models.BigAutoField(primary_key=True)
+    event_type = models.CharField(max_length=50)
+    payload = models.JSONField()
+    created_at = models.DateTimeField(auto_now_add=True)
 
     def __str__(self) -> str:
-        return f"{self.user_name} ({self.role})"
\ No newline at end of file
+        return f"{self.event_type} #{self.pk}"
@@ -0,0 +1,56 @@
+"""Transactional outbox for domain events.
+
+Views call :func:`enqueue_event` inside the same ``transaction.atomic()`` block
+as the write that produced the event, so an event is stored if and only if
+the change is committed and the HTTP response never waits on the broker.
+The ``relay_outbox`` management command drains the table with
+:func:`relay_batch`.  Delivery is at-least-once: a crash between the broker
+confirm and the delete can republish a batch.
+"""
+
+import logging
+import uuid
+
+from .messaging import EventPublisher, encode_message
+from .models import OutboxEvent
+
+logger = logging.getLogger(__name__)
+
+
+def enqueue_event(event_type: str, data: dict) -> OutboxEvent:
+    """Store an event for publishing once the current transaction commits."""
+    return OutboxEvent.objects.create(event_type=event_type, payload=data)
+
+
+def outbox_event_id(event: OutboxEvent) -> str:
+    """Envelope id for an outbox row, stable if the row is relayed twice."""
+    return str(uuid.uuid5(
+        uuid.NAMESPACE_URL,
+        f'{OutboxEvent._meta.label}/{event.pk}/{event.created_at.isoformat()}',
+    ))
+
+
+def relay_batch(publisher: EventPublisher, batch_size: int = 100) -> int:
+    """Publish up to ``batch_size`` pending events in insertion order.
+
+    Only events the broker confirmed are deleted; the rest stay in the outbox
+    for the next pass.  Returns the number of events relayed.
+    """
+    events = list(OutboxEvent.objects.order_by('id')[:batch_size])
+    if not events:
+        return 0
+    bodies = [
+        encode_message(
+            event.event_type,
+            event.payload,
+            event_id=outbox_event_id(event),
+            occurred_at=event.created_at,
+            codec=publisher.codec,
+        )
+        for event in events
+    ]
+    sent = publisher.publish_many(bodies, properties=publisher.properties(delivery_mode=2))
+    if sent:
+        OutboxEvent.objects.filter(pk__in=[event.pk for event in events[:sent]]).delete()
+        logger.info(f"Relayed {sent} outbox events")
+    return sent
@@ -0,0 +1,19 @@
+"""Cursor (keyset) pagination for the clubs service list endpoints."""
+
+from rest_framework.pagination import CursorPagination
+
+
+class KeysetPagination(CursorPagination):
+    """Pages by position in an indexed ordering instead of OFFSET plus COUNT."""
+
+    page_size = 50
+    page_size_query_param = 'page_size'
+    max_page_size = 500
+
+
+class ClubCursorPagination(KeysetPagination):
+    ordering = '-created_at'
+
+
+class MembershipCursorPagination(KeysetPagination):
+    ordering = 'join_date'
@@ -0,0 +1,31 @@
+"""Request parsers for the clubs service."""
+
+import codecs
+import csv
+from typing import Dict, IO, List
+
+from rest_framework.exceptions import ParseError
+from rest_framework.parsers import BaseParser
+
+
+def read_csv_rows(stream: IO[bytes], encoding: str = 'utf-8-sig') -> List[Dict[str, str]]:
+    """Read a CSV document with a header row into a list of dicts."""
+    try:
+        reader = csv.DictReader(codecs.iterdecode(stream, encoding))
+        if not reader.fieldnames:
+            raise ParseError('CSV upload is empty or has no header row.')
+        return [
+            {key.strip(): (value or '').strip() for key, value in row.items() if key}
+            for row in reader
+        ]
+    except (UnicodeDecodeError, csv.Error) as e:
+        raise ParseError(f'Could not parse CSV upload: {e}')
+
+
+class CSVParser(BaseParser):
+    """Parses a ``text/csv`` body into a list of row dicts."""
+
+    media_type = 'text/csv'
+
+    def parse(self, stream, media_type=None, parser_context=None):
+        return read_csv_rows(stream)
@@ -0,0 +1,97 @@
+"""Tests for importing club members from JSON and CSV."""
+
+import uuid
+
+from django.core.files.uploadedfile import SimpleUploadedFile
+from rest_framework.test import APITestCase
+
+from clubs.models import Club, Membership, OutboxEvent
+from clubs.views import ClubMemberBulkImportView
+
+
+class ClubMemberBulkImportTests(APITestCase):
+
+    def setUp(self):
+        self.club = Club.objects.create(name='Chess', status='active')
+        self.url = f'/clubs/{self.club.pk}/members/bulk/'
+
+    def member_ids(self):
+        return sorted(Membership.objects.filter(club=self.club).values_list('user_id', flat=True))
+
+    def test_json_import_dedupes_and_bumps_member_count_once(self):
+        Membership.objects.create(club=self.club, user_id='u1', user_name='Alex')
+        Club.objects.filter(pk=self.club.pk).update(member_count=1)
+
+        response = self.client.post(self.url, [
+            {'user_id': 'u1', 'user_name': 'Alex'},
+            {'user_id': 'u2', 'user_name': 'Jamie', 'role': 'officer'},
+            {'user_id': 'u2', 'user_name': 'Jamie again'},
+            {'user_id': 'u3', 'user_name': 'Sam'},
+        ], format='json')
+
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(response.data, {'created': 2, 'skipped': 2})
+        self.assertEqual(self.member_ids(), ['u1', 'u2', 'u3'])
+        self.assertEqual(Membership.objects.get(club=self.club, user_id='u2').user_name, 'Jamie')
+        self.club.refresh_from_db()
+        self.assertEqual(self.club.member_count, 3)
+        message = OutboxEvent.objects.get(event_type='members_added')
+        self.assertEqual(message.payload['count'], 2)
+
+    def test_csv_body_import(self):
+        body = 'user_id,user_name,role\nu1,Alex,officer\nu2,Jamie,member\n'
+
+        response = self.client.post(self.url, body, content_type='text/csv')
+
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(self.member_ids(), ['u1', 'u2'])
+        self.assertEqual(Membership.objects.get(club=self.club, user_id='u1').role, 'officer')
+
+    def test_multipart_csv_upload(self):
+        upload = SimpleUploadedFile('members.csv', b'\xef\xbb\xbfuser_id,user_name\nu1,Alex\n', 'text/csv')
+
+        response = self.client.post(self.url, {'file': upload}, format='multipart')
+
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(self.member_ids(), ['u1'])
+
+    def test_nothing_new_responds_200_without_touching_the_club(self):
+        Membership.objects.create(club=self.club, user_id='u1', user_name='Alex')
+        before = Club.objects.values_list('updated_at', 'member_count').get(pk=self.club.pk)
+
+        response = self.client.post(self.url, [{'user_id': 'u1', 'user_name': 'Alex'}], format='json')
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data, {'created': 0, 'skipped': 1})
+        self.assertEqual(Club.objects.values_list('updated_at', 'member_count').get(pk=self.club.pk), before)
+        self.assertFalse(OutboxEvent.objects.filter(event_type='members_added').exists())
+
+    def test_rejects_more_than_max_rows(self):
+        rows = [{'user_id': f'u{index}', 'user_name': 'Student'}
+                for index in range(ClubMemberBulkImportView.max_rows + 1)]
+
+        response = self.client.post(self.url, rows, format='json')
+
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(self.member_ids(), [])
+
+    def test_malformed_csv_and_invalid_rows_are_rejected(self):
+        for body in ('', 'user_id,user_name\n"u1,Alex\n'):
+            with self.subTest(body=body):
+                response = self.client.post(self.url, body, content_type='text/csv')
+                self.assertEqual(response.status_code, 400)
+
+        undecodable = SimpleUploadedFile('members.csv', b'user_id,user_name\nu1,\xff\xfe\n', 'text/csv')
+        response = self.client.post(self.url, {'file': undecodable}, format='multipart')
+        self.assertEqual(response.status_code, 400)
+
+        response = self.client.post(self.url, 'user_id,user_name\nu1,\n', content_type='text/csv')
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(self.member_ids(), [])
+
+    def test_missing_club_returns_404(self):
+        response = self.client.post(
+            f'/clubs/{uuid.uuid4()}/members/bulk/', [{'user_id': 'u1', 'user_name': 'Alex'}], format='json',
+        )
+
+        self.assertEqual(response.status_code, 404)
@@ -0,0 +1,54 @@
+"""Tests for streaming club member exports."""
+
+import csv
+import io
+import json
+import uuid
+
+from rest_framework.test import APITestCase
+
+from clubs.models import Club, Membership
+
+
+class ClubMemberExportTests(APITestCase):
+
+    def setUp(self):
+        self.club = Club.objects.create(name='Chess', status='active')
+        self.alex = Membership.objects.create(club=self.club, user_id='u1', user_name='Alex', role='officer')
+        self.jamie = Membership.objects.create(club=self.club, user_id='u2', user_name='Jamie, "JJ"')
+        other = Club.objects.create(name='Go', status='active')
+        Membership.objects.create(club=other, user_id='u3', user_name='Sam')
+
+    def export(self, club_id=None, **params):
+        response = self.client.get(f'/clubs/{club_id or self.club.pk}/members/export/', params)
+        body = b''.join(response.streaming_content).decode('utf-8') if response.streaming else response.content
+        return response, body
+
+    def test_missing_club_returns_404(self):
+        response, _ = self.export(club_id=uuid.uuid4())
+
+        self.assertEqual(response.status_code, 404)
+
+    def test_ndjson_streams_the_club_members_in_join_order(self):
+        response, body = self.export()
+
+        self.assertEqual(response['Content-Type'], 'application/x-ndjson')
+        rows = [json.loads(line) for line in body.splitlines()]
+        self.assertEqual([row['user_id'] for row in rows], ['u1', 'u2'])
+        self.assertEqual(rows[0]['id'], self.alex.id)
+        self.assertEqual(rows[0]['role'], 'officer')
+
+    def test_csv_header_and_column_order(self):
+        response, body = self.export(format='csv')
+
+        self.assertEqual(response.status_code, 200)
+        self.assertIn(f'filename="club-{self.club.pk}-members.csv"', response['Content-Disposition'])
+        header, *rows = list(csv.reader(io.StringIO(body)))
+        self.assertEqual(header, ['id', 'user_id', 'user_name', 'role', 'join_date'])
+        self.assertEqual(rows[1][:4], [str(self.jamie.id), 'u2', 'Jamie, "JJ"', 'member'])
+        self.assertEqual(rows[1][4], self.jamie.join_date.isoformat())
+
+    def test_unknown_format_is_rejected(self):
+        response, _ = self.export(format='xml')
+
+        self.assertEqual(response.status_code, 400)
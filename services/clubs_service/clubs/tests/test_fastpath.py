@@ -0,0 +1,37 @@
+"""Parity tests for the values-based club list against ModelSerializer output."""
+
+from django.test import override_settings
+from rest_framework.renderers import JSONRenderer
+from rest_framework.test import APITestCase
+
+from clubs.fastpath import FastJSONRenderer, ValuesSerializer
+from clubs.models import Club
+from clubs.serializers import ClubSerializer
+
+
+@override_settings(CACHES={'default': {'BACKEND': 'django.core.cache.backends.dummy.DummyCache'}})
+class ClubListParityTests(APITestCase):
+
+    def setUp(self):
+        Club.objects.create(name='Chess', description='', status='active', member_count=12)
+        Club.objects.create(name='Zoë \u2028 Ünal', description='Says "hi"\nand\x01 </script> 🎲', status='active')
+        Club.objects.create(name='Go', status='pending_approval', member_count=2 ** 40)
+
+    def test_values_and_fast_renderer_match_model_serializer_bytes(self):
+        queryset = Club.objects.order_by('-created_at')
+        list_serializer = ValuesSerializer(ClubSerializer)
+
+        fast = FastJSONRenderer().render(list_serializer.to_representation(list_serializer.values(queryset)))
+
+        self.assertEqual(fast, JSONRenderer().render(ClubSerializer(queryset, many=True).data))
+
+    def test_list_response_is_byte_identical(self):
+        response = self.client.get('/clubs/', {'status': 'all', 'page_size': 2})
+
+        expected = {
+            'next': response.data['next'],
+            'previous': None,
+            'results': ClubSerializer(Club.objects.order_by('-created_at')[:2], many=True).data,
+        }
+        self.assertIsNotNone(response.data['next'])
+        self.assertEqual(response.content, JSONRenderer().render(expected))
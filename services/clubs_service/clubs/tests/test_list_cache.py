@@ -0,0 +1,117 @@
+"""Caching and conditional GET of the club list endpoint."""
+
+import shutil
+import tempfile
+from unittest import mock
+
+from django.test import override_settings
+from rest_framework.test import APITestCase
+
+from clubs import cache as list_cache
+from clubs.models import Club, Membership
+from clubs.views import ClubListCreateView
+
+
+class ClubListCacheTests(APITestCase):
+
+    def setUp(self):
+        location = tempfile.mkdtemp(prefix='clubs-cache-test-')
+        self.addCleanup(shutil.rmtree, location, ignore_errors=True)
+        shared_cache = override_settings(CACHES={'default': {
+            'BACKEND': 'django.core.cache.backends.filebased.FileBasedCache',
+            'LOCATION': location,
+        }})
+        shared_cache.enable()
+        self.addCleanup(shared_cache.disable)
+        self.club = Club.objects.create(name='Chess', status='active')
+
+    def names(self, response):
+        return [club['name'] for club in response.json()['results']]
+
+    def test_second_request_is_served_from_cache(self):
+        first = self.client.get('/clubs/')
+
+        with self.assertNumQueries(0):
+            second = self.client.get('/clubs/')
+
+        self.assertEqual(second.status_code, 200)
+        self.assertEqual(second.content, first.content)
+        self.assertEqual(second['ETag'], first['ETag'])
+
+    def test_cache_is_keyed_on_the_full_url(self):
+        self.client.get('/clubs/')
+
+        with self.assertNumQueries(1):
+            self.client.get('/clubs/', {'status': 'all'})
+
+    def test_matching_if_none_match_returns_304(self):
+        etag = self.client.get('/clubs/')['ETag']
+
+        response = self.client.get('/clubs/', HTTP_IF_NONE_MATCH=etag)
+
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response.content, b'')
+        self.assertEqual(response['ETag'], etag)
+
+    def test_stale_if_none_match_returns_full_body(self):
+        response = self.client.get('/clubs/', HTTP_IF_NONE_MATCH='"stale"')
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(self.names(response), ['Chess'])
+
+    def test_create_invalidates_cached_pages(self):
+        etag = self.client.get('/clubs/', {'status': 'all'})['ETag']
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.client.post('/clubs/', {'name': 'Go', 'description': ''}, format='json')
+        response = self.client.get('/clubs/', {'status': 'all'}, HTTP_IF_NONE_MATCH=etag)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(sorted(self.names(response)), ['Chess', 'Go'])
+
+    def test_approve_invalidates_cached_pages(self):
+        pending = Club.objects.create(name='Go', status='pending_approval')
+        self.client.get('/clubs/')
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.client.post(f'/clubs/{pending.pk}/approve/')
+
+        self.assertEqual(sorted(self.names(self.client.get('/clubs/'))), ['Chess', 'Go'])
+
+    def test_member_add_invalidates_cached_pages(self):
+        self.client.get('/clubs/')
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.client.post(
+                f'/clubs/{self.club.pk}/members/', {'user_id': 'u1', 'user_name': 'Alex'}, format='json',
+            )
+
+        self.assertEqual(self.client.get('/clubs/').json()['results'][0]['memberCount'], 1)
+
+    def test_page_computed_before_an_invalidation_is_not_reused(self):
+        compute = ClubListCreateView.get_list_data
+
+        def compute_then_invalidate(view, request):
+            data = compute(view, request)
+            # A write commits after this page was read but before it is stored.
+            Membership.objects.create(club=self.club, user_id='u1', user_name='Alex')
+            list_cache._bump_generation()
+            return data
+
+        with mock.patch.object(ClubListCreateView, 'get_list_data', compute_then_invalidate):
+            stale = self.client.get('/clubs/')
+        fresh = self.client.get('/clubs/')
+
+        self.assertEqual(stale.json()['results'][0]['memberCount'], 0)
+        self.assertEqual(fresh.json()['results'][0]['memberCount'], 1)
+        self.assertNotEqual(fresh['ETag'], stale['ETag'])
+
+    @override_settings(CACHES={'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'}})
+    def test_per_process_cache_disables_list_caching(self):
+        self.assertFalse(list_cache.list_cache_enabled())
+        etag = self.client.get('/clubs/')['ETag']
+
+        with self.assertNumQueries(1):
+            response = self.client.get('/clubs/', HTTP_IF_NONE_MATCH=etag)
+
+        self.assertEqual(response.status_code, 304)
@@ -7,5 +7,7 @@ urlpatterns = [
     path('clubs/', views.ClubListCreateView.as_view(), name='club-list'),
     path('clubs/<uuid:pk>/', views.ClubDetailView.as_view(), name='club-detail'),
     path('clubs/<uuid:club_id>/members/', views.ClubMemberListCreateView.as_view(), name='club-members'),
+    path('clubs/<uuid:club_id>/members/bulk/', views.ClubMemberBulkImportView.as_view(), name='club-members-bulk'),
+    path('clubs/<uuid:club_id>/members/export/', views.ClubMemberExportView.as_view(), name='club-members-export'),
     path('clubs/<uuid:club_id>/approve/', views.ClubApproveView.as_view(), name='club-approve'),
 ]
\ No newline at end of file
@@ -1,48 +1,46 @@
 """API views for the clubs service."""
 
 from rest_framework import generics, status
+from rest_framework.parsers import JSONParser, MultiPartParser
 from rest_framework.views import APIView
 from rest_framework.response import Response
+from rest_framework.settings import api_settings
 from django.shortcuts import get_object_or_404
 
 from .models import Club, Membership
-from django.db import IntegrityError
+from django.db import IntegrityError, models, transaction
+from django.http import JsonResponse
+from django.utils import timezone
+from django.views import View
+from .cache import (
+    compute_etag,
+    etag_matches,
+    get_cached_list,
+    invalidate_club_list,
+    list_cache_enabled,
+    list_cache_key,
+    set_cached_list,
+)
+from .conditional import conditional_detail
+from .export import export_response
+from .fastpath import FastJSONRenderer, ValuesSerializer
+from .outbox import enqueue_event
+from .pagination import ClubCursorPagination, MembershipCursorPagination
+from .parsers import CSVParser, read_csv_rows
 from .serializers import (
     ClubSerializer,
     ClubInputSerializer,
     MembershipSerializer,
 )
 
-import os
-import json
-try:
-    import pika
-except ImportError:
-    pika = None
-
-def publish_event(event_type: str, data: dict) -> None:
-    """Publish a JSON message to the RabbitMQ 'events' queue."""
-    if pika is None:
-        return
-    host = os.environ.get('RABBITMQ_HOST', 'localhost')
-    user = os.environ.get('RABBITMQ_USER', 'guest')
-    password = os.environ.get('RABBITMQ_PASS', 'guest')
-    try:
-        credentials = pika.PlainCredentials(user, password)
-        connection = pika.BlockingConnection(pika.ConnectionParameters(host=host, credentials=credentials))
-        channel = connection.channel()
-        channel.queue_declare(queue='events', durable=True)
-        message = json.dumps({'type': event_type, 'data': data})
-        channel.basic_publish(exchange='', routing_key='events', body=message)
-        connection.close()
-    except Exception:
-        pass
-
 
 class ClubListCreateView(generics.ListCreateAPIView):
     """List all clubs or create a new club."""
 
     queryset = Club.objects.all()
+    pagination_class = ClubCursorPagination
+    renderer_classes = [FastJSONRenderer, *api_settings.DEFAULT_RENDERER_CLASSES]
+    list_serializer = ValuesSerializer(ClubSerializer)
 
     def get_serializer_class(self):
         if self.request.method == 'POST':
@@ -50,23 +48,44 @@ class ClubListCreateView(generics.ListCreateAPIView):
         return ClubSerializer
 
     def list(self, request, *args, **kwargs):
+        # Pages are cached per full URL (filter, cursor, page size) and served
+        # as 304 when the client already holds the current representation.
+        key = list_cache_key(request.build_absolute_uri()) if list_cache_enabled() else None
+        cached = get_cached_list(key) if key else None
+        if cached is None:
+            data = self.get_list_data(request)
+            etag = compute_etag(data)
+            if key:
+                set_cached_list(key, etag, data)
+        else:
+            etag, data = cached
+        if etag_matches(request.headers.get('If-None-Match'), etag):
+            response = Response(status=status.HTTP_304_NOT_MODIFIED)
+        else:
+            response = Response(data)
+        response['ETag'] = etag
+        return response
+
+    def get_list_data(self, request):
         status_filter = request.query_params.get('status')
         qs = self.get_queryset()
         if not status_filter:
             qs = qs.filter(status='active')
         elif status_filter != 'all':
             qs = qs.filter(status=status_filter)
-        serializer = ClubSerializer(qs, many=True)
-        return Response(serializer.data)
+        page = self.paginate_queryset(self.list_serializer.values(qs, 'created_at'))
+        return self.get_paginated_response(self.list_serializer.to_representation(page)).data
 
     def perform_create(self, serializer: ClubInputSerializer) -> Club:
         # New clubs start in pending_approval status.
-        club = serializer.save(status='pending_approval')
-        publish_event('club_created', {
-            'id': str(club.id),
-            'name': club.name,
-            'status': club.status,
-        })
+        with transaction.atomic():
+            club = serializer.save(status='pending_approval')
+            invalidate_club_list()
+            enqueue_event('club_created', {
+                'id': str(club.id),
+                'name': club.name,
+                'status': club.status,
+            })
         return club
 
     def create(self, request, *args, **kwargs):
@@ -77,6 +96,7 @@ class ClubListCreateView(generics.ListCreateAPIView):
         return Response(output_serializer.data, status=status.HTTP_201_CREATED)
 
 
+@conditional_detail(Club)
 class ClubDetailView(generics.RetrieveAPIView):
     """Retrieve a single club by its UUID."""
 
@@ -89,15 +109,16 @@ class ClubMemberListCreateView(generics.ListCreateAPIView):
     """List members of a club or add the current user to the club."""
 
     serializer_class = MembershipSerializer
+    pagination_class = MembershipCursorPagination
 
     def get_queryset(self):
         club_id = self.kwargs.get('club_id')
         return Membership.objects.filter(club_id=club_id)
 
     def list(self, request, *args, **kwargs):
-        memberships = self.get_queryset()
-        serializer = MembershipSerializer(memberships, many=True)
-        return Response(serializer.data)
+        page = self.paginate_queryset(self.get_queryset())
+        serializer = MembershipSerializer(page, many=True)
+        return self.get_paginated_response(serializer.data)
 
     def create(self, request, *args, **kwargs):
         club_id = self.kwargs.get('club_id')
@@ -105,32 +126,127 @@ class ClubMemberListCreateView(generics.ListCreateAPIView):
         serializer = MembershipSerializer(data=request.data)
         serializer.is_valid(raise_exception=True)
         try:
-            membership = serializer.save(club=club)
+            with transaction.atomic():
+                membership = serializer.save(club=club)
+                enqueue_event('member_added', {
+                    'club_id': str(club.id),
+                    'member_id': str(membership.id),
+                    'user_id': membership.user_id,
+                    'user_name': membership.user_name,
+                    'role': membership.role,
+                })
         except IntegrityError:
             return Response(
                 {"detail": "Member already exists for this club."},
                 status=status.HTTP_400_BAD_REQUEST,
             )
-        publish_event('member_added', {
-            'club_id': str(club.id),
-            'member_id': str(membership.id),
-            'user_id': membership.user_id,
-            'user_name': membership.user_name,
-            'role': membership.role,
-        })
         return Response(serializer.data, status=status.HTTP_201_CREATED)
 
 
+class ClubMemberBulkImportView(APIView):
+    """Add many members to a club at once from a JSON array or a CSV upload.
+
+    Rows are validated together, users already in the club (or repeated in
+    the upload) are skipped, the rest are inserted with one ``bulk_create``,
+    ``member_count`` is bumped once and a single ``members_added`` event is
+    enqueued.  Responds 201 if anything was created, otherwise 200 without
+    writing to the club.  CSV input needs a ``user_id,user_name[,role]``
+    header and may be sent as a ``text/csv`` body or as the ``file`` field of
+    a multipart upload.
+    """
+
+    parser_classes = [JSONParser, CSVParser, MultiPartParser]
+    max_rows = 20_000
+
+    def get_rows(self, request):
+        if 'file' in request.FILES:
+            return read_csv_rows(request.FILES['file'])
+        return request.data
+
+    def new_members(self, club, unique_rows):
+        """Unsaved memberships for the users in ``unique_rows`` not yet in ``club``."""
+        existing = set()
+        user_ids = list(unique_rows)
+        for start in range(0, len(user_ids), 500):
+            existing.update(
+                Membership.objects.filter(club=club, user_id__in=user_ids[start:start + 500])
+                .values_list('user_id', flat=True)
+            )
+        return [
+            Membership(club=club, **row)
+            for user_id, row in unique_rows.items() if user_id not in existing
+        ]
+
+    def post(self, request, club_id: str, *args, **kwargs) -> Response:
+        rows = self.get_rows(request)
+        if not isinstance(rows, list):
+            return Response(
+                {"detail": "Expected a JSON array or CSV rows of members."},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+        if len(rows) > self.max_rows:
+            return Response(
+                {"detail": f"At most {self.max_rows} members can be imported per request."},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+        serializer = MembershipSerializer(data=rows, many=True)
+        serializer.is_valid(raise_exception=True)
+
+        club = get_object_or_404(Club, pk=club_id)
+        unique_rows = {}
+        for row in serializer.validated_data:
+            unique_rows.setdefault(row['user_id'], row)
+
+        with transaction.atomic():
+            members = self.new_members(club, unique_rows)
+            if members:
+                # Touch the club so concurrent imports into it serialize, then
+                # repeat the existing-member check under that write lock.
+                Club.objects.filter(pk=club.pk).update(updated_at=timezone.now())
+                members = self.new_members(club, unique_rows)
+            if members:
+                Membership.objects.bulk_create(members, batch_size=500, ignore_conflicts=True)
+                Club.objects.filter(pk=club.pk).update(member_count=models.F('member_count') + len(members))
+                invalidate_club_list()
+                enqueue_event('members_added', {
+                    'club_id': str(club.id),
+                    'count': len(members),
+                    'members': [
+                        {'user_id': member.user_id, 'user_name': member.user_name, 'role': member.role}
+                        for member in members
+                    ],
+                })
+
+        return Response(
+            {"created": len(members), "skipped": len(rows) - len(members)},
+            status=status.HTTP_201_CREATED if members else status.HTTP_200_OK,
+        )
+
+
 class ClubApproveView(APIView):
     """Endpoint to approve a club by setting its status to active."""
 
     def post(self, request, club_id: str, *args, **kwargs) -> Response:
         club = get_object_or_404(Club, pk=club_id)
         club.status = 'active'
-        club.save(update_fields=['status'])
-        publish_event('club_approved', {
-            'id': str(club.id),
-            'name': club.name,
-        })
+        with transaction.atomic():
+            club.save(update_fields=['status', 'updated_at'])
+            invalidate_club_list()
+            enqueue_event('club_approved', {
+                'id': str(club.id),
+                'name': club.name,
+            })
         serializer = ClubSerializer(club)
         return Response(serializer.data, status=status.HTTP_200_OK)
+
+
+class ClubMemberExportView(View):
+    """Stream a club's members as NDJSON, or CSV with ``?format=csv``."""
+
+    fields = ['id', 'user_id', 'user_name', 'role', 'join_date']
+
+    def get(self, request, club_id, *args, **kwargs):
+        if not Club.objects.filter(pk=club_id).exists():
+            return JsonResponse({"detail": "Not found."}, status=404)
+        queryset = Membership.objects.filter(club_id=club_id).order_by('join_date')
+        return export_response(queryset, self.fields, request.GET.get('format', 'ndjson'), f'club-{club_id}-members')
@@ -3,15 +3,18 @@ Django settings for clubs_service project.
 """
 
 import os
+import tempfile
 from pathlib import Path
 
+from clubs_service.database import sqlite_profile
+
 BASE_DIR = Path(__file__).resolve().parent.parent
 
 SECRET_KEY = os.environ.get('DJANGO_SECRET_KEY')
 if not SECRET_KEY:
     raise ValueError("DJANGO_SECRET_KEY environment variable is required")
 
-DEBUG = True
+DEBUG = os.environ.get('DJANGO_DEBUG', 'false').lower() in ('1', 'true', 'yes')
 
 ALLOWED_HOSTS = ['*']
 
@@ -65,6 +68,30 @@ DATABASES = {
     }
 }
 
+# PRAGMA profile applied to each SQLite connection: 'default' or 'tuned' (see database.py)
+SQLITE_PROFILE = os.environ.get('SQLITE_PROFILE', 'default')
+sqlite_profile(SQLITE_PROFILE)  # fail at startup on an unknown profile
+
+# Persistent connections, so the tuned profile's page cache and memory map
+# survive between requests and its PRAGMAs run once per connection
+if SQLITE_PROFILE == 'tuned':
+    DATABASES['default']['CONN_MAX_AGE'] = int(os.environ.get('DB_CONN_MAX_AGE', 60))
+    DATABASES['default']['CONN_HEALTH_CHECKS'] = True
+
+# Cache backend; it must be shared by every gunicorn worker for list cache
+# invalidations to reach them all.  The file cache is shared within one
+# container; point CACHE_BACKEND/CACHE_LOCATION at e.g. RedisCache to share it
+# across containers.  Per-process backends (LocMemCache) disable the list cache.
+CACHES = {
+    'default': {
+        'BACKEND': os.environ.get('CACHE_BACKEND', 'django.core.cache.backends.filebased.FileBasedCache'),
+        'LOCATION': os.environ.get('CACHE_LOCATION', os.path.join(tempfile.gettempdir(), 'clubs-cache')),
+    }
+}
+
+# Seconds a cached club list page may be served (see clubs/cache.py)
+CLUB_LIST_CACHE_TIMEOUT = int(os.environ.get('CLUB_LIST_CACHE_TIMEOUT', '60'))
+
 AUTH_PASSWORD_VALIDATORS = []
 
 LANGUAGE_CODE = 'en-us'
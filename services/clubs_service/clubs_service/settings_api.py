@@ -0,0 +1,37 @@
+"""
+API-only settings profile for clubs_service.
+
+Select it with ``DJANGO_SETTINGS_MODULE=clubs_service.settings_api``.  The
+service only serves stateless JSON, so this drops the admin, sessions,
+messages, static files and templates, keeps the two middleware a JSON API
+still benefits from, and restricts DRF to JSON rendering and parsing.
+"""
+
+from .settings import *  # noqa: F401,F403
+
+INSTALLED_APPS = [
+    'rest_framework',
+    'clubs',
+]
+
+MIDDLEWARE = [
+    'django.middleware.security.SecurityMiddleware',
+    'django.middleware.common.CommonMiddleware',
+]
+
+TEMPLATES = []
+
+USE_I18N = False
+
+REST_FRAMEWORK = {
+    'DEFAULT_RENDERER_CLASSES': [
+        'rest_framework.renderers.JSONRenderer',
+    ],
+    'DEFAULT_PARSER_CLASSES': [
+        'rest_framework.parsers.JSONParser',
+    ],
+    # No auth apps are installed: requests are anonymous and request.user is None.
+    'DEFAULT_AUTHENTICATION_CLASSES': [],
+    'DEFAULT_PERMISSION_CLASSES': [],
+    'UNAUTHENTICATED_USER': None,
+}
@@ -1,5 +1,5 @@
 from django.contrib import admin
-from .models import Event, RSVP
+from .models import Event, RSVP, OutboxEvent
 
 @admin.register(Event)
 class EventAdmin(admin.ModelAdmin):
@@ -9,4 +9,10 @@ class EventAdmin(admin.ModelAdmin):
 @admin.register(RSVP)
 class RSVPAdmin(admin.ModelAdmin):
     list_display = ("id", "event", "user_name", "rsvp_time")
-    search_fields = ("user_name",)
\ No newline at end of file
+    search_fields = ("user_name",)
+
+
+@admin.register(OutboxEvent)
+class OutboxEventAdmin(admin.ModelAdmin):
+    list_display = ("id", "event_type", "created_at")
+    list_filter = ("event_type",)
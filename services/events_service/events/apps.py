@@ -1,6 +1,12 @@
 from django.apps import AppConfig
+from django.db.backends.signals import connection_created
 
 
 class EventsConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
-    name = 'events'
\ No newline at end of file
+    name = 'events'
+
+    def ready(self):
+        from events_service.database import configure_sqlite_connection
+
+        connection_created.connect(configure_sqlite_connection, dispatch_uid='configure_sqlite_connection')
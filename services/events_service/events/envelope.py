@@ -0,0 +1,129 @@
+"""Versioned envelope and codecs for messages on the ``events`` queue.
+
+Every message body is one envelope::
+
+    {'version': 1, 'id': '<uuid>', 'type': 'club_created',
+     'occurred_at': '2026-10-17T12:00:00.000000+00:00', 'data': {...}}
+
+The body is encoded with a codec named by the AMQP ``content_type``
+property: JSON (``application/json``) or, when the optional ``msgpack``
+package is installed, MessagePack (``application/msgpack``).  Publishers
+pick a codec with ``EVENTS_MESSAGE_CODEC``, and consumers choose a decoder
+per message from its ``content_type``.  Bodies without a content type are
+JSON, and bodies without a ``version`` are the original schema-0
+``{'type': ..., 'data': ...}`` messages, so messages published before the
+envelope existed still decode.  Only switch publishers to msgpack once
+every consumer has the package installed.
+"""
+
+import json
+import os
+import uuid
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, NamedTuple, Optional
+
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
+SCHEMA_VERSION = 1
+
+JSON_CONTENT_TYPE = 'application/json'
+MSGPACK_CONTENT_TYPE = 'application/msgpack'
+MSGPACK_CONTENT_TYPES = (MSGPACK_CONTENT_TYPE, 'application/x-msgpack')
+
+
+class MessageDecodeError(ValueError):
+    """A message body could not be turned into an :class:`EventMessage`."""
+
+
+class Codec(NamedTuple):
+    name: str
+    content_type: str
+    dumps: Callable[[Any], bytes]
+    loads: Callable[[bytes], Any]
+
+
+class EventMessage(NamedTuple):
+    event_type: Optional[str]
+    data: Dict[str, Any]
+    version: int
+    event_id: Optional[str] = None
+    occurred_at: Optional[str] = None
+
+
+JSON_CODEC = Codec(
+    'json',
+    JSON_CONTENT_TYPE,
+    lambda message: json.dumps(message).encode('utf-8'),
+    json.loads,
+)
+
+CODECS = {JSON_CONTENT_TYPE: JSON_CODEC}
+if msgpack is not None:
+    MSGPACK_CODEC = Codec(
+        'msgpack',
+        MSGPACK_CONTENT_TYPE,
+        lambda message: msgpack.packb(message, use_bin_type=True),
+        lambda body: msgpack.unpackb(body, raw=False),
+    )
+    CODECS.update(dict.fromkeys(MSGPACK_CONTENT_TYPES, MSGPACK_CODEC))
+else:
+    MSGPACK_CODEC = None
+
+
+def get_codec(name: Optional[str] = None) -> Codec:
+    """Return the codec called ``name``, defaulting to ``EVENTS_MESSAGE_CODEC``."""
+    name = (name or os.environ.get('EVENTS_MESSAGE_CODEC', 'json')).lower()
+    if name == 'json':
+        return JSON_CODEC
+    if name == 'msgpack':
+        if MSGPACK_CODEC is None:
+            raise ValueError("The msgpack codec needs the 'msgpack' package")
+        return MSGPACK_CODEC
+    raise ValueError(f"Unknown message codec {name!r}")
+
+
+def build_envelope(
+    event_type: str,
+    data: Dict[str, Any],
+    event_id: Optional[str] = None,
+    occurred_at: Optional[datetime] = None,
+) -> Dict[str, Any]:
+    """Wrap ``data`` in a current-version envelope."""
+    occurred_at = occurred_at or datetime.now(timezone.utc)
+    return {
+        'version': SCHEMA_VERSION,
+        'id': event_id or str(uuid.uuid4()),
+        'type': event_type,
+        'occurred_at': occurred_at.isoformat(),
+        'data': data,
+    }
+
+
+def decode_message(body: bytes, content_type: Optional[str] = None) -> EventMessage:
+    """Decode a message body of any supported codec and schema version."""
+    media_type = (content_type or JSON_CONTENT_TYPE).split(';')[0].strip().lower()
+    codec = CODECS.get(media_type)
+    if codec is None:
+        if media_type in MSGPACK_CONTENT_TYPES:
+            raise MessageDecodeError("Cannot decode msgpack messages without the 'msgpack' package")
+        raise MessageDecodeError(f"Unsupported content type {content_type!r}")
+    try:
+        message = codec.loads(body)
+    except Exception as e:
+        raise MessageDecodeError(f"Invalid {codec.name} body: {e}") from e
+    if not isinstance(message, dict):
+        raise MessageDecodeError(f"Expected an object, got {type(message).__name__}")
+
+    version = message.get('version', 0)
+    if type(version) is not int or not 0 <= version <= SCHEMA_VERSION:
+        raise MessageDecodeError(f"Unsupported schema version {version!r}")
+    return EventMessage(
+        event_type=message.get('type'),
+        data=message.get('data', {}),
+        version=version,
+        event_id=message.get('id'),
+        occurred_at=message.get('occurred_at'),
+    )
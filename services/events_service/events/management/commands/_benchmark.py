@@ -0,0 +1,43 @@
+"""Helpers shared by the ``benchmark_*`` management commands."""
+
+import contextlib
+import os
+import shutil
+import statistics
+import tempfile
+import time
+from typing import Callable, Dict, List
+
+from django.db import connection
+from django.test.utils import setup_databases, teardown_databases
+
+
+@contextlib.contextmanager
+def benchmark_database():
+    """Run against a throwaway on-disk database, never the service's db.sqlite3."""
+    directory = tempfile.mkdtemp(prefix='benchmark-')
+    connection.settings_dict['TEST']['NAME'] = os.path.join(directory, 'benchmark.sqlite3')
+    old_config = setup_databases(verbosity=0, interactive=False)
+    try:
+        yield
+    finally:
+        teardown_databases(old_config, verbosity=0)
+        shutil.rmtree(directory, ignore_errors=True)
+
+
+def time_calls(func: Callable[[], object], repeat: int) -> List[float]:
+    """Call ``func`` ``repeat`` times and return each duration in milliseconds."""
+    samples = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func()
+        samples.append((time.perf_counter() - started) * 1000)
+    return samples
+
+
+def summarize(samples: List[float]) -> Dict[str, float]:
+    ordered = sorted(samples)
+    return {
+        'median_ms': statistics.median(ordered),
+        'p95_ms': ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))],
+    }
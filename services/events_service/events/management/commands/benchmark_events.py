@@ -0,0 +1,84 @@
+"""Time event list queries at scale with and without the start_time indexes."""
+
+import random
+import uuid
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand
+from django.db import connection
+from django.test import Client
+from django.utils import timezone
+
+from events.models import Event
+
+from ._benchmark import benchmark_database, summarize, time_calls
+
+
+class Command(BaseCommand):
+    help = 'Benchmark club/date-range event listing against a throwaway database'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--events', type=int, default=500_000)
+        parser.add_argument('--clubs', type=int, default=1_000)
+        parser.add_argument('--repeat', type=int, default=100)
+
+    def handle(self, *args, **options):
+        with benchmark_database():
+            club_ids = self.populate(options['events'], options['clubs'])
+            now = timezone.now()
+            window_from = (now + timedelta(days=30)).strftime('%Y-%m-%dT%H:%M:%SZ')
+            window_to = (now + timedelta(days=37)).strftime('%Y-%m-%dT%H:%M:%SZ')
+            club_id = club_ids[0]
+            cases = [
+                ('club upcoming', f'/events/?clubId={club_id}&upcoming=true'),
+                ('club date range', f'/events/?clubId={club_id}&from={window_from}&to={window_to}'),
+                ('all upcoming', '/events/?upcoming=true'),
+                ('all date range', f'/events/?from={window_from}&to={window_to}'),
+            ]
+
+            self.stdout.write(self.query_plan(club_id, now))
+            self.stdout.write(f"{'query':<18}{'indexes':>9}{'median ms':>12}{'p95 ms':>10}")
+            self.run_cases(cases, options['repeat'], 'yes')
+            with connection.schema_editor() as editor:
+                for index in Event._meta.indexes:
+                    editor.remove_index(Event, index)
+            self.run_cases(cases, options['repeat'], 'no')
+
+    def populate(self, total, clubs):
+        club_ids = [uuid.uuid4() for _ in range(clubs)]
+        now = timezone.now()
+        rng = random.Random(42)
+        batch = []
+        for index in range(total):
+            # Five years of history and one year of future events.
+            start = now + timedelta(minutes=rng.randint(-5 * 365 * 24 * 60, 365 * 24 * 60))
+            batch.append(Event(
+                club_id=rng.choice(club_ids),
+                name=f'Event {index}',
+                description='Benchmark event',
+                start_time=start,
+                end_time=start + timedelta(hours=2),
+                location='Student Center',
+            ))
+            if len(batch) == 5_000:
+                Event.objects.bulk_create(batch)
+                batch = []
+        Event.objects.bulk_create(batch)
+        self.stdout.write(f'Inserted {total} events across {clubs} clubs.')
+        return club_ids
+
+    def query_plan(self, club_id, now):
+        queryset = Event.objects.filter(club_id=club_id, start_time__gte=now).order_by('start_time')[:51]
+        sql, params = queryset.query.sql_with_params()
+        with connection.cursor() as cursor:
+            cursor.execute(f'EXPLAIN QUERY PLAN {sql}', params)
+            plan = '; '.join(row[-1] for row in cursor.fetchall())
+        return f'club upcoming plan: {plan}'
+
+    def run_cases(self, cases, repeat, label):
+        client = Client()
+        for name, path in cases:
+            response = client.get(path)
+            assert response.status_code == 200, (path, response.status_code)
+            stats = summarize(time_calls(lambda: client.get(path), repeat))
+            self.stdout.write(f"{name:<18}{label:>9}{stats['median_ms']:>12.2f}{stats['p95_ms']:>10.2f}")
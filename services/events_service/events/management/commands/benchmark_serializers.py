@@ -0,0 +1,93 @@
+"""Compare ModelSerializer output with the values-based list fast path."""
+
+import random
+import uuid
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand, CommandError
+from django.utils import timezone
+from rest_framework.renderers import JSONRenderer
+
+from events.fastpath import FastJSONRenderer, ValuesSerializer, orjson
+from events.models import Event, RSVP
+from events.serializers import EventSerializer, RSVPSerializer
+
+from ._benchmark import benchmark_database, summarize, time_calls
+
+
+class Command(BaseCommand):
+    help = 'Benchmark serializing and rendering event and RSVP lists in a throwaway database'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--rows', type=int, default=5_000)
+        parser.add_argument('--repeat', type=int, default=20)
+
+    def handle(self, *args, **options):
+        rows, repeat = options['rows'], options['repeat']
+        with benchmark_database():
+            event = self.populate(rows)
+            cases = [
+                ('events', EventSerializer, Event.objects.order_by('start_time')[:rows]),
+                ('rsvps', RSVPSerializer, RSVP.objects.filter(event=event).order_by('rsvp_time')[:rows]),
+            ]
+            self.stdout.write(f"orjson: {'installed' if orjson else 'not installed'}")
+            self.stdout.write(f"Median ms per list of {rows} rows.")
+            self.stdout.write(
+                f"{'list':<8}{'method':<37}{'fetch':>11}{'serialize':>11}{'render':>11}{'total':>11}{'rows/s':>11}"
+            )
+            for name, serializer_class, queryset in cases:
+                self.run_case(name, serializer_class, queryset, rows, repeat)
+
+    def populate(self, rows):
+        rng = random.Random(42)
+        now = timezone.now()
+        events = []
+        for index in range(rows):
+            start = now + timedelta(minutes=rng.randint(-30 * 24 * 60, 365 * 24 * 60))
+            events.append(Event(
+                club_id=uuid.uuid4(),
+                name=f'Event {index}',
+                description='Benchmark event with a description of typical length.',
+                start_time=start,
+                end_time=start + timedelta(hours=2),
+                location='Student Center',
+                capacity=rng.choice([None, 50, 200]),
+            ))
+        Event.objects.bulk_create(events, batch_size=5_000)
+        event = events[0]
+        RSVP.objects.bulk_create(
+            [RSVP(event=event, user_id=f'user-{index}', user_name=f'Student {index}') for index in range(rows)],
+            batch_size=5_000,
+        )
+        return event
+
+    def run_case(self, name, serializer_class, queryset, rows, repeat):
+        list_serializer = ValuesSerializer(serializer_class)
+        instances = list(queryset)
+        value_rows = list(list_serializer.values(queryset))
+        model_data = serializer_class(instances, many=True).data
+        fast_data = list_serializer.to_representation(value_rows)
+        if FastJSONRenderer().render(fast_data) != JSONRenderer().render(model_data):
+            raise CommandError(f'{name}: fast path output differs from {serializer_class.__name__}')
+
+        methods = [
+            ('ModelSerializer + JSONRenderer',
+             lambda: list(queryset.all()),
+             lambda: serializer_class(instances, many=True).data,
+             lambda: JSONRenderer().render(model_data)),
+            ('ValuesSerializer + JSONRenderer',
+             lambda: list(list_serializer.values(queryset.all())),
+             lambda: list_serializer.to_representation(value_rows),
+             lambda: JSONRenderer().render(fast_data)),
+            ('ValuesSerializer + FastJSONRenderer',
+             lambda: list(list_serializer.values(queryset.all())),
+             lambda: list_serializer.to_representation(value_rows),
+             lambda: FastJSONRenderer().render(fast_data)),
+        ]
+        for label, fetch, serialize, render in methods:
+            stages = [summarize(time_calls(stage, repeat))['median_ms'] for stage in (fetch, serialize, render)]
+            total = sum(stages)
+            self.stdout.write(
+                f"{name:<8}{label:<37}" + ''.join(f'{stage:>11.1f}' for stage in stages)
+                + f"{total:>11.1f}{rows / total * 1000:>11.0f}"
+            )
@@ -0,0 +1,41 @@
+"""Django management command to load sample data once."""
+
+import json
+import os
+
+from django.apps import apps
+from django.core.management import call_command
+from django.core.management.base import BaseCommand, CommandError
+
+
+class Command(BaseCommand):
+    help = 'Load a seed fixture unless the models it covers already hold data'
+
+    def add_arguments(self, parser):
+        parser.add_argument('fixture', nargs='?', default='seed_data.json',
+                            help='Path to the fixture file')
+        parser.add_argument('--force', action='store_true',
+                            help='Load the fixture even if data already exists')
+
+    def handle(self, *args, **options):
+        path = options['fixture']
+        if not os.path.exists(path):
+            self.stdout.write(f'No seed fixture at {path}, skipping.')
+            return
+
+        try:
+            with open(path) as fixture:
+                labels = {obj['model'] for obj in json.load(fixture)}
+        except (ValueError, KeyError, TypeError) as e:
+            raise CommandError(f'Could not read seed fixture {path}: {e}')
+
+        if not options['force']:
+            populated = sorted(
+                label for label in labels if apps.get_model(label)._default_manager.exists()
+            )
+            if populated:
+                self.stdout.write(f'Seed data skipped, already populated: {", ".join(populated)}')
+                return
+
+        call_command('loaddata', path, verbosity=0)
+        self.stdout.write(self.style.SUCCESS(f'Loaded seed data from {path}'))
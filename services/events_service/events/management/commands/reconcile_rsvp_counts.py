@@ -0,0 +1,49 @@
+"""Django management command to repair drifted Event.rsvp_count values."""
+
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.db.models import Count, F, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+from django.utils import timezone
+
+from events.models import Event, RSVP
+
+
+def actual_rsvp_count():
+    """Expression counting the RSVP rows of the outer event."""
+    counts = (
+        RSVP.objects.filter(event=OuterRef('pk')).order_by()
+        .values('event').annotate(total=Count('pk')).values('total')
+    )
+    return Coalesce(Subquery(counts), 0)
+
+
+class Command(BaseCommand):
+    help = 'Recount RSVPs per event and fix any stored rsvp_count that has drifted'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--dry-run', action='store_true',
+                            help='Report drifted events without updating them')
+
+    def handle(self, *args, **options):
+        with transaction.atomic():
+            drifted = list(
+                Event.objects.annotate(actual=actual_rsvp_count())
+                .exclude(rsvp_count=F('actual'))
+                .values_list('pk', 'rsvp_count', 'actual')
+            )
+            for event_id, stored, actual in drifted:
+                self.stdout.write(f'Event {event_id}: stored {stored}, actual {actual}')
+            if not options['dry_run']:
+                event_ids = [event_id for event_id, _, _ in drifted]
+                # Chunk to stay under SQLite's bound-parameter limit.
+                for start in range(0, len(event_ids), 500):
+                    Event.objects.filter(pk__in=event_ids[start:start + 500]).update(
+                        rsvp_count=actual_rsvp_count(),
+                        updated_at=timezone.now(),
+                    )
+
+        if options['dry_run']:
+            self.stdout.write(f'{len(drifted)} event(s) have drifted RSVP counts.')
+        else:
+            self.stdout.write(self.style.SUCCESS(f'Reconciled {len(drifted)} event(s).'))
@@ -0,0 +1,36 @@
+# Generated by Django 4.2.30 on 2026-10-17 17:45
+
+from django.db import migrations, models
+from django.db.models import Count, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+
+
+def backfill_rsvp_counts(apps, schema_editor):
+    Event = apps.get_model('events', 'Event')
+    RSVP = apps.get_model('events', 'RSVP')
+    counts = (
+        RSVP.objects.filter(event=OuterRef('pk')).order_by()
+        .values('event').annotate(total=Count('pk')).values('total')
+    )
+    Event.objects.update(rsvp_count=Coalesce(Subquery(counts), 0))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('events', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='event',
+            name='capacity',
+            field=models.PositiveIntegerField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='event',
+            name='rsvp_count',
+            field=models.IntegerField(default=0),
+        ),
+        migrations.RunPython(backfill_rsvp_counts, migrations.RunPython.noop),
+    ]
@@ -1,5 +1,10 @@
 import uuid
-from django.db import models
+from django.db import models, transaction
+from django.utils import timezone
+
+
+class EventFull(Exception):
+    """Raised when an RSVP would exceed the event's capacity."""
 
 
 class Event(models.Model):
@@ -11,11 +16,20 @@ class Event(models.Model):
     start_time = models.DateTimeField()
     end_time = models.DateTimeField()
     location = models.CharField(max_length=200)
+    # Maximum number of RSVPs; null means unlimited.
+    capacity = models.PositiveIntegerField(null=True, blank=True)
+    # Denormalized RSVP total maintained by RSVP.save/delete; repaired by the
+    # reconcile_rsvp_counts command if it ever drifts.
+    rsvp_count = models.IntegerField(default=0)
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
     class Meta:
         ordering = ['start_time']
+        indexes = [
+            models.Index(fields=['club_id', 'start_time']),
+            models.Index(fields=['start_time']),
+        ]
 
     def __str__(self) -> str:
         return self.name
@@ -32,6 +46,45 @@ class RSVP(models.Model):
     class Meta:
         unique_together = ('event', 'user_id')
         ordering = ['rsvp_time']
+        indexes = [
+            models.Index(fields=['event', 'rsvp_time']),
+        ]
+
+    def save(self, *args, **kwargs) -> None:
+        creating = self.pk is None
+        with transaction.atomic():
+            if creating:
+                # Claim a seat with a conditional update so concurrent RSVPs
+                # can never push the count past capacity.
+                claimed = Event.objects.filter(
+                    models.Q(capacity__isnull=True) | models.Q(rsvp_count__lt=models.F('capacity')),
+                    pk=self.event_id,
+                ).update(rsvp_count=models.F('rsvp_count') + 1, updated_at=timezone.now())
+                if not claimed:
+                    raise EventFull(f"Event {self.event_id} is at capacity")
+            super().save(*args, **kwargs)
+
+    def delete(self, *args, **kwargs):
+        with transaction.atomic():
+            Event.objects.filter(pk=self.event_id, rsvp_count__gt=0).update(
+                rsvp_count=models.F('rsvp_count') - 1,
+                updated_at=timezone.now(),
+            )
+            return super().delete(*args, **kwargs)
+
+    def __str__(self) -> str:
+        return f"{self.user_name} RSVP'd"
+
+class OutboxEvent(models.Model):
+    """A domain event waiting to be relayed to the RabbitMQ 'events' queue.
+
+    Rows are written in the same transaction as the domain change and removed
+    by the ``relay_outbox`` command once the broker has confirmed them.
+    """
+    id = models.BigAutoField(primary_key=True)
+    event_type = models.CharField(max_length=50)
+    payload = models.JSONField()
+    created_at = models.DateTimeField(auto_now_add=True)
 
     def __str__(self) -> str:
-        return f"{self.user_name} RSVP'd"
\ No newline at end of file
+        return f"{self.event_type} #{self.pk}"
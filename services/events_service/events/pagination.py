@@ -0,0 +1,19 @@
+"""Cursor (keyset) pagination for the events service list endpoints."""
+
+from rest_framework.pagination import CursorPagination
+
+
+class KeysetPagination(CursorPagination):
+    """Pages by position in an indexed ordering instead of OFFSET plus COUNT."""
+
+    page_size = 50
+    page_size_query_param = 'page_size'
+    max_page_size = 500
+
+
+class EventCursorPagination(KeysetPagination):
+    ordering = 'start_time'
+
+
+class RSVPCursorPagination(KeysetPagination):
+    ordering = 'rsvp_time'
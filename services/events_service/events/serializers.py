@@ -7,6 +7,7 @@ from .models import Event, RSVP
 class EventSerializer(serializers.ModelSerializer):
     startTime = serializers.DateTimeField(source='start_time')
     endTime = serializers.DateTimeField(source='end_time')
+    rsvpCount = serializers.IntegerField(source='rsvp_count', read_only=True)
 
     class Meta:
         model = Event
@@ -18,6 +19,8 @@ class EventSerializer(serializers.ModelSerializer):
             'startTime',
             'endTime',
             'location',
+            'capacity',
+            'rsvpCount',
         ]
 
 
@@ -34,6 +37,7 @@ class EventInputSerializer(serializers.ModelSerializer):
             'startTime',
             'endTime',
             'location',
+            'capacity',
         ]
 
 
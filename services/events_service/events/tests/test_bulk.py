@@ -0,0 +1,139 @@
+"""Tests for the bulk event and bulk RSVP endpoints."""
+
+import uuid
+from datetime import timedelta
+
+from django.utils import timezone
+from rest_framework.test import APITestCase
+
+from events.models import Event, OutboxEvent, RSVP
+from events.views import EventBulkCreateView, EventRSVPBulkCreateView
+
+from .test_rsvps import make_event
+
+
+def rsvp_items(*user_ids):
+    return [{'user_id': user_id, 'user_name': user_id.title()} for user_id in user_ids]
+
+
+class EventRSVPBulkCreateTests(APITestCase):
+
+    def post(self, event_id, items):
+        return self.client.post(f'/events/{event_id}/rsvps/bulk/', items, format='json')
+
+    def test_creates_rsvps_and_bumps_count_once(self):
+        event = make_event()
+
+        response = self.post(event.pk, rsvp_items('alex', 'jamie', 'sam'))
+
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual([rsvp['user_id'] for rsvp in response.data['created']], ['alex', 'jamie', 'sam'])
+        self.assertEqual(response.data['errors'], [])
+        event.refresh_from_db()
+        self.assertEqual(event.rsvp_count, 3)
+        message = OutboxEvent.objects.get(event_type='rsvps_created')
+        self.assertEqual(message.payload['count'], 3)
+
+    def test_existing_and_repeated_users_are_reported_by_index(self):
+        event = make_event()
+        RSVP.objects.create(event=event, user_id='alex', user_name='Alex')
+
+        response = self.post(event.pk, rsvp_items('alex', 'jamie', 'jamie'))
+
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual([rsvp['user_id'] for rsvp in response.data['created']], ['jamie'])
+        self.assertEqual(
+            [(error['index'], error['user_id']) for error in response.data['errors']],
+            [(0, 'alex'), (2, 'jamie')],
+        )
+        event.refresh_from_db()
+        self.assertEqual(event.rsvp_count, 2)
+
+    def test_items_past_capacity_are_rejected(self):
+        event = make_event(capacity=3)
+        RSVP.objects.create(event=event, user_id='alex', user_name='Alex')
+
+        response = self.post(event.pk, rsvp_items('jamie', 'sam', 'kai', 'lee'))
+
+        self.assertEqual([rsvp['user_id'] for rsvp in response.data['created']], ['jamie', 'sam'])
+        self.assertEqual(
+            response.data['errors'],
+            [
+                {'index': 2, 'user_id': 'kai', 'detail': 'Event is at capacity.'},
+                {'index': 3, 'user_id': 'lee', 'detail': 'Event is at capacity.'},
+            ],
+        )
+        event.refresh_from_db()
+        self.assertEqual(event.rsvp_count, 3)
+
+    def test_nothing_created_responds_200(self):
+        event = make_event(capacity=1)
+        RSVP.objects.create(event=event, user_id='alex', user_name='Alex')
+
+        response = self.post(event.pk, rsvp_items('alex', 'jamie'))
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data['created'], [])
+        self.assertEqual(len(response.data['errors']), 2)
+        self.assertFalse(OutboxEvent.objects.filter(event_type='rsvps_created').exists())
+
+    def test_rejects_batches_over_the_cap(self):
+        event = make_event()
+        items = rsvp_items(*(f'user-{index}' for index in range(EventRSVPBulkCreateView.max_items + 1)))
+
+        response = self.post(event.pk, items)
+
+        self.assertEqual(response.status_code, 400)
+        self.assertFalse(RSVP.objects.exists())
+
+    def test_malformed_batch_and_missing_event(self):
+        event = make_event()
+
+        self.assertEqual(self.post(event.pk, {'user_id': 'alex'}).status_code, 400)
+        self.assertEqual(self.post(event.pk, [{'user_name': 'Alex'}]).status_code, 400)
+        self.assertEqual(self.post(uuid.uuid4(), rsvp_items('alex')).status_code, 404)
+        self.assertFalse(RSVP.objects.exists())
+
+
+class EventBulkCreateTests(APITestCase):
+
+    def item(self, name, **fields):
+        start = timezone.now() + timedelta(days=3)
+        item = {
+            'club_id': str(uuid.uuid4()),
+            'name': name,
+            'startTime': start.isoformat(),
+            'endTime': (start + timedelta(hours=1)).isoformat(),
+            'location': 'Library',
+        }
+        item.update(fields)
+        return item
+
+    def post(self, items):
+        return self.client.post('/events/bulk/', items, format='json')
+
+    def test_creates_every_event_with_one_message(self):
+        response = self.post([self.item('Kickoff'), self.item('Workshop', capacity=30)])
+
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual([event['name'] for event in response.data], ['Kickoff', 'Workshop'])
+        self.assertEqual(Event.objects.count(), 2)
+        message = OutboxEvent.objects.get(event_type='events_created')
+        self.assertEqual(message.payload['count'], 2)
+
+    def test_invalid_item_rejects_the_whole_batch(self):
+        response = self.post([self.item('Kickoff'), self.item('Broken', startTime='not a date')])
+
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response.data[0], {})
+        self.assertIn('startTime', response.data[1])
+        self.assertFalse(Event.objects.exists())
+        self.assertFalse(OutboxEvent.objects.exists())
+
+    def test_rejects_non_arrays_and_batches_over_the_cap(self):
+        self.assertEqual(self.post(self.item('Kickoff')).status_code, 400)
+
+        response = self.post([self.item(f'Event {index}') for index in range(EventBulkCreateView.max_items + 1)])
+
+        self.assertEqual(response.status_code, 400)
+        self.assertFalse(Event.objects.exists())
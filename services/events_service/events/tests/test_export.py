@@ -0,0 +1,52 @@
+"""Tests for streaming event RSVP exports."""
+
+import csv
+import io
+import json
+import uuid
+
+from rest_framework.test import APITestCase
+
+from events.models import RSVP
+
+from .test_rsvps import make_event
+
+
+class EventRSVPExportTests(APITestCase):
+
+    def setUp(self):
+        self.event = make_event()
+        self.alex = RSVP.objects.create(event=self.event, user_id='u1', user_name='Alex')
+        self.jamie = RSVP.objects.create(event=self.event, user_id='u2', user_name='Jamie')
+        RSVP.objects.create(event=make_event(), user_id='u3', user_name='Sam')
+
+    def export(self, event_id=None, **params):
+        response = self.client.get(f'/events/{event_id or self.event.pk}/rsvps/export/', params)
+        body = b''.join(response.streaming_content).decode('utf-8') if response.streaming else response.content
+        return response, body
+
+    def test_missing_event_returns_404(self):
+        response, _ = self.export(event_id=uuid.uuid4())
+
+        self.assertEqual(response.status_code, 404)
+
+    def test_ndjson_uses_the_rsvp_time_alias(self):
+        response, body = self.export()
+
+        self.assertEqual(response['Content-Type'], 'application/x-ndjson')
+        rows = [json.loads(line) for line in body.splitlines()]
+        self.assertEqual([row['user_id'] for row in rows], ['u1', 'u2'])
+        self.assertEqual(set(rows[0]), {'id', 'user_id', 'user_name', 'rsvpTime'})
+        self.assertNotIn('rsvp_time', rows[0])
+
+    def test_csv_header_and_column_order(self):
+        response, body = self.export(format='csv')
+
+        self.assertEqual(response.status_code, 200)
+        self.assertIn(f'filename="event-{self.event.pk}-rsvps.csv"', response['Content-Disposition'])
+        header, *rows = list(csv.reader(io.StringIO(body)))
+        self.assertEqual(header, ['id', 'user_id', 'user_name', 'rsvpTime'])
+        self.assertEqual(rows, [
+            [str(self.alex.id), 'u1', 'Alex', self.alex.rsvp_time.isoformat()],
+            [str(self.jamie.id), 'u2', 'Jamie', self.jamie.rsvp_time.isoformat()],
+        ])
@@ -0,0 +1,60 @@
+"""Parity tests for the values-based event and RSVP lists against ModelSerializer output."""
+
+from datetime import datetime, timedelta, timezone
+
+from rest_framework.renderers import JSONRenderer
+from rest_framework.test import APITestCase
+
+from events.fastpath import FastJSONRenderer, ValuesSerializer
+from events.models import Event, RSVP
+from events.serializers import EventSerializer, RSVPSerializer
+
+from .test_rsvps import make_event
+
+
+class EventListParityTests(APITestCase):
+
+    def setUp(self):
+        start = datetime(2031, 3, 1, 18, 30, 15, 123456, tzinfo=timezone.utc)
+        self.event = make_event(name='Zoë \u2029 night', description='Bring "snacks"\n🎲', start_time=start,
+                                end_time=start + timedelta(hours=3), capacity=None)
+        make_event(name='Kickoff', start_time=start + timedelta(days=1),
+                   end_time=start + timedelta(days=1, seconds=1), capacity=40)
+        make_event(name='Workshop', start_time=start + timedelta(days=2),
+                   end_time=start + timedelta(days=2, hours=1), capacity=0)
+        RSVP.objects.create(event=self.event, user_id='u1', user_name='Alex')
+        RSVP.objects.create(event=self.event, user_id='u2', user_name='Ünal \u2028 "JJ"')
+
+    def assertSameBytes(self, serializer_class, queryset):
+        list_serializer = ValuesSerializer(serializer_class)
+
+        fast = FastJSONRenderer().render(list_serializer.to_representation(list_serializer.values(queryset)))
+
+        self.assertEqual(fast, JSONRenderer().render(serializer_class(queryset, many=True).data))
+
+    def test_event_values_match_model_serializer_bytes(self):
+        self.assertSameBytes(EventSerializer, Event.objects.order_by('start_time'))
+
+    def test_rsvp_values_match_model_serializer_bytes(self):
+        self.assertSameBytes(RSVPSerializer, RSVP.objects.filter(event=self.event).order_by('rsvp_time'))
+
+    def test_event_list_response_is_byte_identical(self):
+        response = self.client.get('/events/', {'page_size': 2})
+
+        expected = {
+            'next': response.data['next'],
+            'previous': None,
+            'results': EventSerializer(Event.objects.order_by('start_time')[:2], many=True).data,
+        }
+        self.assertIsNotNone(response.data['next'])
+        self.assertEqual(response.content, JSONRenderer().render(expected))
+
+    def test_rsvp_list_response_is_byte_identical(self):
+        response = self.client.get(f'/events/{self.event.pk}/rsvps/')
+
+        expected = {
+            'next': None,
+            'previous': None,
+            'results': RSVPSerializer(RSVP.objects.filter(event=self.event).order_by('rsvp_time'), many=True).data,
+        }
+        self.assertEqual(response.content, JSONRenderer().render(expected))
@@ -0,0 +1,143 @@
+"""RSVP capacity claims and the denormalized Event.rsvp_count."""
+
+import importlib
+import io
+import uuid
+from datetime import timedelta
+
+from django.apps import apps
+from django.core.management import call_command
+from django.db import IntegrityError, transaction
+from django.test import TestCase
+from django.utils import timezone
+from rest_framework.test import APITestCase
+
+from events.models import Event, EventFull, RSVP
+
+
+def make_event(**fields):
+    start = timezone.now() + timedelta(days=7)
+    defaults = {
+        'club_id': uuid.uuid4(),
+        'name': 'Hackathon',
+        'start_time': start,
+        'end_time': start + timedelta(hours=2),
+        'location': 'Student Center',
+    }
+    defaults.update(fields)
+    return Event.objects.create(**defaults)
+
+
+class RSVPCapacityTests(APITestCase):
+
+    def rsvp(self, event, user_id):
+        return self.client.post(
+            f'/events/{event.pk}/rsvps/', {'user_id': user_id, 'user_name': user_id.title()}, format='json',
+        )
+
+    def test_full_event_returns_409_without_counting(self):
+        event = make_event(capacity=1)
+        self.assertEqual(self.rsvp(event, 'alex').status_code, 201)
+
+        response = self.rsvp(event, 'jamie')
+
+        self.assertEqual(response.status_code, 409)
+        event.refresh_from_db()
+        self.assertEqual(event.rsvp_count, 1)
+        self.assertEqual(RSVP.objects.filter(event=event).count(), 1)
+
+    def test_unlimited_capacity_accepts_every_rsvp(self):
+        event = make_event(capacity=None)
+
+        statuses = [self.rsvp(event, f'user-{index}').status_code for index in range(5)]
+
+        self.assertEqual(statuses, [201] * 5)
+        event.refresh_from_db()
+        self.assertEqual(event.rsvp_count, 5)
+
+    def test_duplicate_rsvp_rolls_back_the_claimed_seat(self):
+        event = make_event(capacity=2)
+        self.rsvp(event, 'alex')
+
+        response = self.rsvp(event, 'alex')
+
+        self.assertEqual(response.status_code, 400)
+        event.refresh_from_db()
+        self.assertEqual(event.rsvp_count, 1)
+        self.assertEqual(self.rsvp(event, 'jamie').status_code, 201)
+
+    def test_count_and_rsvp_list_are_reported(self):
+        event = make_event(capacity=3)
+        self.rsvp(event, 'alex')
+
+        response = self.client.get(f'/events/{event.pk}/')
+
+        self.assertEqual(response.json()['rsvpCount'], 1)
+        self.assertEqual(response.json()['capacity'], 3)
+
+
+class RSVPModelTests(TestCase):
+
+    def test_save_raises_event_full_at_capacity(self):
+        event = make_event(capacity=1)
+        RSVP.objects.create(event=event, user_id='alex', user_name='Alex')
+
+        with self.assertRaises(EventFull):
+            RSVP.objects.create(event=event, user_id='jamie', user_name='Jamie')
+
+    def test_integrity_error_leaves_count_unchanged(self):
+        event = make_event()
+        RSVP.objects.create(event=event, user_id='alex', user_name='Alex')
+
+        with self.assertRaises(IntegrityError), transaction.atomic():
+            RSVP.objects.create(event=event, user_id='alex', user_name='Alex')
+
+        event.refresh_from_db()
+        self.assertEqual(event.rsvp_count, 1)
+
+    def test_delete_releases_the_seat(self):
+        event = make_event(capacity=1)
+        rsvp = RSVP.objects.create(event=event, user_id='alex', user_name='Alex')
+
+        rsvp.delete()
+        RSVP.objects.create(event=event, user_id='jamie', user_name='Jamie')
+
+        event.refresh_from_db()
+        self.assertEqual(event.rsvp_count, 1)
+
+
+class RSVPCountRepairTests(TestCase):
+
+    def setUp(self):
+        self.event = make_event()
+        self.other = make_event()
+        RSVP.objects.create(event=self.event, user_id='alex', user_name='Alex')
+        RSVP.objects.create(event=self.event, user_id='jamie', user_name='Jamie')
+        # Simulate drift, e.g. rows written without going through RSVP.save.
+        Event.objects.filter(pk=self.event.pk).update(rsvp_count=7)
+        Event.objects.filter(pk=self.other.pk).update(rsvp_count=3)
+
+    def counts(self):
+        return dict(Event.objects.values_list('pk', 'rsvp_count'))
+
+    def test_reconcile_fixes_drifted_counts(self):
+        out = io.StringIO()
+        call_command('reconcile_rsvp_counts', stdout=out)
+
+        self.assertEqual(self.counts(), {self.event.pk: 2, self.other.pk: 0})
+        self.assertIn('Reconciled 2 event(s).', out.getvalue())
+
+    def test_reconcile_dry_run_only_reports(self):
+        out = io.StringIO()
+        call_command('reconcile_rsvp_counts', '--dry-run', stdout=out)
+
+        self.assertEqual(self.counts(), {self.event.pk: 7, self.other.pk: 3})
+        self.assertIn(f'Event {self.event.pk}: stored 7, actual 2', out.getvalue())
+        self.assertIn('2 event(s) have drifted RSVP counts.', out.getvalue())
+
+    def test_migration_backfill_counts_existing_rsvps(self):
+        migration = importlib.import_module('events.migrations.0002_event_capacity_rsvp_count')
+
+        migration.backfill_rsvp_counts(apps, None)
+
+        self.assertEqual(self.counts(), {self.event.pk: 2, self.other.pk: 0})
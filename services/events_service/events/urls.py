@@ -5,6 +5,9 @@ from . import views
 
 urlpatterns = [
     path('events/', views.EventListCreateView.as_view(), name='event-list'),
+    path('events/bulk/', views.EventBulkCreateView.as_view(), name='event-bulk-create'),
     path('events/<uuid:pk>/', views.EventDetailView.as_view(), name='event-detail'),
     path('events/<uuid:event_id>/rsvps/', views.EventRSVPListCreateView.as_view(), name='event-rsvps'),
+    path('events/<uuid:event_id>/rsvps/bulk/', views.EventRSVPBulkCreateView.as_view(), name='event-rsvps-bulk'),
+    path('events/<uuid:event_id>/rsvps/export/', views.EventRSVPExportView.as_view(), name='event-rsvps-export'),
 ]
\ No newline at end of file
@@ -1,67 +1,139 @@
 """API views for the events service."""
 
+from datetime import datetime, timezone as dt_timezone
+
 from rest_framework import generics, status
 from rest_framework.response import Response
+from rest_framework.settings import api_settings
+from rest_framework.views import APIView
+from django.db import IntegrityError, models, transaction
+from django.db.models import F
+from django.http import JsonResponse
 from django.shortcuts import get_object_or_404
+from django.utils import timezone
+from django.utils.dateparse import parse_date, parse_datetime
+from django.views import View
 
-from .models import Event, RSVP
+from .conditional import conditional_detail
+from .export import export_response
+from .fastpath import FastJSONRenderer, ValuesSerializer
+from .models import Event, EventFull, RSVP
+from .outbox import enqueue_event
+from .pagination import EventCursorPagination, RSVPCursorPagination
 from .serializers import EventSerializer, EventInputSerializer, RSVPSerializer
 
-import os
-import json
-try:
-    import pika
-except ImportError:
-    pika = None
-
-def publish_event(event_type: str, data: dict) -> None:
-    if pika is None:
-        return
-    host = os.environ.get('RABBITMQ_HOST', 'localhost')
-    user = os.environ.get('RABBITMQ_USER', 'guest')
-    password = os.environ.get('RABBITMQ_PASS', 'guest')
+
+def parse_time_bound(value: str):
+    """Parse an ISO 8601 datetime or date query value into an aware datetime.
+
+    Returns ``None`` when the value cannot be parsed.  Naive values and bare
+    dates are taken to be UTC, a date meaning its midnight.
+    """
     try:
-        credentials = pika.PlainCredentials(user, password)
-        connection = pika.BlockingConnection(pika.ConnectionParameters(host=host, credentials=credentials))
-        channel = connection.channel()
-        channel.queue_declare(queue='events', durable=True)
-        message = json.dumps({'type': event_type, 'data': data})
-        channel.basic_publish(exchange='', routing_key='events', body=message)
-        connection.close()
-    except Exception:
-        pass
+        parsed = parse_datetime(value)
+        if parsed is None:
+            day = parse_date(value)
+            if day is None:
+                return None
+            parsed = datetime(day.year, day.month, day.day)
+    except ValueError:
+        return None
+    if timezone.is_naive(parsed):
+        parsed = timezone.make_aware(parsed, dt_timezone.utc)
+    return parsed
 
 
 class EventListCreateView(generics.ListCreateAPIView):
 
     queryset = Event.objects.all()
+    pagination_class = EventCursorPagination
+    renderer_classes = [FastJSONRenderer, *api_settings.DEFAULT_RENDERER_CLASSES]
+    list_serializer = ValuesSerializer(EventSerializer)
 
     def get_serializer_class(self):
         return EventInputSerializer if self.request.method == 'POST' else EventSerializer
 
     def list(self, request, *args, **kwargs):
+        # ``from`` is inclusive and ``to`` exclusive on start time; ``upcoming``
+        # keeps events that have not started yet.  Every combination is served
+        # by the (club_id, start_time) or (start_time) index.
         club_id = request.query_params.get('clubId')
         events = self.get_queryset()
         if club_id:
             events = events.filter(club_id=club_id)
-        serializer = EventSerializer(events, many=True)
-        return Response(serializer.data)
+        for param, lookup in (('from', 'start_time__gte'), ('to', 'start_time__lt')):
+            value = request.query_params.get(param)
+            if not value:
+                continue
+            bound = parse_time_bound(value)
+            if bound is None:
+                return Response(
+                    {"detail": f"Invalid '{param}' value; expected an ISO 8601 date or datetime."},
+                    status=status.HTTP_400_BAD_REQUEST,
+                )
+            events = events.filter(**{lookup: bound})
+        if request.query_params.get('upcoming', '').lower() in ('1', 'true', 'yes'):
+            events = events.filter(start_time__gte=timezone.now())
+        page = self.paginate_queryset(self.list_serializer.values(events, 'start_time'))
+        return self.get_paginated_response(self.list_serializer.to_representation(page))
 
     def create(self, request, *args, **kwargs):
         serializer = EventInputSerializer(data=request.data)
         serializer.is_valid(raise_exception=True)
-        event = serializer.save()
-        publish_event('event_created', {
-            'id': str(event.id),
-            'club_id': str(event.club_id),
-            'name': event.name,
-            'start_time': event.start_time.isoformat() if hasattr(event.start_time, 'isoformat') else None,
-            'end_time': event.end_time.isoformat() if hasattr(event.end_time, 'isoformat') else None,
-        })
+        with transaction.atomic():
+            event = serializer.save()
+            enqueue_event('event_created', event_message(event))
         output = EventSerializer(event)
         return Response(output.data, status=status.HTTP_201_CREATED)
 
 
+def event_message(event: Event) -> dict:
+    """Outbox payload describing a newly created event."""
+    return {
+        'id': str(event.id),
+        'club_id': str(event.club_id),
+        'name': event.name,
+        'start_time': event.start_time.isoformat() if hasattr(event.start_time, 'isoformat') else None,
+        'end_time': event.end_time.isoformat() if hasattr(event.end_time, 'isoformat') else None,
+    }
+
+
+class EventBulkCreateView(APIView):
+    """Create many events from a JSON array in one request.
+
+    The whole batch is validated in one pass and rejected with per-item
+    errors if any item is invalid; otherwise every event is inserted with a
+    single ``bulk_create`` and one ``events_created`` message is enqueued.
+    """
+
+    max_items = 5_000
+
+    def post(self, request, *args, **kwargs) -> Response:
+        if not isinstance(request.data, list):
+            return Response(
+                {"detail": "Expected a JSON array of events."},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+        if len(request.data) > self.max_items:
+            return Response(
+                {"detail": f"At most {self.max_items} events can be created per request."},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+        serializer = EventInputSerializer(data=request.data, many=True)
+        serializer.is_valid(raise_exception=True)
+        events = [Event(**item) for item in serializer.validated_data]
+        with transaction.atomic():
+            Event.objects.bulk_create(events, batch_size=500)
+            if events:
+                enqueue_event('events_created', {
+                    'count': len(events),
+                    'events': [event_message(event) for event in events],
+                })
+        output = EventSerializer(events, many=True)
+        return Response(output.data, status=status.HTTP_201_CREATED)
+
+
+@conditional_detail(Event)
 class EventDetailView(generics.RetrieveAPIView):
 
     queryset = Event.objects.all()
@@ -72,26 +144,129 @@ class EventDetailView(generics.RetrieveAPIView):
 class EventRSVPListCreateView(generics.ListCreateAPIView):
 
     serializer_class = RSVPSerializer
+    pagination_class = RSVPCursorPagination
+    renderer_classes = [FastJSONRenderer, *api_settings.DEFAULT_RENDERER_CLASSES]
+    list_serializer = ValuesSerializer(RSVPSerializer)
 
     def get_queryset(self):
         event_id = self.kwargs.get('event_id')
         return RSVP.objects.filter(event_id=event_id)
 
     def list(self, request, *args, **kwargs):
-        rsvps = self.get_queryset()
-        serializer = RSVPSerializer(rsvps, many=True)
-        return Response(serializer.data)
+        page = self.paginate_queryset(self.list_serializer.values(self.get_queryset(), 'rsvp_time'))
+        return self.get_paginated_response(self.list_serializer.to_representation(page))
 
     def create(self, request, *args, **kwargs):
         event_id = self.kwargs.get('event_id')
         event = get_object_or_404(Event, pk=event_id)
         serializer = RSVPSerializer(data=request.data)
         serializer.is_valid(raise_exception=True)
-        rsvp = serializer.save(event=event)
-        publish_event('rsvp_created', {
-            'event_id': str(event.id),
-            'rsvp_id': str(rsvp.id),
-            'user_id': rsvp.user_id,
-            'user_name': rsvp.user_name,
-        })
-        return Response(serializer.data, status=status.HTTP_201_CREATED)
\ No newline at end of file
+        try:
+            with transaction.atomic():
+                rsvp = serializer.save(event=event)
+                enqueue_event('rsvp_created', {
+                    'event_id': str(event.id),
+                    'rsvp_id': str(rsvp.id),
+                    'user_id': rsvp.user_id,
+                    'user_name': rsvp.user_name,
+                })
+        except EventFull:
+            return Response(
+                {"detail": "Event is at capacity."},
+                status=status.HTTP_409_CONFLICT,
+            )
+        except IntegrityError:
+            return Response(
+                {"detail": "RSVP already exists for this user."},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+        return Response(serializer.data, status=status.HTTP_201_CREATED)
+
+
+class EventRSVPBulkCreateView(APIView):
+    """Record many RSVPs for one event, e.g. a check-in kiosk syncing offline.
+
+    Items are validated together and a malformed batch is rejected with
+    per-item errors.  Well-formed items that conflict, because the user
+    already RSVP'd, appears twice in the batch, or the event is full, are
+    reported under ``errors`` by index while the rest are inserted with one
+    ``bulk_create``, one ``rsvp_count`` update and one ``rsvps_created``
+    message.  Responds 201 if anything was created, otherwise 200.
+    """
+
+    max_items = 5_000
+
+    def post(self, request, event_id: str, *args, **kwargs) -> Response:
+        if not isinstance(request.data, list):
+            return Response(
+                {"detail": "Expected a JSON array of RSVPs."},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+        if len(request.data) > self.max_items:
+            return Response(
+                {"detail": f"At most {self.max_items} RSVPs can be created per request."},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+        serializer = RSVPSerializer(data=request.data, many=True)
+        serializer.is_valid(raise_exception=True)
+        event = get_object_or_404(Event, pk=event_id)
+
+        errors = []
+        with transaction.atomic():
+            # Touch the event first so concurrent RSVP writers serialize
+            # before the duplicate and capacity checks below.
+            Event.objects.filter(pk=event.pk).update(updated_at=timezone.now())
+            event.refresh_from_db(fields=['capacity', 'rsvp_count'])
+            user_ids = list({item['user_id'] for item in serializer.validated_data})
+            existing = set()
+            for start in range(0, len(user_ids), 500):
+                existing.update(
+                    RSVP.objects.filter(event=event, user_id__in=user_ids[start:start + 500])
+                    .values_list('user_id', flat=True)
+                )
+            seats = None if event.capacity is None else max(event.capacity - event.rsvp_count, 0)
+
+            rsvps = []
+            for index, item in enumerate(serializer.validated_data):
+                if item['user_id'] in existing:
+                    errors.append({'index': index, 'user_id': item['user_id'],
+                                   'detail': 'RSVP already exists for this user.'})
+                    continue
+                if seats is not None and len(rsvps) >= seats:
+                    errors.append({'index': index, 'user_id': item['user_id'],
+                                   'detail': 'Event is at capacity.'})
+                    continue
+                existing.add(item['user_id'])
+                rsvps.append(RSVP(event=event, **item))
+
+            if rsvps:
+                RSVP.objects.bulk_create(rsvps, batch_size=500)
+                Event.objects.filter(pk=event.pk).update(rsvp_count=models.F('rsvp_count') + len(rsvps))
+                enqueue_event('rsvps_created', {
+                    'event_id': str(event.id),
+                    'count': len(rsvps),
+                    'rsvps': [
+                        {'rsvp_id': str(rsvp.id), 'user_id': rsvp.user_id, 'user_name': rsvp.user_name}
+                        for rsvp in rsvps
+                    ],
+                })
+
+        return Response(
+            {"created": RSVPSerializer(rsvps, many=True).data, "errors": errors},
+            status=status.HTTP_201_CREATED if rsvps else status.HTTP_200_OK,
+        )
+
+
+class EventRSVPExportView(View):
+    """Stream an event's RSVPs as NDJSON, or CSV with ``?format=csv``."""
+
+    fields = ['id', 'user_id', 'user_name']
+
+    def get(self, request, event_id, *args, **kwargs):
+        if not Event.objects.filter(pk=event_id).exists():
+            return JsonResponse({"detail": "Not found."}, status=404)
+        queryset = RSVP.objects.filter(event_id=event_id).order_by('rsvp_time')
+        return export_response(
+            queryset, self.fields, request.GET.get('format', 'ndjson'), f'event-{event_id}-rsvps',
+            rsvpTime=F('rsvp_time'),
+        )
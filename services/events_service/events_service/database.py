@@ -0,0 +1,45 @@
+"""SQLite connection tuning for the events_service project.
+
+``SQLITE_PROFILE`` (from the environment, see settings) selects a set of
+PRAGMAs applied to every new connection through Django's
+``connection_created`` signal.  The ``tuned`` profile switches to WAL so
+readers no longer block the writer, relaxes fsyncs to WAL checkpoints and
+enlarges the page cache and memory map.  Lock waits are the sqlite backend's
+``timeout`` option (5 seconds by default), not a PRAGMA.  Settings keep
+connections open across requests under ``tuned`` (``CONN_MAX_AGE``) so the
+PRAGMAs run once per connection and the cache outlives a request.
+"""
+
+from django.conf import settings
+from django.core.exceptions import ImproperlyConfigured
+
+SQLITE_PROFILES = {
+    'default': {},
+    'tuned': {
+        'journal_mode': 'WAL',
+        'synchronous': 'NORMAL',
+        'cache_size': -65536,  # negative values are KiB, i.e. 64 MiB
+        'mmap_size': 268435456,
+        'temp_store': 'MEMORY',
+    },
+}
+
+
+def sqlite_profile(name: str) -> dict:
+    """The PRAGMAs of profile ``name``; unknown names are a configuration error."""
+    try:
+        return SQLITE_PROFILES[name]
+    except KeyError:
+        raise ImproperlyConfigured(
+            f"Unknown SQLITE_PROFILE {name!r}; expected one of: {', '.join(SQLITE_PROFILES)}"
+        ) from None
+
+
+def configure_sqlite_connection(sender, connection, **kwargs) -> None:
+    """Apply the configured PRAGMA profile to a new SQLite connection."""
+    if connection.vendor != 'sqlite':
+        return
+    pragmas = sqlite_profile(getattr(settings, 'SQLITE_PROFILE', 'default'))
+    with connection.cursor() as cursor:
+        for name, value in pragmas.items():
+            cursor.execute(f'PRAGMA {name} = {value}')
@@ -3,13 +3,15 @@
 import os
 from pathlib import Path
 
+from events_service.database import sqlite_profile
+
 BASE_DIR = Path(__file__).resolve().parent.parent
 
 SECRET_KEY = os.environ.get('DJANGO_SECRET_KEY')
 if not SECRET_KEY:
     raise ValueError("DJANGO_SECRET_KEY environment variable is required")
 
-DEBUG = True
+DEBUG = os.environ.get('DJANGO_DEBUG', 'false').lower() in ('1', 'true', 'yes')
 
 ALLOWED_HOSTS = ['*']
 
@@ -61,6 +63,16 @@ DATABASES = {
     }
 }
 
+# PRAGMA profile applied to each SQLite connection: 'default' or 'tuned' (see database.py)
+SQLITE_PROFILE = os.environ.get('SQLITE_PROFILE', 'default')
+sqlite_profile(SQLITE_PROFILE)  # fail at startup on an unknown profile
+
+# Persistent connections, so the tuned profile's page cache and memory map
+# survive between requests and its PRAGMAs run once per connection
+if SQLITE_PROFILE == 'tuned':
+    DATABASES['default']['CONN_MAX_AGE'] = int(os.environ.get('DB_CONN_MAX_AGE', 60))
+    DATABASES['default']['CONN_HEALTH_CHECKS'] = True
+
 AUTH_PASSWORD_VALIDATORS = []
 
 LANGUAGE_CODE = 'en-us'
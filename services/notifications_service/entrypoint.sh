@@ -5,17 +5,27 @@ set -e
 
 echo "Using Django settings: ${DJANGO_SETTINGS_MODULE:-notifications_service.settings}" 
 
-python manage.py makemigrations --noinput
-python manage.py migrate --noinput
+# Migrations are committed; only migrate when some are unapplied
+if ! python manage.py migrate --check >/dev/null 2>&1; then
+  python manage.py migrate --noinput
+fi
 
-# Start the Django server in the background
+# Start the Django server in the background; SERVER_MODE=development keeps
+# the single-process dev server, otherwise gunicorn sized by GUNICORN_*.
 echo "Starting Django server..."
-python manage.py runserver 0.0.0.0:8000 &
+if [ "${SERVER_MODE:-production}" = "development" ]; then
+  python manage.py runserver 0.0.0.0:8000 &
+else
+  gunicorn notifications_service.wsgi:application --config gunicorn.conf.py &
+fi
 
-# Wait for Django to start and RabbitMQ to be ready
-echo "Waiting for services to be ready..."
-sleep 10
+# Block until RabbitMQ accepts connections instead of a fixed sleep
+echo "Waiting for RabbitMQ..."
+python manage.py wait_for_broker --timeout "${BROKER_WAIT_TIMEOUT:-60}"
 
 # Start the notification consumer with retry logic
 echo "Starting notification consumer..."
-python manage.py start_consumer
+# exec so SIGTERM reaches the consumer and in-flight batches are drained
+exec python manage.py start_consumer \
+  --workers "${NOTIFICATION_CONSUMER_WORKERS:-1}" \
+  --batch-size "${NOTIFICATION_CONSUMER_BATCH_SIZE:-1}"
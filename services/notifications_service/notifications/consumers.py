@@ -1,14 +1,17 @@
 """RabbitMQ consumers for the notification service."""
 
 import os
-import json
 import logging
-import time
-from typing import Dict, Any, Optional
+import multiprocessing
+import signal
+import threading
+from typing import Dict, Any, List, Optional, Tuple
 
 import pika
 from django.conf import settings
+from django.db import connections, transaction
 
+from .envelope import MessageDecodeError, decode_message
 from .models import Notification
 
 logger = logging.getLogger(__name__)
@@ -16,14 +19,28 @@ UNKNOWN_USER = "Unknown User"
 
 
 class NotificationConsumer:
-    """Consumes messages from RabbitMQ and creates notifications."""
+    """Consumes messages from RabbitMQ and creates notifications.
+
+    With ``batch_size`` greater than one the consumer accumulates deliveries
+    and writes them with a single ``bulk_create`` once the batch is full or
+    ``batch_timeout_ms`` has elapsed since its first message, then acks the
+    whole batch with one ``multiple=True`` ack.
+    """
     
-    def __init__(self):
+    def __init__(self, batch_size: int = 1, batch_timeout_ms: int = 200,
+                 prefetch_count: Optional[int] = None):
         self.host = os.environ.get('RABBITMQ_HOST', 'localhost')
         self.user = os.environ.get('RABBITMQ_USER', 'guest')
         self.password = os.environ.get('RABBITMQ_PASS', 'guest')
         self.connection = None
         self.channel = None
+        self.batch_size = max(1, batch_size)
+        self.batch_timeout_ms = batch_timeout_ms
+        # The broker must be allowed to hand over at least a full batch.
+        self.prefetch_count = prefetch_count or self.batch_size * 2
+        self._pending: List[Tuple[int, Optional[Notification]]] = []
+        self._flush_timer = None
+        self._stop_event = threading.Event()
     
     def connect(self):
         """Establish connection to RabbitMQ."""
@@ -49,15 +66,41 @@ class NotificationConsumer:
             self.connection.close()
             logger.info("Disconnected from RabbitMQ")
     
+    def request_stop(self):
+        """Stop consuming after the in-flight batch is written and acked.
+
+        Safe to call from signal handlers and other threads.
+        """
+        self._stop_event.set()
+        connection = self.connection
+        try:
+            if connection is not None and connection.is_open:
+                connection.add_callback_threadsafe(self._stop_consuming)
+        except Exception as e:
+            logger.warning(f"Could not schedule consumer stop: {e}")
+    
+    def _stop_consuming(self):
+        if self.channel is not None and self.channel.is_open:
+            # Unacked messages still buffered by pika are nacked and requeued.
+            self.channel.stop_consuming()
+    
+    def install_signal_handlers(self):
+        """Drain gracefully on SIGTERM/SIGINT instead of dying mid-batch."""
+        def _handler(signum, frame):
+            logger.info(f"Received signal {signum}, draining consumer...")
+            self.request_stop()
+        signal.signal(signal.SIGTERM, _handler)
+        signal.signal(signal.SIGINT, _handler)
+    
     def handle_message(self, channel, method, properties, body):
         """Handle incoming message from RabbitMQ."""
         try:
-            # Parse the message
-            message = json.loads(body.decode('utf-8'))
-            event_type = message.get('type')
-            event_data = message.get('data', {})
+            # Parse the message with the codec named by its content type
+            message = decode_message(body, getattr(properties, 'content_type', None))
+            event_type = message.event_type
+            event_data = message.data
             
-            logger.info(f"Received event: {event_type} with data: {event_data}")
+            logger.info(f"Received event: {event_type} ({message.event_id or 'no id'}) with data: {event_data}")
             
             # Create notification based on event type
             notification = self.create_notification(event_type, event_data)
@@ -71,7 +114,7 @@ class NotificationConsumer:
                 # Still acknowledge to avoid reprocessing
                 channel.basic_ack(delivery_tag=method.delivery_tag)
                 
-        except json.JSONDecodeError as e:
+        except MessageDecodeError as e:
             logger.error(f"Failed to parse message: {e}")
             # Acknowledge to avoid reprocessing invalid messages
             channel.basic_ack(delivery_tag=method.delivery_tag)
@@ -80,33 +123,87 @@ class NotificationConsumer:
             # Acknowledge to avoid infinite reprocessing
             channel.basic_ack(delivery_tag=method.delivery_tag)
     
+    def handle_batched_message(self, channel, method, properties, body):
+        """Buffer an incoming message and flush once the batch is full."""
+        notification = None
+        try:
+            message = decode_message(body, getattr(properties, 'content_type', None))
+            notification = self.build_notification(message.event_type, message.data)
+        except MessageDecodeError as e:
+            logger.error(f"Failed to parse message: {e}")
+        except Exception as e:
+            logger.error(f"Error handling message: {e}")
+        
+        # Unparseable messages keep their slot so they are acked with the batch.
+        self._pending.append((method.delivery_tag, notification))
+        
+        if len(self._pending) >= self.batch_size:
+            self.flush_batch()
+        elif self._flush_timer is None and self.connection is not None:
+            self._flush_timer = self.connection.call_later(
+                self.batch_timeout_ms / 1000, self._on_flush_timer
+            )
+    
+    def _on_flush_timer(self):
+        self._flush_timer = None
+        self.flush_batch()
+    
+    def flush_batch(self):
+        """Write all buffered notifications in one transaction and ack them."""
+        if self._flush_timer is not None and self.connection is not None:
+            self.connection.remove_timeout(self._flush_timer)
+        self._flush_timer = None
+        if not self._pending:
+            return
+        
+        pending, self._pending = self._pending, []
+        notifications = [notification for _, notification in pending if notification is not None]
+        try:
+            with transaction.atomic():
+                Notification.objects.bulk_create(notifications)
+            logger.info(f"Created {len(notifications)} notifications in batch")
+        except Exception as e:
+            # Fall back to row-by-row inserts so one bad row cannot drop the batch.
+            logger.error(f"Batch insert failed, retrying individually: {e}")
+            for notification in notifications:
+                try:
+                    notification.save(force_insert=True)
+                except Exception as row_error:
+                    logger.error(f"Failed to create notification: {row_error}")
+        
+        # Acknowledge everything up to the newest delivery in one frame.
+        self.channel.basic_ack(delivery_tag=pending[-1][0], multiple=True)
+    
+    def build_notification(self, event_type: str, event_data: Dict[str, Any]) -> Notification:
+        """Build an unsaved notification based on event type and data."""
+        # Determine source service based on event type
+        source_service = self.get_source_service(event_type)
+        
+        # Generate notification content based on event type
+        subject, message = self.generate_notification_content(event_type, event_data)
+        
+        # Extract user information from event data
+        user_id = event_data.get('user_id') or ""
+        user_name = event_data.get('user_name') or UNKNOWN_USER
+        user_email = event_data.get('user_email') or ""
+        
+        return Notification(
+            event_type=event_type,
+            event_data=event_data,
+            user_id=user_id,
+            user_name=user_name,
+            user_email=user_email,
+            subject=subject,
+            message=message,
+            source_service=source_service,
+            status='pending'
+        )
+    
     def create_notification(self, event_type: str, event_data: Dict[str, Any]) -> Optional[Notification]:
         """Create a notification based on event type and data."""
         try:
-            # Determine source service based on event type
-            source_service = self.get_source_service(event_type)
-            
-            # Generate notification content based on event type
-            subject, message = self.generate_notification_content(event_type, event_data)
-            
-            # Extract user information from event data
-            user_id = event_data.get('user_id') or ""
-            user_name = event_data.get('user_name') or UNKNOWN_USER
-            user_email = event_data.get('user_email') or ""
-            
-            # Create the notification
-            notification = Notification.objects.create(
-                event_type=event_type,
-                event_data=event_data,
-                user_id=user_id,
-                user_name=user_name,
-                user_email=user_email,
-                subject=subject,
-                message=message,
-                source_service=source_service,
-                status='pending'
-            )
-            
+            notification = self.build_notification(event_type, event_data)
+            notification.save(force_insert=True)
             return notification
             
         except Exception as e:
@@ -115,9 +212,9 @@ class NotificationConsumer:
     
     def get_source_service(self, event_type: str) -> str:
         """Determine which service generated the event."""
-        if event_type in ['club_created', 'club_approved', 'member_added']:
+        if event_type in ['club_created', 'club_approved', 'member_added', 'members_added']:
             return 'clubs_service'
-        elif event_type in ['event_created', 'rsvp_created']:
+        elif event_type in ['event_created', 'events_created', 'rsvp_created', 'rsvps_created']:
             return 'events_service'
         elif event_type in ['order_created']:
             return 'payments_service'
@@ -149,6 +246,13 @@ class NotificationConsumer:
                 f"{user_name} has joined the club as a {role}."
             )
         
+        elif event_type == 'members_added':
+            count = event_data.get('count', len(event_data.get('members', [])))
+            return (
+                "New Club Members",
+                f"{count} new members have joined the club."
+            )
+        
         elif event_type == 'event_created':
             event_name = event_data.get('name', 'Unknown Event')
             return (
@@ -156,6 +260,13 @@ class NotificationConsumer:
                 f"A new event '{event_name}' has been created for your club."
             )
         
+        elif event_type == 'events_created':
+            count = event_data.get('count', len(event_data.get('events', [])))
+            return (
+                "New Events Created",
+                f"{count} new events have been scheduled."
+            )
+        
         elif event_type == 'rsvp_created':
             user_name = event_data.get('user_name', UNKNOWN_USER)
             return (
@@ -163,6 +274,13 @@ class NotificationConsumer:
                 f"{user_name} has RSVP'd for the event."
             )
         
+        elif event_type == 'rsvps_created':
+            count = event_data.get('count', len(event_data.get('rsvps', [])))
+            return (
+                "Event RSVPs",
+                f"{count} people have RSVP'd for the event."
+            )
+        
         elif event_type == 'order_created':
             order_id = event_data.get('id', 'Unknown')
             return (
@@ -179,6 +297,8 @@ class NotificationConsumer:
     def _connect_with_retries(self, max_retries: int = 5, retry_delay: int = 5) -> bool:
         """Attempt to connect to RabbitMQ with retry/backoff."""
         for attempt in range(max_retries):
+            if self._stop_event.is_set():
+                return False
             try:
                 if self.connect():
                     logger.info("Successfully connected to RabbitMQ")
@@ -188,21 +308,34 @@ class NotificationConsumer:
                 logger.error(f"Connection attempt {attempt + 1} failed: {e}")
             if attempt < max_retries - 1:
                 logger.info(f"Retrying in {retry_delay} seconds...")
-                time.sleep(retry_delay)
+                self._stop_event.wait(retry_delay)
                 retry_delay *= 2  # Exponential backoff
         return False
 
     def start_consuming(self):
         """Start consuming messages from RabbitMQ with retry logic."""
         if not self._connect_with_retries():
-            logger.error("Failed to connect to RabbitMQ after all retries. Cannot start consuming.")
+            if not self._stop_event.is_set():
+                logger.error("Failed to connect to RabbitMQ after all retries. Cannot start consuming.")
+            return
+        if self._stop_event.is_set():
+            self.disconnect()
             return
         
         try:
             # Set up the consumer
+            if self.batch_size > 1:
+                self.channel.basic_qos(prefetch_count=self.prefetch_count)
+                callback = self.handle_batched_message
+                logger.info(
+                    f"Batch mode: up to {self.batch_size} messages or "
+                    f"{self.batch_timeout_ms} ms, prefetch {self.prefetch_count}"
+                )
+            else:
+                callback = self.handle_message
             self.channel.basic_consume(
                 queue='events',
-                on_message_callback=self.handle_message,
+                on_message_callback=callback,
                 auto_ack=False  # We manually acknowledge messages
             )
             
@@ -212,16 +345,90 @@ class NotificationConsumer:
             # Start consuming
             self.channel.start_consuming()
             
+            # Consumption was stopped on request: finish the in-flight batch.
+            self.flush_batch()
+            logger.info("Consumer drained")
+            
         except KeyboardInterrupt:
             logger.info("Stopping consumer...")
             self.channel.stop_consuming()
+            self.flush_batch()
         except Exception as e:
             logger.error(f"Error while consuming: {e}")
         finally:
             self.disconnect()
 
 
-def start_notification_consumer():
+def _run_consumer_worker(worker_id: int, consumer_options: Dict[str, Any]):
+    """Entry point of a forked consumer process."""
+    # Each worker needs its own database connection as well as its own channel.
+    connections.close_all()
+    consumer = NotificationConsumer(**consumer_options)
+    consumer.install_signal_handlers()
+    logger.info(f"Consumer worker {worker_id} started (pid {os.getpid()})")
+    consumer.start_consuming()
+
+
+def run_consumer_pool(workers: int, **consumer_options):
+    """Run ``workers`` consumer processes against the events queue.
+
+    SIGTERM/SIGINT are forwarded to every worker, which stops consuming,
+    flushes its in-flight batch and exits; the parent returns once all
+    workers are done.  Workers that die unexpectedly are restarted.
+    """
+    context = multiprocessing.get_context('fork')
+    parent_pid = os.getpid()
+    stopping = threading.Event()
+    processes: Dict[int, multiprocessing.Process] = {}
+
+    def spawn(worker_id: int) -> multiprocessing.Process:
+        process = context.Process(
+            target=_run_consumer_worker,
+            args=(worker_id, consumer_options),
+            name=f"notification-consumer-{worker_id}",
+        )
+        process.start()
+        return process
+
+    def _handler(signum, frame):
+        if os.getpid() != parent_pid:
+            # A freshly forked worker has not installed its own handlers yet.
+            raise SystemExit(0)
+        logger.info(f"Received signal {signum}, stopping {len(processes)} consumer workers...")
+        stopping.set()
+        for process in processes.values():
+            if process.is_alive():
+                os.kill(process.pid, signal.SIGTERM)
+
+    connections.close_all()
+    signal.signal(signal.SIGTERM, _handler)
+    signal.signal(signal.SIGINT, _handler)
+    for worker_id in range(workers):
+        processes[worker_id] = spawn(worker_id)
+
+    while not stopping.is_set():
+        for worker_id, process in list(processes.items()):
+            if not process.is_alive() and not stopping.is_set():
+                logger.warning(f"Consumer worker {worker_id} exited with code {process.exitcode}, restarting")
+                processes[worker_id] = spawn(worker_id)
+        stopping.wait(1.0)
+
+    for process in processes.values():
+        process.join()
+    logger.info("All consumer workers stopped")
+
+
+def start_notification_consumer(batch_size: int = 1, batch_timeout_ms: int = 200,
+                                prefetch_count: Optional[int] = None, workers: int = 1):
     """Start the notification consumer."""
-    consumer = NotificationConsumer()
+    consumer_options = {
+        'batch_size': batch_size,
+        'batch_timeout_ms': batch_timeout_ms,
+        'prefetch_count': prefetch_count,
+    }
+    if workers > 1:
+        run_consumer_pool(workers, **consumer_options)
+        return
+    consumer = NotificationConsumer(**consumer_options)
+    consumer.install_signal_handlers()
     consumer.start_consuming()
@@ -0,0 +1,173 @@
+"""Read-only fast path for the hot list endpoints.
+
+A ``ModelSerializer`` resolves, converts and null-checks every field of every
+row through the generic field machinery.  :class:`ValuesSerializer` inspects a
+serializer class once, works out which model column feeds each output field
+and how its value is converted, and then builds the same output dicts straight
+from ``.values()`` rows.
+
+:class:`FastJSONRenderer` encodes with ``orjson`` when it is installed and
+falls back to DRF's ``JSONRenderer`` for anything orjson would format
+differently (indented output, non-string keys, types it would hand to the
+DRF encoder).  Floats are an exception: orjson writes ``1e16`` where ``json``
+writes ``1e+16``, so only use it for payloads without float fields.
+"""
+
+from functools import cached_property
+from typing import Any, Callable, Iterable, List, Tuple
+
+from django.conf import settings
+from django.core.exceptions import ImproperlyConfigured
+from django.utils import timezone
+from rest_framework import ISO_8601, serializers
+from rest_framework.renderers import JSONRenderer
+from rest_framework.settings import api_settings
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Fields whose ``to_representation`` returns column values unchanged.
+PASSTHROUGH_FIELDS = (
+    serializers.BooleanField,
+    serializers.CharField,
+    serializers.ChoiceField,
+    serializers.IntegerField,
+)
+
+# Fields that need the instance rather than one column value.
+UNSUPPORTED_FIELDS = (
+    serializers.BaseSerializer,
+    serializers.ManyRelatedField,
+    serializers.RelatedField,
+    serializers.SerializerMethodField,
+)
+
+
+def _uuid_to_str(value):
+    return None if value is None else str(value)
+
+
+def _nullable(convert: Callable[[Any], Any]) -> Callable[[Any], Any]:
+    # Serializers emit ``None`` for null attributes without calling the field.
+    def to_representation(value):
+        return None if value is None else convert(value)
+    return to_representation
+
+
+class DateTimeConverter:
+    """ISO 8601 ``DateTimeField`` output with the timezone looked up once per list.
+
+    ``DateTimeField.to_representation`` resolves the active timezone for
+    every value, which costs more than the formatting itself.
+    """
+
+    def __init__(self, field: serializers.DateTimeField):
+        self.field = field
+
+    def bind(self, current_timezone) -> Callable[[Any], Any]:
+        field = self.field
+        field_timezone = field.timezone if hasattr(field, 'timezone') else current_timezone
+
+        def to_representation(value):
+            if value is None or field_timezone is None or value.tzinfo is None:
+                return field.to_representation(value)
+            value = value.astimezone(field_timezone).isoformat()
+            return value[:-6] + 'Z' if value.endswith('+00:00') else value
+        return to_representation
+
+
+def field_converter(field: serializers.Field):
+    """How ``field`` turns a column value into output; ``None`` means unchanged.
+
+    Date-times get a :class:`DateTimeConverter`, bound per list to a callable.
+    """
+    if isinstance(field, PASSTHROUGH_FIELDS):
+        return None
+    if isinstance(field, serializers.JSONField) and not field.binary:
+        return None
+    if isinstance(field, serializers.UUIDField) and field.uuid_format == 'hex_verbose':
+        return _uuid_to_str
+    if isinstance(field, serializers.DateTimeField):
+        output_format = getattr(field, 'format', api_settings.DATETIME_FORMAT)
+        if output_format is None:
+            return None
+        if output_format.lower() == ISO_8601:
+            return DateTimeConverter(field)
+    return _nullable(field.to_representation)
+
+
+class ValuesSerializer:
+    """Serialize ``.values()`` rows exactly as ``serializer_class`` serializes instances.
+
+    Only flat serializers qualify: every field must read a single model
+    column, so nested serializers, related fields, method fields and dotted
+    sources raise ``ImproperlyConfigured``.
+    """
+
+    def __init__(self, serializer_class: type):
+        self.serializer_class = serializer_class
+
+    @cached_property
+    def fields(self) -> Tuple[Tuple[str, str, Any], ...]:
+        """``(output name, column, converter)`` for each readable field."""
+        mapping = []
+        for name, field in self.serializer_class().fields.items():
+            if field.write_only:
+                continue
+            if isinstance(field, UNSUPPORTED_FIELDS) or field.source == '*' or '.' in field.source:
+                raise ImproperlyConfigured(
+                    f'{self.serializer_class.__name__}.{name} does not map to a single column'
+                )
+            mapping.append((name, field.source, field_converter(field)))
+        return tuple(mapping)
+
+    @cached_property
+    def columns(self) -> Tuple[str, ...]:
+        return tuple(column for _, column, _ in self.fields)
+
+    def values(self, queryset, *extra_columns: str):
+        """``queryset`` as dicts holding the output columns plus ``extra_columns``.
+
+        Pass the pagination ordering column when it is not an output field,
+        since cursor pagination reads positions from the rows.
+        """
+        extra = [column for column in extra_columns if column not in self.columns]
+        return queryset.values(*self.columns, *extra)
+
+    def to_representation(self, rows: Iterable[dict]) -> List[dict]:
+        current_timezone = timezone.get_current_timezone() if settings.USE_TZ else None
+        fields = [
+            (name, column, convert.bind(current_timezone) if isinstance(convert, DateTimeConverter) else convert)
+            for name, column, convert in self.fields
+        ]
+        return [
+            {
+                name: row[column] if convert is None else convert(row[column])
+                for name, column, convert in fields
+            }
+            for row in rows
+        ]
+
+
+class FastJSONRenderer(JSONRenderer):
+    """``JSONRenderer`` that produces the same bytes through ``orjson``."""
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if (
+            orjson is None or data is None
+            or self.ensure_ascii or not self.compact
+            or self.get_indent(accepted_media_type, renderer_context or {}) is not None
+        ):
+            return super().render(data, accepted_media_type, renderer_context)
+        try:
+            body = orjson.dumps(
+                data,
+                default=self.encoder_class().default,
+                option=orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_PASSTHROUGH_DATACLASS,
+            )
+        except orjson.JSONEncodeError:
+            return super().render(data, accepted_media_type, renderer_context)
+        # JSONRenderer escapes these so the output stays a JavaScript subset.
+        return body.replace('\u2028'.encode(), b'\\u2028').replace('\u2029'.encode(), b'\\u2029')
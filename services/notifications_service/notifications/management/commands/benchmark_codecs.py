@@ -0,0 +1,103 @@
+"""Measure encode/decode throughput and size of the events queue codecs."""
+
+import json
+import time
+import uuid
+from datetime import datetime, timedelta, timezone
+
+from django.core.management.base import BaseCommand
+
+from notifications import envelope
+from notifications.envelope import build_envelope, decode_message
+
+
+def sample_payloads():
+    """One payload per original event type, shaped like the producers' outbox data."""
+    club_id = str(uuid.uuid4())
+    start = datetime(2026, 11, 3, 18, 0, tzinfo=timezone.utc)
+    return {
+        'club_created': {'id': club_id, 'name': 'Competitive Programming Society', 'status': 'pending_approval'},
+        'club_approved': {'id': club_id, 'name': 'Competitive Programming Society'},
+        'member_added': {
+            'club_id': club_id,
+            'member_id': '4812',
+            'user_id': 'student-20931',
+            'user_name': 'Alex Johnson',
+            'role': 'member',
+        },
+        'event_created': {
+            'id': str(uuid.uuid4()),
+            'club_id': club_id,
+            'name': 'Weekly Practice Contest',
+            'start_time': start.isoformat(),
+            'end_time': (start + timedelta(hours=2)).isoformat(),
+        },
+        'rsvp_created': {
+            'event_id': str(uuid.uuid4()),
+            'rsvp_id': '90211',
+            'user_id': 'student-20931',
+            'user_name': 'Alex Johnson',
+        },
+        'order_created': {
+            'id': str(uuid.uuid4()),
+            'user_id': 'student-20931',
+            'items': [{'ticket_type_id': str(uuid.uuid4()), 'quantity': quantity} for quantity in (1, 2, 1)],
+        },
+    }
+
+
+class Command(BaseCommand):
+    help = 'Benchmark encoding and decoding the six original event types with each message codec'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--messages', type=int, default=20_000,
+                            help='Messages per timing round')
+        parser.add_argument('--rounds', type=int, default=5,
+                            help='Timing rounds; the fastest is reported')
+
+    def handle(self, *args, **options):
+        self.messages = options['messages']
+        self.rounds = options['rounds']
+        codecs = [('legacy json', None), ('json v1', envelope.JSON_CODEC)]
+        if envelope.MSGPACK_CODEC is not None:
+            codecs.append(('msgpack v1', envelope.MSGPACK_CODEC))
+        else:
+            self.stdout.write(self.style.WARNING('msgpack is not installed; skipping the msgpack codec'))
+
+        self.stdout.write(
+            f"{'event type':<15}{'codec':<13}{'bytes':>7}{'encode us':>11}{'decode us':>11}"
+            f"{'encode/s':>11}{'decode/s':>11}"
+        )
+        for event_type, data in sample_payloads().items():
+            for label, codec in codecs:
+                self.report(event_type, data, label, codec)
+
+    def best_per_message(self, func):
+        """Fastest per-call time in microseconds over ``rounds`` rounds."""
+        best = float('inf')
+        for _ in range(self.rounds):
+            started = time.perf_counter()
+            for _ in range(self.messages):
+                func()
+            best = min(best, time.perf_counter() - started)
+        return best / self.messages * 1e6
+
+    def report(self, event_type, data, label, codec):
+        if codec is None:
+            # The pre-envelope format: bare JSON, decoded without a content type.
+            def encode():
+                return json.dumps({'type': event_type, 'data': data}).encode('utf-8')
+            content_type = None
+        else:
+            def encode():
+                return codec.dumps(build_envelope(event_type, data))
+            content_type = codec.content_type
+
+        body = encode()
+        assert decode_message(body, content_type).data == data
+        encode_us = self.best_per_message(encode)
+        decode_us = self.best_per_message(lambda: decode_message(body, content_type))
+        self.stdout.write(
+            f"{event_type:<15}{label:<13}{len(body):>7}{encode_us:>11.2f}{decode_us:>11.2f}"
+            f"{1e6 / encode_us:>11.0f}{1e6 / decode_us:>11.0f}"
+        )
@@ -0,0 +1,95 @@
+"""Measure streaming notification export throughput and memory at scale."""
+
+import random
+import time
+import tracemalloc
+
+from django.core.management.base import BaseCommand
+from django.test import Client
+
+from notifications.consumers import NotificationConsumer
+from notifications.models import Notification
+
+from ._benchmark import benchmark_database
+
+EVENT_TYPES = ['club_created', 'club_approved', 'member_added', 'event_created', 'rsvp_created', 'order_created']
+
+
+class Command(BaseCommand):
+    help = 'Benchmark NDJSON/CSV notification export against paging the list API in a throwaway database'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--rows', type=int, default=1_000_000)
+        parser.add_argument('--batch-size', type=int, default=10_000)
+        parser.add_argument('--list-pages', type=int, default=20,
+                            help='Pages of the list API to time for the paging baseline')
+        parser.add_argument('--seed', type=int, default=42)
+
+    def handle(self, *args, **options):
+        rows = options['rows']
+        with benchmark_database():
+            started = time.perf_counter()
+            self.populate(random.Random(options['seed']), rows, options['batch_size'])
+            self.stdout.write(f"Inserted {rows} notifications in {time.perf_counter() - started:.1f}s")
+
+            client = Client()
+            self.stdout.write(f"{'method':<22}{'rows':>10}{'seconds':>10}{'rows/s':>10}{'MB':>9}{'peak MiB':>10}")
+            for export_format in ('ndjson', 'csv'):
+                self.report_export(client, export_format, rows)
+            self.report_paging(client, options['list_pages'])
+
+    def populate(self, rng, rows, batch_size):
+        consumer = NotificationConsumer()
+        batch = []
+        for index in range(rows):
+            event_data = {'name': f"Club {rng.randint(1, 5000)}", 'user_name': f"Student {index}", 'role': 'member'}
+            batch.append(consumer.build_notification(rng.choice(EVENT_TYPES), event_data))
+            if len(batch) >= batch_size:
+                Notification.objects.bulk_create(batch)
+                batch = []
+        if batch:
+            Notification.objects.bulk_create(batch)
+
+    def stream(self, client, export_format, track_memory=False):
+        """Consume one export; returns (lines, bytes, peak traced MiB or None)."""
+        if track_memory:
+            tracemalloc.start()
+        response = client.get('/api/notifications/export/', {'format': export_format})
+        lines = size = 0
+        for block in response.streaming_content:
+            lines += block.count(b'\n')
+            size += len(block)
+        response.close()
+        peak = None
+        if track_memory:
+            peak = tracemalloc.get_traced_memory()[1] / (1024 * 1024)
+            tracemalloc.stop()
+        return lines, size, peak
+
+    def report_export(self, client, export_format, rows):
+        started = time.perf_counter()
+        lines, size, _ = self.stream(client, export_format)
+        elapsed = time.perf_counter() - started
+        # A second, slower pass under tracemalloc for the memory high-water mark.
+        _, _, peak = self.stream(client, export_format, track_memory=True)
+        exported = lines - 1 if export_format == 'csv' else lines
+        self.stdout.write(
+            f"{export_format + ' export':<22}{exported:>10}{elapsed:>10.1f}{exported / elapsed:>10.0f}"
+            f"{size / 1e6:>9.0f}{peak:>10.1f}"
+        )
+
+    def report_paging(self, client, pages):
+        """Walk the cursor-paginated list API, summary included, as exports did before."""
+        path = '/api/notifications/?page_size=500'
+        fetched = 0
+        started = time.perf_counter()
+        for _ in range(pages):
+            data = client.get(path).json()
+            fetched += len(data['results'])
+            if not data['next']:
+                break
+            path = data['next']
+        elapsed = time.perf_counter() - started
+        self.stdout.write(
+            f"{'list API, 500/page':<22}{fetched:>10}{elapsed:>10.1f}{fetched / elapsed:>10.0f}{'-':>9}{'-':>10}"
+        )
@@ -0,0 +1,101 @@
+"""Compare notification search latency for the FTS5 and icontains backends, and FTS5 ranking."""
+
+import random
+import time
+
+from django.core.management.base import BaseCommand
+from django.db.models import Count
+from django.test import override_settings
+
+from notifications.consumers import NotificationConsumer
+from notifications.models import Notification
+from notifications.search import search_notifications
+
+from ._benchmark import benchmark_database, summarize, time_calls
+
+EVENT_TYPES = ['club_created', 'club_approved', 'member_added', 'event_created', 'rsvp_created', 'order_created']
+SYLLABLES = ['ka', 'lo', 'mi', 'ren', 'tas', 'vo', 'zel', 'qui', 'dor', 'bea', 'nix', 'pra']
+
+
+class Command(BaseCommand):
+    help = 'Benchmark notification search (FTS5 vs icontains) in a throwaway database'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--rows', type=int, default=1_000_000)
+        parser.add_argument('--queries', type=int, default=20,
+                            help='Timed repetitions per search term and backend')
+        parser.add_argument('--batch-size', type=int, default=10_000)
+        parser.add_argument('--seed', type=int, default=42)
+
+    def handle(self, *args, **options):
+        rng = random.Random(options['seed'])
+        vocabulary = self.make_vocabulary(rng, 5000)
+
+        with benchmark_database():
+            started = time.perf_counter()
+            self.populate(rng, vocabulary, options['rows'], options['batch_size'])
+            self.stdout.write(f"Inserted {options['rows']} notifications in {time.perf_counter() - started:.1f}s")
+
+            terms = {
+                'rare name': vocabulary[-1],
+                'common word': 'club',
+                'two terms': f"{vocabulary[0]} club",
+            }
+            self.stdout.write("Median (p95) ms for the first page, and for the page plus its summary.")
+            self.stdout.write(f"{'term':<14}{'backend':<9}{'matches':>10}{'page':>20}{'page + summary':>20}")
+            for label, term in terms.items():
+                for backend, ranked in (('like', False), ('fts', False), ('fts', True)):
+                    with override_settings(NOTIFICATION_SEARCH_BACKEND=backend):
+                        matches, page, summary = self.measure(term, options['queries'], ranked)
+                    name = 'rank' if ranked else backend
+                    self.stdout.write(
+                        f"{label:<14}{name:<9}{matches:>10}"
+                        f"{page['median_ms']:>12.2f} ({page['p95_ms']:>6.2f})"
+                        f"{summary['median_ms']:>12.2f} ({summary['p95_ms']:>6.2f})"
+                    )
+
+    def make_vocabulary(self, rng, size):
+        words = set()
+        while len(words) < size:
+            words.add(''.join(rng.choice(SYLLABLES) for _ in range(rng.randint(2, 4))))
+        return sorted(words)
+
+    def populate(self, rng, vocabulary, rows, batch_size):
+        consumer = NotificationConsumer()
+        batch = []
+        for _ in range(rows):
+            name = rng.choice(vocabulary).title()
+            event_data = {
+                'name': f"{name} Club",
+                'user_name': rng.choice(vocabulary).title(),
+                'role': 'member',
+                'id': str(rng.getrandbits(64)),
+            }
+            batch.append(consumer.build_notification(rng.choice(EVENT_TYPES), event_data))
+            if len(batch) >= batch_size:
+                Notification.objects.bulk_create(batch)
+                batch = []
+        if batch:
+            Notification.objects.bulk_create(batch)
+
+    def measure(self, term, repeat, ranked=False):
+        """Time the queries NotificationListView runs: one page, then the summary.
+
+        Pages are newest first, or by relevance with ``ranked`` (``?ordering=rank``).
+        """
+        def run(summary=True):
+            queryset = search_notifications(Notification.objects.all(), term, ranked=ranked)
+            if ranked:
+                list(queryset[:20])
+            else:
+                list(queryset.order_by('-created_at')[:21])
+            if summary:
+                rows = queryset.order_by().values_list('status', 'event_type').annotate(count=Count('*'))
+                return sum(count for _, _, count in rows)
+
+        matches = run()
+        return (
+            matches,
+            summarize(time_calls(lambda: run(summary=False), repeat)),
+            summarize(time_calls(run, repeat)),
+        )
@@ -0,0 +1,78 @@
+"""Compare mixed read/write throughput across SQLite PRAGMA profiles."""
+
+import threading
+import time
+
+from django.core.management.base import BaseCommand
+from django.db import OperationalError, connection
+from django.test import override_settings
+
+from notifications.consumers import NotificationConsumer
+from notifications.models import Notification
+from notifications_service.database import SQLITE_PROFILES
+
+from ._benchmark import benchmark_database
+
+
+class Command(BaseCommand):
+    help = 'Benchmark concurrent notification inserts and list reads per SQLite profile'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--writers', type=int, default=4)
+        parser.add_argument('--readers', type=int, default=8)
+        parser.add_argument('--seconds', type=float, default=5.0)
+        parser.add_argument('--rows', type=int, default=20_000,
+                            help='Notifications inserted before the timed run')
+
+    def handle(self, *args, **options):
+        self.stdout.write(f"{'profile':<10}{'writes/s':>10}{'reads/s':>10}{'errors':>8}")
+        for profile in SQLITE_PROFILES:
+            with override_settings(SQLITE_PROFILE=profile), benchmark_database():
+                self.populate(options['rows'])
+                writes, reads, errors = self.run(options['writers'], options['readers'], options['seconds'])
+            seconds = options['seconds']
+            self.stdout.write(f"{profile:<10}{writes / seconds:>10.1f}{reads / seconds:>10.1f}{errors:>8}")
+
+    def populate(self, rows):
+        consumer = NotificationConsumer()
+        Notification.objects.bulk_create(
+            [consumer.build_notification('club_created', {'name': f'Club {index}'}) for index in range(rows)],
+            batch_size=5000,
+        )
+
+    def run(self, writers, readers, seconds):
+        consumer = NotificationConsumer()
+        counts = {'writes': 0, 'reads': 0, 'errors': 0}
+        lock = threading.Lock()
+        stop = threading.Event()
+
+        def loop(operation, key):
+            done = errors = 0
+            try:
+                while not stop.is_set():
+                    try:
+                        operation()
+                        done += 1
+                    except OperationalError:
+                        errors += 1
+            finally:
+                connection.close()
+                with lock:
+                    counts[key] += done
+                    counts['errors'] += errors
+
+        def write():
+            consumer.build_notification('rsvp_created', {'user_name': 'Bench'}).save(force_insert=True)
+
+        def read():
+            list(Notification.objects.all()[:20])
+
+        threads = [threading.Thread(target=loop, args=(write, 'writes')) for _ in range(writers)]
+        threads += [threading.Thread(target=loop, args=(read, 'reads')) for _ in range(readers)]
+        for thread in threads:
+            thread.start()
+        time.sleep(seconds)
+        stop.set()
+        for thread in threads:
+            thread.join()
+        return counts['writes'], counts['reads'], counts['errors']
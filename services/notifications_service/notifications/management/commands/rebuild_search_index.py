@@ -0,0 +1,13 @@
+"""Django management command to rebuild the notification search index."""
+
+from django.core.management.base import BaseCommand
+
+from notifications.search import rebuild_index
+
+
+class Command(BaseCommand):
+    help = 'Rebuild the FTS5 notification search index (run after VACUUM)'
+
+    def handle(self, *args, **options):
+        rebuild_index()
+        self.stdout.write(self.style.SUCCESS('Notification search index rebuilt.'))
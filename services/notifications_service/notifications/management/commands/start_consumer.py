@@ -7,13 +7,28 @@ from notifications.consumers import start_notification_consumer
 class Command(BaseCommand):
     help = 'Start the RabbitMQ notification consumer'
 
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=1,
+                            help='Messages written per bulk insert (1 disables batching)')
+        parser.add_argument('--batch-timeout-ms', type=int, default=200,
+                            help='Maximum time a partial batch waits before being flushed')
+        parser.add_argument('--workers', type=int, default=1,
+                            help='Number of consumer processes to run')
+        parser.add_argument('--prefetch', type=int, default=None,
+                            help='basic_qos prefetch count (defaults to twice the batch size)')
+
     def handle(self, *args, **options):
         self.stdout.write(
             self.style.SUCCESS('Starting notification consumer...')
         )
         
         try:
-            start_notification_consumer()
+            start_notification_consumer(
+                batch_size=options['batch_size'],
+                batch_timeout_ms=options['batch_timeout_ms'],
+                prefetch_count=options['prefetch'],
+                workers=options['workers'],
+            )
         except KeyboardInterrupt:
             self.stdout.write(
                 self.style.SUCCESS('Notification consumer stopped.')
@@ -0,0 +1,38 @@
+"""Django management command that blocks until RabbitMQ accepts connections."""
+
+import os
+import socket
+import time
+
+from django.core.management.base import BaseCommand
+
+
+class Command(BaseCommand):
+    help = 'Wait until the RabbitMQ broker port is reachable'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--timeout', type=float, default=60.0,
+                            help='Give up after this many seconds')
+        parser.add_argument('--interval', type=float, default=0.5,
+                            help='Seconds between connection attempts')
+
+    def handle(self, *args, **options):
+        host = os.environ.get('RABBITMQ_HOST', 'localhost')
+        port = int(os.environ.get('RABBITMQ_PORT', '5672'))
+        started = time.monotonic()
+        deadline = started + options['timeout']
+
+        while True:
+            try:
+                with socket.create_connection((host, port), timeout=options['interval']):
+                    break
+            except OSError:
+                if time.monotonic() >= deadline:
+                    # The consumer has its own connection retries, so let it
+                    # take over rather than failing the container here.
+                    self.stderr.write(f'RabbitMQ at {host}:{port} not reachable after {options["timeout"]:.0f}s')
+                    return
+                time.sleep(options['interval'])
+
+        elapsed = time.monotonic() - started
+        self.stdout.write(self.style.SUCCESS(f'RabbitMQ at {host}:{port} ready after {elapsed:.1f}s'))
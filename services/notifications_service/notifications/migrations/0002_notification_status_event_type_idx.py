@@ -0,0 +1,17 @@
+# Generated by Django 4.2.30 on 2026-10-17 17:17
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('notifications', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='notification',
+            index=models.Index(fields=['status', 'event_type'], name='notificatio_status_146c2c_idx'),
+        ),
+    ]
@@ -0,0 +1,75 @@
+from django.db import migrations
+
+
+# External-content FTS5 index keyed on the notification table's rowid, so the
+# text is stored once and joins/deletes are integer lookups.  VACUUM may
+# renumber rowids of tables without an INTEGER PRIMARY KEY; run
+# ``manage.py rebuild_search_index`` after vacuuming.
+CREATE_STATEMENTS = [
+    """
+    CREATE VIRTUAL TABLE notifications_notification_fts USING fts5(
+        subject, message, user_name,
+        content='notifications_notification', content_rowid='rowid'
+    )
+    """,
+    """
+    CREATE TRIGGER notifications_notification_fts_insert
+    AFTER INSERT ON notifications_notification BEGIN
+        INSERT INTO notifications_notification_fts (rowid, subject, message, user_name)
+        VALUES (NEW.rowid, NEW.subject, NEW.message, NEW.user_name);
+    END
+    """,
+    """
+    CREATE TRIGGER notifications_notification_fts_delete
+    AFTER DELETE ON notifications_notification BEGIN
+        INSERT INTO notifications_notification_fts (notifications_notification_fts, rowid, subject, message, user_name)
+        VALUES ('delete', OLD.rowid, OLD.subject, OLD.message, OLD.user_name);
+    END
+    """,
+    """
+    CREATE TRIGGER notifications_notification_fts_update
+    AFTER UPDATE OF subject, message, user_name ON notifications_notification
+    WHEN OLD.subject IS NOT NEW.subject
+        OR OLD.message IS NOT NEW.message
+        OR OLD.user_name IS NOT NEW.user_name
+    BEGIN
+        INSERT INTO notifications_notification_fts (notifications_notification_fts, rowid, subject, message, user_name)
+        VALUES ('delete', OLD.rowid, OLD.subject, OLD.message, OLD.user_name);
+        INSERT INTO notifications_notification_fts (rowid, subject, message, user_name)
+        VALUES (NEW.rowid, NEW.subject, NEW.message, NEW.user_name);
+    END
+    """,
+    "INSERT INTO notifications_notification_fts (notifications_notification_fts) VALUES ('rebuild')",
+]
+
+DROP_STATEMENTS = [
+    "DROP TRIGGER IF EXISTS notifications_notification_fts_update",
+    "DROP TRIGGER IF EXISTS notifications_notification_fts_delete",
+    "DROP TRIGGER IF EXISTS notifications_notification_fts_insert",
+    "DROP TABLE IF EXISTS notifications_notification_fts",
+]
+
+
+def create_fts_index(apps, schema_editor):
+    if schema_editor.connection.vendor != 'sqlite':
+        return
+    for statement in CREATE_STATEMENTS:
+        schema_editor.execute(statement)
+
+
+def drop_fts_index(apps, schema_editor):
+    if schema_editor.connection.vendor != 'sqlite':
+        return
+    for statement in DROP_STATEMENTS:
+        schema_editor.execute(statement)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('notifications', '0002_notification_status_event_type_idx'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_fts_index, drop_fts_index),
+    ]
@@ -44,6 +44,8 @@ class Notification(models.Model):
             models.Index(fields=['user_id']),
             models.Index(fields=['status']),
             models.Index(fields=['created_at']),
+            # Covers the grouped summary query in NotificationListView.
+            models.Index(fields=['status', 'event_type']),
         ]
     
     def __str__(self) -> str:
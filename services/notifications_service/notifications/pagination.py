@@ -0,0 +1,20 @@
+"""Pagination for the notifications list endpoint."""
+
+from rest_framework.pagination import CursorPagination, PageNumberPagination
+
+
+class NotificationCursorPagination(CursorPagination):
+    """Keyset pagination over the ``created_at`` index, newest first."""
+
+    page_size = 20
+    page_size_query_param = 'page_size'
+    max_page_size = 500
+    ordering = '-created_at'
+
+
+class NotificationRankPagination(PageNumberPagination):
+    """Numbered pages for ``?ordering=rank`` searches, which have no keyset ordering."""
+
+    page_size = 20
+    page_size_query_param = 'page_size'
+    max_page_size = 500
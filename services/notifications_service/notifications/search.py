@@ -0,0 +1,109 @@
+"""Search over notifications.
+
+The default backend, ``NOTIFICATION_SEARCH_BACKEND = 'like'``, matches the
+search text as a case-insensitive substring of ``subject``, ``message`` or
+``user_name``.  Newest-first pages stop at the first page of hits, so common
+terms return quickly, but rare terms scan the table.
+
+``NOTIFICATION_SEARCH_BACKEND = 'fts'`` (SQLite only) opts in to an FTS5
+index over the same columns, kept in sync by triggers (see migration
+``0003``).  Matching differs: every word of the search must start a word in
+the notification, so ``botic`` no longer finds "Robotics".  Rare terms become
+index lookups; terms matching most of the table are slower than ``LIKE``.
+Terms with more than ``SELECTIVE_MATCHES`` hits are checked row by row while
+SQLite walks the ordering index, instead of fetching and sorting every hit.
+
+Matches keep the caller's ordering unless the search is ``ranked``, which
+the FTS backend alone supports: it joins the index to order matches by BM25
+relevance, scoring and sorting every hit.
+"""
+
+import re
+
+from django.conf import settings
+from django.db import connection
+from django.db.models import BooleanField, Q
+from django.db.models.expressions import RawSQL
+
+FTS_TABLE = 'notifications_notification_fts'
+
+# Above this many hits, fetching every hit by rowid and sorting them costs
+# more than scanning the ordering index until a page of hits is found.
+SELECTIVE_MATCHES = 1000
+
+_TOKEN_RE = re.compile(r'\w+')
+
+
+def rebuild_index() -> None:
+    """Re-derive the FTS5 index from the notifications table."""
+    if connection.vendor != 'sqlite':
+        return
+    with connection.cursor() as cursor:
+        cursor.execute(f"INSERT INTO {FTS_TABLE} ({FTS_TABLE}) VALUES ('rebuild')")
+
+
+def build_match_query(search: str) -> str:
+    """Turn free text into an FTS5 query that prefix-matches every term."""
+    return ' '.join(f'"{token}"*' for token in _TOKEN_RE.findall(search))
+
+
+def count_matches(match: str, limit: int) -> int:
+    """Number of rows matching ``match``, counting no further than ``limit``."""
+    with connection.cursor() as cursor:
+        cursor.execute(
+            f"SELECT count(*) FROM (SELECT rowid FROM {FTS_TABLE} WHERE {FTS_TABLE} MATCH %s LIMIT %s)",
+            [match, limit],
+        )
+        return cursor.fetchone()[0]
+
+
+def use_fts() -> bool:
+    backend = getattr(settings, 'NOTIFICATION_SEARCH_BACKEND', 'like')
+    return backend == 'fts' and connection.vendor == 'sqlite'
+
+
+def can_rank(search: str) -> bool:
+    """Whether matches of ``search`` can be ordered by relevance."""
+    return use_fts() and bool(build_match_query(search))
+
+
+def search_notifications(queryset, search: str, ranked: bool = False):
+    """Filter ``queryset`` to notifications matching ``search``.
+
+    With the FTS backend this counts up to ``SELECTIVE_MATCHES`` hits first
+    to choose between the two query plans, unless ``ranked`` asks for the
+    matches best first (see :func:`can_rank`), newest first among equal ranks.
+    """
+    match = build_match_query(search)
+    if not use_fts() or not match:
+        return queryset.filter(
+            Q(subject__icontains=search) |
+            Q(message__icontains=search) |
+            Q(user_name__icontains=search)
+        )
+
+    table = queryset.model._meta.db_table
+    if ranked:
+        # The ORM cannot join the virtual table; a correlated rank subquery
+        # would rerun the full-text query for every hit.
+        return queryset.extra(
+            tables=[FTS_TABLE],
+            where=[
+                f'{FTS_TABLE}.rowid = {table}.rowid',
+                f'{FTS_TABLE} MATCH %s',
+            ],
+            params=[match],
+            select={'search_rank': f'{FTS_TABLE}.rank'},
+            order_by=['search_rank', '-created_at', '-id'],
+        )
+
+    rowid = f'{table}.rowid'
+    if count_matches(match, SELECTIVE_MATCHES + 1) > SELECTIVE_MATCHES:
+        # The unary plus stops SQLite looking hits up by rowid, so it walks
+        # the ordering index and checks each row against the hit list.
+        rowid = f'+{rowid}'
+    return queryset.filter(RawSQL(
+        f'{rowid} IN (SELECT rowid FROM {FTS_TABLE} WHERE {FTS_TABLE} MATCH %s)',
+        [match],
+        output_field=BooleanField(),
+    ))
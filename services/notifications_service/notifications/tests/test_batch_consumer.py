@@ -0,0 +1,147 @@
+"""Tests for the batched mode of NotificationConsumer."""
+
+import json
+import unittest
+from types import SimpleNamespace
+
+from django.test import TestCase
+
+from notifications import envelope
+from notifications.consumers import NotificationConsumer
+from notifications.models import Notification
+
+
+class FakeChannel:
+    """Records acknowledgements instead of talking to RabbitMQ."""
+
+    def __init__(self):
+        self.acks = []
+
+    def basic_ack(self, delivery_tag, multiple=False):
+        self.acks.append((delivery_tag, multiple))
+
+
+def deliver(consumer, tag, body, content_type=None):
+    method = SimpleNamespace(delivery_tag=tag)
+    properties = SimpleNamespace(content_type=content_type) if content_type else None
+    consumer.handle_batched_message(consumer.channel, method, properties, body)
+
+
+def event(event_type, **data):
+    return json.dumps({'type': event_type, 'data': data}).encode('utf-8')
+
+
+class BatchedConsumerTests(TestCase):
+
+    def setUp(self):
+        self.consumer = NotificationConsumer(batch_size=3)
+        self.consumer.channel = FakeChannel()
+
+    def test_prefetch_defaults_to_twice_the_batch(self):
+        self.assertEqual(self.consumer.prefetch_count, 6)
+
+    def test_full_batch_is_bulk_inserted_and_acked_once(self):
+        deliver(self.consumer, 1, event('club_created', name='Chess Club'))
+        deliver(self.consumer, 2, event('member_added', user_name='Alex'))
+        self.assertEqual(Notification.objects.count(), 0)
+        self.assertEqual(self.consumer.channel.acks, [])
+
+        deliver(self.consumer, 3, event('order_created', id='ORDER-1'))
+
+        self.assertEqual(Notification.objects.count(), 3)
+        self.assertEqual(self.consumer.channel.acks, [(3, True)])
+
+    def test_invalid_message_is_acked_with_batch(self):
+        deliver(self.consumer, 1, b'not json')
+        deliver(self.consumer, 2, event('rsvp_created', user_name='Jamie'))
+        self.consumer.flush_batch()
+
+        self.assertEqual(Notification.objects.count(), 1)
+        self.assertEqual(self.consumer.channel.acks, [(2, True)])
+
+    def test_flush_without_pending_messages_does_nothing(self):
+        self.consumer.flush_batch()
+        self.assertEqual(self.consumer.channel.acks, [])
+
+
+class EnvelopeConsumerTests(TestCase):
+
+    def setUp(self):
+        self.consumer = NotificationConsumer(batch_size=10)
+        self.consumer.channel = FakeChannel()
+
+    def test_legacy_and_enveloped_json_messages_are_both_consumed(self):
+        body = envelope.JSON_CODEC.dumps(envelope.build_envelope('club_created', {'name': 'Chess Club'}))
+        deliver(self.consumer, 1, event('member_added', user_name='Alex'))
+        deliver(self.consumer, 2, body, envelope.JSON_CONTENT_TYPE)
+        self.consumer.flush_batch()
+
+        self.assertEqual(
+            sorted(Notification.objects.values_list('event_type', flat=True)),
+            ['club_created', 'member_added'],
+        )
+
+    @unittest.skipIf(envelope.msgpack is None, 'msgpack is not installed')
+    def test_msgpack_messages_are_decoded_by_content_type(self):
+        codec = envelope.get_codec('msgpack')
+        body = codec.dumps(envelope.build_envelope('order_created', {'id': 'ORDER-1'}))
+        deliver(self.consumer, 1, body, codec.content_type)
+        self.consumer.flush_batch()
+
+        self.assertEqual(Notification.objects.get().event_data, {'id': 'ORDER-1'})
+
+    def test_unsupported_schema_version_is_acked_without_a_notification(self):
+        body = json.dumps({'version': envelope.SCHEMA_VERSION + 1, 'type': 'club_created', 'data': {}}).encode()
+        deliver(self.consumer, 1, body, envelope.JSON_CONTENT_TYPE)
+        self.consumer.flush_batch()
+
+        self.assertEqual(Notification.objects.count(), 0)
+        self.assertEqual(self.consumer.channel.acks, [(1, True)])
+
+
+class ScriptedChannel(FakeChannel):
+    """Delivers a fixed list of bodies, then returns as if stop_consuming ran."""
+
+    is_open = True
+
+    def __init__(self, bodies):
+        super().__init__()
+        self.bodies = bodies
+        self.prefetch_count = None
+
+    def basic_qos(self, prefetch_count):
+        self.prefetch_count = prefetch_count
+
+    def basic_consume(self, queue, on_message_callback, auto_ack):
+        self.callback = on_message_callback
+
+    def start_consuming(self):
+        for tag, body in enumerate(self.bodies, start=1):
+            self.callback(self, SimpleNamespace(delivery_tag=tag), None, body)
+
+
+class GracefulDrainTests(TestCase):
+
+    def test_stop_drains_partial_batch_before_disconnecting(self):
+        consumer = NotificationConsumer(batch_size=10)
+        channel = ScriptedChannel([
+            event('club_created', name='Chess Club'),
+            event('event_created', name='Hackathon'),
+        ])
+
+        def connect():
+            consumer.channel = channel
+            return True
+
+        consumer.connect = connect
+        consumer.start_consuming()
+
+        self.assertEqual(channel.prefetch_count, 20)
+        self.assertEqual(Notification.objects.count(), 2)
+        self.assertEqual(channel.acks, [(2, True)])
+
+    def test_stop_requested_before_connect_skips_consuming(self):
+        consumer = NotificationConsumer()
+        consumer.connect = lambda: self.fail("connect should not be attempted")
+        consumer.request_stop()
+        consumer.start_consuming()
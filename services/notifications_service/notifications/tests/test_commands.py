@@ -0,0 +1,34 @@
+"""Tests for the notification management commands."""
+
+import socket
+from io import StringIO
+from unittest import mock
+
+from django.core.management import call_command
+from django.test import SimpleTestCase
+
+
+class WaitForBrokerTests(SimpleTestCase):
+
+    def test_returns_once_port_accepts_connections(self):
+        with socket.socket() as listener:
+            listener.bind(('127.0.0.1', 0))
+            listener.listen()
+            port = listener.getsockname()[1]
+            out = StringIO()
+            env = {'RABBITMQ_HOST': '127.0.0.1', 'RABBITMQ_PORT': str(port)}
+            with mock.patch.dict('os.environ', env):
+                call_command('wait_for_broker', '--timeout', '5', stdout=out)
+
+        self.assertIn('ready', out.getvalue())
+
+    def test_gives_up_after_timeout_without_failing(self):
+        with socket.socket() as probe:
+            probe.bind(('127.0.0.1', 0))
+            port = probe.getsockname()[1]
+        err = StringIO()
+        env = {'RABBITMQ_HOST': '127.0.0.1', 'RABBITMQ_PORT': str(port)}
+        with mock.patch.dict('os.environ', env):
+            call_command('wait_for_broker', '--timeout', '0.2', '--interval', '0.05', stderr=err)
+
+        self.assertIn('not reachable', err.getvalue())
@@ -25,6 +25,14 @@ class NotificationContentECPTests(SimpleTestCase):
         self.assertEqual(subject, 'New Club Member')
         self.assertIn("Alex has joined the club as a member", message)
 
+    def test_ecp_members_added_reports_count(self):
+        subject, message = self.consumer.generate_notification_content(
+            'members_added', {'club_id': 'c1', 'count': 3, 'members': []}
+        )
+        self.assertEqual(subject, 'New Club Members')
+        self.assertIn("3 new members have joined the club.", message)
+        self.assertEqual(self.consumer.get_source_service('members_added'), 'clubs_service')
+
     def test_ecp_event_created_missing_name_uses_fallback(self):
         subject, message = self.consumer.generate_notification_content(
             'event_created', {}
@@ -39,6 +47,20 @@ class NotificationContentECPTests(SimpleTestCase):
         self.assertEqual(subject, 'Event RSVP')
         self.assertIn("Jamie has RSVP'd for the event.", message)
 
+    def test_ecp_batched_event_messages_report_count(self):
+        subject, message = self.consumer.generate_notification_content(
+            'events_created', {'count': 12, 'events': []}
+        )
+        self.assertEqual(subject, 'New Events Created')
+        self.assertIn("12 new events have been scheduled.", message)
+
+        subject, message = self.consumer.generate_notification_content(
+            'rsvps_created', {'event_id': 'e1', 'rsvps': [{}, {}]}
+        )
+        self.assertEqual(subject, 'Event RSVPs')
+        self.assertIn("2 people have RSVP'd for the event.", message)
+        self.assertEqual(self.consumer.get_source_service('rsvps_created'), 'events_service')
+
     def test_ecp_unknown_event_type_uses_default_template(self):
         subject, message = self.consumer.generate_notification_content(
             'unexpected_event', {'id': '123'}
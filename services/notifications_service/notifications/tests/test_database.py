@@ -0,0 +1,83 @@
+"""Tests for the SQLite PRAGMA profiles."""
+
+import importlib
+import os
+from unittest import mock
+
+from django.core.exceptions import ImproperlyConfigured
+from django.test import SimpleTestCase, override_settings
+
+from notifications_service import settings as project_settings
+from notifications_service.database import configure_sqlite_connection, sqlite_profile
+
+
+class RecordingConnection:
+    vendor = 'sqlite'
+
+    def __init__(self):
+        self.statements = []
+
+    def cursor(self):
+        return self
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+    def execute(self, sql):
+        self.statements.append(sql)
+
+
+class SQLiteProfileTests(SimpleTestCase):
+
+    @override_settings(SQLITE_PROFILE='tuned')
+    def test_tuned_profile_enables_wal(self):
+        connection = RecordingConnection()
+
+        configure_sqlite_connection(sender=None, connection=connection)
+
+        self.assertIn('PRAGMA journal_mode = WAL', connection.statements)
+        self.assertNotIn('busy_timeout', ' '.join(connection.statements))
+        self.assertIn('PRAGMA synchronous = NORMAL', connection.statements)
+
+    @override_settings(SQLITE_PROFILE='default')
+    def test_default_profile_leaves_connection_untouched(self):
+        connection = RecordingConnection()
+
+        configure_sqlite_connection(sender=None, connection=connection)
+
+        self.assertEqual(connection.statements, [])
+
+    @override_settings(SQLITE_PROFILE='fast')
+    def test_unknown_profile_is_a_configuration_error(self):
+        connection = RecordingConnection()
+
+        with self.assertRaisesMessage(ImproperlyConfigured, "'fast'; expected one of: default, tuned"):
+            configure_sqlite_connection(sender=None, connection=connection)
+        self.assertEqual(connection.statements, [])
+
+    def test_profiles_are_looked_up_by_name(self):
+        self.assertEqual(sqlite_profile('default'), {})
+        self.assertEqual(sqlite_profile('tuned')['journal_mode'], 'WAL')
+
+
+class ConnectionPersistenceTests(SimpleTestCase):
+
+    def load_settings(self, profile):
+        with mock.patch.dict(os.environ, {'SQLITE_PROFILE': profile}):
+            module = importlib.reload(project_settings)
+        self.addCleanup(importlib.reload, project_settings)
+        return module.DATABASES['default']
+
+    def test_tuned_profile_keeps_connections_open(self):
+        database = self.load_settings('tuned')
+
+        self.assertEqual(database['CONN_MAX_AGE'], 60)
+        self.assertTrue(database['CONN_HEALTH_CHECKS'])
+
+    def test_default_profile_closes_connections_per_request(self):
+        database = self.load_settings('default')
+
+        self.assertNotIn('CONN_MAX_AGE', database)
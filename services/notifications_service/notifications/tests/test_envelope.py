@@ -0,0 +1,91 @@
+"""Tests for message envelope encoding and per-message codec negotiation."""
+
+import json
+import os
+import unittest
+from datetime import datetime, timezone
+from unittest import mock
+
+from django.test import SimpleTestCase
+
+from notifications import envelope
+from notifications.envelope import (
+    SCHEMA_VERSION,
+    MessageDecodeError,
+    build_envelope,
+    decode_message,
+    get_codec,
+)
+
+
+class DecodeMessageTests(SimpleTestCase):
+
+    def test_legacy_json_without_content_type_is_schema_zero(self):
+        body = json.dumps({'type': 'club_created', 'data': {'name': 'Chess'}}).encode('utf-8')
+
+        message = decode_message(body)
+
+        self.assertEqual(message.version, 0)
+        self.assertEqual(message.event_type, 'club_created')
+        self.assertEqual(message.data, {'name': 'Chess'})
+        self.assertIsNone(message.event_id)
+
+    def test_json_envelope_round_trip(self):
+        occurred_at = datetime(2026, 10, 17, 12, 0, tzinfo=timezone.utc)
+        body = envelope.JSON_CODEC.dumps(
+            build_envelope('order_created', {'id': 'ORDER-1'}, event_id='evt-1', occurred_at=occurred_at)
+        )
+
+        message = decode_message(body, 'application/json; charset=utf-8')
+
+        self.assertEqual(message.version, SCHEMA_VERSION)
+        self.assertEqual(message.event_id, 'evt-1')
+        self.assertEqual(message.occurred_at, '2026-10-17T12:00:00+00:00')
+        self.assertEqual(message.data, {'id': 'ORDER-1'})
+
+    def test_rejects_newer_schema_versions(self):
+        body = json.dumps({'version': SCHEMA_VERSION + 1, 'type': 'club_created', 'data': {}}).encode()
+
+        with self.assertRaises(MessageDecodeError):
+            decode_message(body)
+
+    def test_rejects_unknown_content_types_and_malformed_bodies(self):
+        for body, content_type in (
+            (b'{}', 'application/xml'),
+            (b'not json', None),
+            (b'[1, 2]', 'application/json'),
+        ):
+            with self.subTest(content_type=content_type, body=body):
+                with self.assertRaises(MessageDecodeError):
+                    decode_message(body, content_type)
+
+    @unittest.skipIf(envelope.msgpack is None, 'msgpack is not installed')
+    def test_msgpack_envelope_round_trip(self):
+        data = {'id': '5d2f6c1e-2c1b-4a57-9a8e-0d6f1f7a9b10', 'name': 'Zoë', 'count': 3}
+        body = get_codec('msgpack').dumps(build_envelope('club_created', data))
+
+        for content_type in envelope.MSGPACK_CONTENT_TYPES:
+            with self.subTest(content_type=content_type):
+                message = decode_message(body, content_type)
+                self.assertEqual(message.version, SCHEMA_VERSION)
+                self.assertEqual(message.data, data)
+
+    @unittest.skipIf(envelope.msgpack is not None, 'msgpack is installed')
+    def test_msgpack_requires_the_package(self):
+        with self.assertRaises(ValueError):
+            get_codec('msgpack')
+        with self.assertRaises(MessageDecodeError):
+            decode_message(b'\x80', envelope.MSGPACK_CONTENT_TYPE)
+
+
+class GetCodecTests(SimpleTestCase):
+
+    def test_defaults_to_json(self):
+        with mock.patch.dict(os.environ, {}, clear=False):
+            os.environ.pop('EVENTS_MESSAGE_CODEC', None)
+            self.assertIs(get_codec(), envelope.JSON_CODEC)
+
+    def test_unknown_codec_is_rejected(self):
+        with mock.patch.dict(os.environ, {'EVENTS_MESSAGE_CODEC': 'xml'}):
+            with self.assertRaises(ValueError):
+                get_codec()
@@ -0,0 +1,117 @@
+"""Parity tests for the values-based serializer and the orjson renderer."""
+
+import datetime
+import unittest
+import uuid
+
+from django.core.exceptions import ImproperlyConfigured
+from django.test import TestCase
+from django.utils import timezone
+from rest_framework import serializers
+from rest_framework.exceptions import ErrorDetail
+from rest_framework.renderers import JSONRenderer
+from rest_framework.test import APITestCase
+
+from notifications import fastpath
+from notifications.fastpath import FastJSONRenderer, ValuesSerializer
+from notifications.models import Notification
+from notifications.serializers import NotificationSerializer
+
+
+def make_notifications():
+    Notification.objects.create(
+        event_type='club_created',
+        event_data={'id': str(uuid.uuid4()), 'name': 'Chess', 'score': 1e16, 'tags': ['a', None]},
+        user_name='Zoë \u2028 Ünal',
+        subject='Welcome \u2029 "quoted"',
+        message='Line one\nline two\x01',
+        source_service='clubs_service',
+    )
+    Notification.objects.create(
+        event_type='order_created',
+        event_data={'amount': 12.5, 'nested': {'ok': True}},
+        user_email='buyer@example.com',
+        subject='Order',
+        message='Thanks',
+        status='sent',
+        sent_at=timezone.now(),
+        source_service='payments_service',
+    )
+
+
+class ValuesSerializerTests(TestCase):
+
+    def setUp(self):
+        make_notifications()
+
+    def test_output_matches_model_serializer(self):
+        queryset = Notification.objects.order_by('-created_at')
+        list_serializer = ValuesSerializer(NotificationSerializer)
+
+        fast = list_serializer.to_representation(list_serializer.values(queryset))
+        expected = NotificationSerializer(queryset, many=True).data
+
+        self.assertEqual(JSONRenderer().render(fast), JSONRenderer().render(expected))
+
+    def test_rejects_fields_that_need_the_instance(self):
+        class NestedSerializer(serializers.ModelSerializer):
+            summary = serializers.SerializerMethodField()
+
+            class Meta:
+                model = Notification
+                fields = ['id', 'summary']
+
+            def get_summary(self, obj):
+                return obj.subject
+
+        with self.assertRaises(ImproperlyConfigured):
+            ValuesSerializer(NestedSerializer).fields
+
+
+class NotificationListParityTests(APITestCase):
+
+    def setUp(self):
+        make_notifications()
+
+    def test_list_response_is_byte_identical(self):
+        response = self.client.get('/api/notifications/', {'summary': 'false'})
+
+        expected = {
+            'next': None,
+            'previous': None,
+            'results': NotificationSerializer(Notification.objects.order_by('-created_at'), many=True).data,
+        }
+        self.assertEqual(response.content, JSONRenderer().render(expected))
+
+    def test_search_results_are_served(self):
+        response = self.client.get('/api/notifications/', {'search': 'welcome', 'summary': 'false'})
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual([row['subject'] for row in response.data['results']], ['Welcome \u2029 "quoted"'])
+
+
+@unittest.skipIf(fastpath.orjson is None, 'orjson is not installed')
+class FastJSONRendererTests(TestCase):
+
+    def assertSameBytes(self, data, accepted_media_type=None):
+        self.assertEqual(
+            FastJSONRenderer().render(data, accepted_media_type),
+            JSONRenderer().render(data, accepted_media_type),
+        )
+
+    def test_matches_json_renderer(self):
+        self.assertSameBytes({
+            'id': uuid.uuid4(),
+            'when': datetime.datetime(2026, 10, 17, 12, 30, 15, 123456, tzinfo=datetime.timezone.utc),
+            'day': datetime.date(2026, 10, 17),
+            'text': 'Zoë \u2028 \u2029 "x" \x01 \x1f \x7f </script>',
+            'error': [ErrorDetail('This field is required.', code='required')],
+            'count': 2 ** 40,
+            'flags': [True, False, None],
+            'nested': {'empty': {}, 'list': []},
+        })
+
+    def test_falls_back_for_unsupported_input(self):
+        self.assertSameBytes({1: 'int key', 'big': 2 ** 70})
+        self.assertSameBytes({'name': 'Chess'}, 'application/json; indent=4')
+        self.assertEqual(FastJSONRenderer().render(None), b'')
@@ -0,0 +1,244 @@
+"""Tests for NotificationListView and NotificationExportView."""
+
+import csv
+import io
+import json
+from unittest import mock
+
+from django.test import override_settings
+from rest_framework.test import APITestCase
+
+from notifications.models import Notification
+from notifications.search import rebuild_index
+
+
+def make_notification(event_type, status='pending', **fields):
+    defaults = {
+        'event_data': {},
+        'subject': 'Subject',
+        'message': 'Message',
+        'source_service': 'clubs_service',
+    }
+    defaults.update(fields)
+    return Notification.objects.create(event_type=event_type, status=status, **defaults)
+
+
+class NotificationSummaryTests(APITestCase):
+
+    def setUp(self):
+        make_notification('club_created')
+        make_notification('club_created', status='sent')
+        make_notification('order_created', status='failed')
+
+    def test_summary_counts_statuses_and_event_types(self):
+        response = self.client.get('/api/notifications/')
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data['summary'], {
+            'total_notifications': 3,
+            'status_counts': {'pending': 1, 'sent': 1, 'failed': 1},
+            'event_type_counts': {'club_created': 2, 'order_created': 1},
+        })
+
+    def test_summary_respects_filters(self):
+        response = self.client.get('/api/notifications/', {'event_type': 'club_created'})
+
+        self.assertEqual(response.data['summary']['total_notifications'], 2)
+        self.assertEqual(response.data['summary']['status_counts']['failed'], 0)
+
+    def test_summary_uses_a_single_query(self):
+        # Page rows and the grouped summary.
+        with self.assertNumQueries(2):
+            self.client.get('/api/notifications/')
+
+    def test_summary_can_be_skipped(self):
+        with self.assertNumQueries(1):
+            response = self.client.get('/api/notifications/', {'summary': 'false'})
+
+        self.assertNotIn('summary', response.data)
+        self.assertEqual(len(response.data['results']), 3)
+
+    def test_list_is_cursor_paginated_newest_first(self):
+        first = self.client.get('/api/notifications/', {'page_size': 2, 'summary': 'false'})
+        second = self.client.get(first.data['next'])
+
+        self.assertNotIn('count', first.data)
+        ids = [row['id'] for row in first.data['results'] + second.data['results']]
+        expected = [str(pk) for pk in Notification.objects.order_by('-created_at').values_list('id', flat=True)]
+        self.assertEqual(ids, expected)
+        self.assertIsNone(second.data['next'])
+
+
+class SearchTestMixin:
+    """Behaviour shared by both search backends."""
+
+    def setUp(self):
+        self.chess = make_notification('club_created', subject='New Club Created',
+                                       message="A new club 'Chess Club' has been created.")
+        self.robotics = make_notification('club_approved', subject='Club Approved!',
+                                          message="Your club 'Robotics' is now active.",
+                                          user_name='Priya')
+
+    def search(self, term, **params):
+        return self.client.get('/api/notifications/', {'search': term, **params})
+
+    def ids(self, term, **params):
+        return [row['id'] for row in self.search(term, **params).data['results']]
+
+    def count(self, term):
+        return len(self.search(term).data['results'])
+
+    def test_search_covers_user_name(self):
+        self.assertEqual(self.ids('priya'), [str(self.robotics.id)])
+
+    def test_search_is_case_insensitive(self):
+        self.assertEqual(self.ids('CHESS'), [str(self.chess.id)])
+
+    def test_search_follows_updates_and_deletes(self):
+        self.chess.message = 'Renamed to the Go Club.'
+        self.chess.save()
+        self.assertEqual(self.count('chess'), 0)
+        self.assertEqual(self.count('go'), 1)
+
+        self.chess.delete()
+        self.assertEqual(self.count('go'), 0)
+
+    def test_search_pages_newest_first(self):
+        response = self.search('club', page_size=1, summary='false')
+
+        self.assertEqual([row['id'] for row in response.data['results']], [str(self.robotics.id)])
+        response = self.client.get(response.data['next'])
+        self.assertEqual([row['id'] for row in response.data['results']], [str(self.chess.id)])
+        self.assertIsNone(response.data['next'])
+
+    def test_search_summary_counts_matches(self):
+        response = self.search('robot')
+
+        self.assertEqual(response.data['summary']['total_notifications'], 1)
+
+
+class LikeSearchTests(SearchTestMixin, APITestCase):
+    """The default backend matches the search text as a substring."""
+
+    def test_search_matches_substrings(self):
+        self.assertEqual(self.ids('botic'), [str(self.robotics.id)])
+        self.assertEqual(self.ids('ub appr'), [str(self.robotics.id)])
+
+    def test_words_must_appear_together_and_in_order(self):
+        self.assertEqual(self.ids('club approved'), [str(self.robotics.id)])
+        self.assertEqual(self.ids('approved club'), [])
+
+    def test_punctuation_is_matched_literally(self):
+        self.assertEqual(self.ids("'chess"), [str(self.chess.id)])
+        self.assertEqual(self.ids('"club" ('), [])
+
+    def test_rank_ordering_is_ignored(self):
+        response = self.search('club', ordering='rank', page_size=1, summary='false')
+
+        self.assertNotIn('count', response.data)
+        self.assertEqual([row['id'] for row in response.data['results']], [str(self.robotics.id)])
+
+
+@override_settings(NOTIFICATION_SEARCH_BACKEND='fts')
+class FTSSearchTests(SearchTestMixin, APITestCase):
+    """The FTS5 backend matches every search word as a word prefix, in any order."""
+
+    def test_search_matches_word_prefixes(self):
+        self.assertEqual(self.ids('robot'), [str(self.robotics.id)])
+
+    def test_search_does_not_match_inside_words(self):
+        self.assertEqual(self.ids('botic'), [])
+        self.assertEqual(self.ids('ub appr'), [])
+
+    def test_words_match_anywhere_in_any_order(self):
+        self.assertEqual(self.ids('approved club'), [str(self.robotics.id)])
+        self.assertEqual(self.ids('active chess'), [])
+
+    def test_search_ignores_query_syntax_characters(self):
+        response = self.search('"club" (')
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(response.data['results']), 2)
+
+    def test_rebuilt_index_still_matches(self):
+        rebuild_index()
+
+        self.assertEqual(self.count('chess'), 1)
+
+    def test_common_terms_match_the_same_rows(self):
+        with mock.patch('notifications.search.SELECTIVE_MATCHES', 1):
+            self.assertEqual(self.ids('club', summary='false'), [str(self.robotics.id), str(self.chess.id)])
+            self.assertEqual(self.count('robot'), 1)
+
+    def test_rank_ordering_puts_best_matches_first(self):
+        # 'club' appears three times in the older chess notification, twice in the newer one.
+        response = self.search('club', ordering='rank', page_size=1)
+
+        self.assertEqual(response.data['count'], 2)
+        self.assertEqual([row['id'] for row in response.data['results']], [str(self.chess.id)])
+        self.assertEqual(response.data['summary']['total_notifications'], 2)
+        response = self.client.get(response.data['next'])
+        self.assertEqual([row['id'] for row in response.data['results']], [str(self.robotics.id)])
+        self.assertIsNone(response.data['next'])
+
+    def test_rank_ordering_keeps_filters(self):
+        response = self.search('club', ordering='rank', event_type='club_approved')
+
+        self.assertEqual([row['id'] for row in response.data['results']], [str(self.robotics.id)])
+
+    def test_rank_ordering_needs_a_search_term(self):
+        response = self.client.get('/api/notifications/', {'ordering': 'rank', 'search': '()'})
+
+        self.assertNotIn('count', response.data)
+
+
+class NotificationExportTests(APITestCase):
+
+    def setUp(self):
+        make_notification('club_created', subject='Chess club created', event_data={'name': 'Chess'})
+        make_notification('order_created', status='sent', message='Order, "quoted"\nsecond line')
+        make_notification('club_approved', status='sent')
+
+    def export(self, **params):
+        response = self.client.get('/api/notifications/export/', params)
+        body = b''.join(response.streaming_content).decode('utf-8') if response.streaming else response.content
+        return response, body
+
+    def test_ndjson_streams_one_object_per_line(self):
+        response, body = self.export()
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response['Content-Type'], 'application/x-ndjson')
+        rows = [json.loads(line) for line in body.splitlines()]
+        self.assertEqual(len(rows), 3)
+        chess = next(row for row in rows if row['event_type'] == 'club_created')
+        self.assertEqual(chess['event_data'], {'name': 'Chess'})
+        self.assertEqual(chess['subject'], 'Chess club created')
+
+    def test_csv_has_header_and_escapes_values(self):
+        response, body = self.export(format='csv', event_type='order_created')
+
+        self.assertEqual(response.status_code, 200)
+        self.assertIn('attachment; filename="notifications.csv"', response['Content-Disposition'])
+        rows = list(csv.DictReader(io.StringIO(body)))
+        self.assertEqual(len(rows), 1)
+        self.assertEqual(rows[0]['message'], 'Order, "quoted"\nsecond line')
+        self.assertEqual(rows[0]['status'], 'sent')
+
+    def test_export_applies_list_filters(self):
+        _, body = self.export(status='sent')
+
+        self.assertEqual(len(body.splitlines()), 2)
+
+    def test_export_supports_search(self):
+        rebuild_index()
+
+        _, body = self.export(search='chess')
+
+        rows = [json.loads(line) for line in body.splitlines()]
+        self.assertEqual([row['subject'] for row in rows], ['Chess club created'])
+
+    def test_unknown_format_is_rejected(self):
+        response, _ = self.export(format='xml')
+
+        self.assertEqual(response.status_code, 400)
@@ -6,4 +6,6 @@ from . import views
 urlpatterns = [
     # List all notifications
     path('notifications/', views.NotificationListView.as_view(), name='notification-list'),
+    # Stream all matching notifications as NDJSON or CSV
+    path('notifications/export/', views.NotificationExportView.as_view(), name='notification-export'),
 ]
@@ -2,80 +2,153 @@
 
 from rest_framework import generics, status
 from rest_framework.response import Response
-from django.db.models import Q
+from django.db.models import Count
+from django.views import View
 
+from .export import export_response
+from .fastpath import ValuesSerializer
 from .models import Notification
+from .pagination import NotificationCursorPagination, NotificationRankPagination
+from .search import can_rank, search_notifications
 from .serializers import NotificationSerializer
 
 
+def filter_notifications(queryset, params, ranked=False):
+    """Apply the ``event_type``, ``status``, ``source_service``, ``user_id``
+    and ``search`` query parameters shared by the list and export views.
+
+    ``ranked`` orders ``search`` matches by relevance (see ``search_notifications``).
+    """
+    # Filter by event type if provided
+    event_type = params.get('event_type')
+    if event_type:
+        queryset = queryset.filter(event_type=event_type)
+    
+    # Filter by status if provided
+    notification_status = params.get('status')
+    if notification_status:
+        queryset = queryset.filter(status=notification_status)
+    
+    # Filter by source service if provided
+    source_service = params.get('source_service')
+    if source_service:
+        queryset = queryset.filter(source_service=source_service)
+    
+    # Filter by user if provided
+    user_id = params.get('user_id')
+    if user_id:
+        queryset = queryset.filter(user_id=user_id)
+    
+    # Search in subject and message if search query provided
+    search = params.get('search')
+    if search:
+        queryset = search_notifications(queryset, search, ranked=ranked)
+    
+    return queryset
+
+
 class NotificationListView(generics.ListAPIView):
-    """List all notifications received by the service."""
+    """List all notifications received by the service.
+    
+    Listings, including ``search`` results, are cursor-paginated newest first.
+    With the FTS search backend, ``?ordering=rank`` orders ``search`` results
+    by relevance instead, on numbered pages because relevance has no keyset
+    ordering.
+    """
     
     serializer_class = NotificationSerializer
+    # Rendered with the stock JSONRenderer rather than FastJSONRenderer:
+    # ``event_data`` can hold floats, which orjson formats differently.
+    list_serializer = ValuesSerializer(NotificationSerializer)
+    
+    def rank_search(self) -> bool:
+        """Whether ``search`` results are ordered by relevance (``?ordering=rank``)."""
+        params = self.request.query_params
+        return params.get('ordering') == 'rank' and can_rank(params.get('search', ''))
+    
+    @property
+    def paginator(self):
+        if not hasattr(self, '_paginator'):
+            if self.rank_search():
+                self._paginator = NotificationRankPagination()
+            else:
+                self._paginator = NotificationCursorPagination()
+        return self._paginator
     
     def get_queryset(self):
         """Get queryset with optional filtering."""
-        queryset = Notification.objects.all()
-        
-        # Filter by event type if provided
-        event_type = self.request.query_params.get('event_type')
-        if event_type:
-            queryset = queryset.filter(event_type=event_type)
-        
-        # Filter by status if provided
-        notification_status = self.request.query_params.get('status')
-        if notification_status:
-            queryset = queryset.filter(status=notification_status)
-        
-        # Filter by source service if provided
-        source_service = self.request.query_params.get('source_service')
-        if source_service:
-            queryset = queryset.filter(source_service=source_service)
-        
-        # Filter by user if provided
-        user_id = self.request.query_params.get('user_id')
-        if user_id:
-            queryset = queryset.filter(user_id=user_id)
+        return filter_notifications(Notification.objects.all(), self.request.query_params,
+                                    ranked=self.rank_search())
+    
+    def include_summary(self) -> bool:
+        """Whether the response should carry summary statistics (``?summary=false`` skips them)."""
+        value = self.request.query_params.get('summary', 'true')
+        return value.lower() not in ('false', '0', 'no')
+    
+    def get_summary(self, queryset) -> dict:
+        """Compute totals per status and event type with one grouped query."""
+        status_counts = {status_choice[0]: 0 for status_choice in Notification.STATUS_CHOICES}
+        event_type_counts = {}
+        total_count = 0
         
-        # Search in subject and message if search query provided
-        search = self.request.query_params.get('search')
-        if search:
-            queryset = queryset.filter(
-                Q(subject__icontains=search) | 
-                Q(message__icontains=search) |
-                Q(user_name__icontains=search)
-            )
+        rows = (
+            queryset.order_by()
+            .values_list('status', 'event_type')
+            .annotate(count=Count('*'))
+        )
+        for status_value, event_type, count in rows:
+            total_count += count
+            if status_value in status_counts:
+                status_counts[status_value] += count
+            event_type_counts[event_type] = event_type_counts.get(event_type, 0) + count
         
-        return queryset
+        return {
+            'total_notifications': total_count,
+            'status_counts': status_counts,
+            'event_type_counts': event_type_counts,
+        }
     
     def list(self, request, *args, **kwargs):
         """List notifications with additional statistics."""
         queryset = self.get_queryset()
         
         # Get paginated results
-        page = self.paginate_queryset(queryset)
+        page = self.paginate_queryset(self.list_serializer.values(queryset, 'created_at'))
         if page is not None:
-            serializer = self.get_serializer(page, many=True)
-            paginated_response = self.get_paginated_response(serializer.data)
-            
-            # Add summary statistics
-            total_count = queryset.count()
-            status_counts = {}
-            for status_choice in Notification.STATUS_CHOICES:
-                status_counts[status_choice[0]] = queryset.filter(status=status_choice[0]).count()
+            paginated_response = self.get_paginated_response(self.list_serializer.to_representation(page))
             
-            event_type_counts = {}
-            for event_type in queryset.values_list('event_type', flat=True).distinct():
-                event_type_counts[event_type] = queryset.filter(event_type=event_type).count()
-            
-            paginated_response.data['summary'] = {
-                'total_notifications': total_count,
-                'status_counts': status_counts,
-                'event_type_counts': event_type_counts,
-            }
+            # Add summary statistics unless the client opted out
+            if self.include_summary():
+                paginated_response.data['summary'] = self.get_summary(queryset)
             
             return paginated_response
         
         # If no pagination, return simple list
         serializer = self.get_serializer(queryset, many=True)
         return Response(serializer.data)
+
+
+class NotificationExportView(View):
+    """Stream every matching notification as NDJSON, or CSV with ``?format=csv``.
+
+    Accepts the same filters as the list view but no pagination or summary.
+    """
+
+    fields = [
+        'id',
+        'event_type',
+        'event_data',
+        'source_service',
+        'user_id',
+        'user_name',
+        'user_email',
+        'subject',
+        'message',
+        'status',
+        'sent_at',
+        'created_at',
+    ]
+
+    def get(self, request, *args, **kwargs):
+        queryset = filter_notifications(Notification.objects.all(), request.GET)
+        return export_response(queryset, self.fields, request.GET.get('format', 'ndjson'), 'notifications')
@@ -5,13 +5,15 @@ Django settings for notifications_service project.
 import os
 from pathlib import Path
 
+from notifications_service.database import sqlite_profile
+
 BASE_DIR = Path(__file__).resolve().parent.parent
 
 SECRET_KEY = os.environ.get('DJANGO_SECRET_KEY')
 if not SECRET_KEY:
     raise ValueError("DJANGO_SECRET_KEY environment variable is required")
 
-DEBUG = True
+DEBUG = os.environ.get('DJANGO_DEBUG', 'false').lower() in ('1', 'true', 'yes')
 
 ALLOWED_HOSTS = ['*']
 
@@ -65,6 +67,16 @@ DATABASES = {
     }
 }
 
+# PRAGMA profile applied to each SQLite connection: 'default' or 'tuned' (see database.py)
+SQLITE_PROFILE = os.environ.get('SQLITE_PROFILE', 'default')
+sqlite_profile(SQLITE_PROFILE)  # fail at startup on an unknown profile
+
+# Persistent connections, so the tuned profile's page cache and memory map
+# survive between requests and its PRAGMAs run once per connection
+if SQLITE_PROFILE == 'tuned':
+    DATABASES['default']['CONN_MAX_AGE'] = int(os.environ.get('DB_CONN_MAX_AGE', 60))
+    DATABASES['default']['CONN_HEALTH_CHECKS'] = True
+
 AUTH_PASSWORD_VALIDATORS = []
 
 LANGUAGE_CODE = 'en-us'
@@ -81,13 +93,18 @@ DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
 
 # REST Framework configuration
 REST_FRAMEWORK = {
-    'DEFAULT_PAGINATION_CLASS': 'rest_framework.pagination.PageNumberPagination',
+    'DEFAULT_PAGINATION_CLASS': 'notifications.pagination.NotificationCursorPagination',
     'PAGE_SIZE': 20,
     'DEFAULT_RENDERER_CLASSES': [
         'rest_framework.renderers.JSONRenderer',
     ],
 }
 
+# Notification search: 'like' matches substrings with an icontains scan; 'fts'
+# opts in to the SQLite FTS5 index, which matches word prefixes only and allows
+# ?ordering=rank (see notifications/search.py)
+NOTIFICATION_SEARCH_BACKEND = os.environ.get('NOTIFICATION_SEARCH_BACKEND', 'like')
+
 # Logging configuration
 LOGGING = {
     'version': 1,
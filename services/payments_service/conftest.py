@@ -0,0 +1,27 @@
+"""Pytest configuration for the payments service."""
+
+import os
+
+import django
+
+# Ensure Django settings are configured before importing app code.
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "payments_service.settings")
+django.setup()
+
+import pytest
+from django.test.utils import (
+    setup_databases,
+    setup_test_environment,
+    teardown_databases,
+    teardown_test_environment,
+)
+
+
+@pytest.fixture(scope="session", autouse=True)
+def django_test_databases():
+    """Create the test database so TestCase classes never touch db.sqlite3."""
+    setup_test_environment()
+    old_config = setup_databases(verbosity=0, interactive=False)
+    yield
+    teardown_databases(old_config, verbosity=0)
+    teardown_test_environment()
@@ -5,11 +5,25 @@ set -e
 
 echo "Using Django settings: ${DJANGO_SETTINGS_MODULE:-payments_service.settings}" 
 
-python manage.py makemigrations --noinput
-python manage.py migrate --noinput
-
-if [ -f seed_data.json ]; then
-  python manage.py loaddata seed_data.json || true
+# Migrations are committed; only migrate when some are unapplied
+if ! python manage.py migrate --check >/dev/null 2>&1; then
+  python manage.py migrate --noinput
 fi
 
-python manage.py runserver 0.0.0.0:8000
+# Load sample data on first boot only
+python manage.py load_seed_data seed_data.json
+
+# Relay domain events from the transactional outbox to RabbitMQ
+echo "Starting outbox relay..."
+python manage.py relay_outbox &
+
+# Release tickets held by expired reservations
+echo "Starting reservation expiry sweep..."
+python manage.py expire_reservations &
+
+# SERVER_MODE=development keeps the autoreloading single-process dev server;
+# anything else serves through gunicorn, sized by the GUNICORN_* variables.
+if [ "${SERVER_MODE:-production}" = "development" ]; then
+  exec python manage.py runserver 0.0.0.0:8000
+fi
+exec gunicorn payments_service.wsgi:application --config gunicorn.conf.py
@@ -1,10 +1,16 @@
 from django.contrib import admin
-from .models import TicketType, Order, OrderItem
+from .models import TicketType, TicketInventoryShard, Order, OrderItem, Reservation, ReservationItem, OutboxEvent
+
+class TicketInventoryShardInline(admin.TabularInline):
+    model = TicketInventoryShard
+    extra = 0
+
 
 @admin.register(TicketType)
 class TicketTypeAdmin(admin.ModelAdmin):
-    list_display = ("id", "event_id", "name", "price", "quantity")
+    list_display = ("id", "event_id", "name", "price", "quantity", "shard_count")
     search_fields = ("name",)
+    inlines = [TicketInventoryShardInline]
 
 
 class OrderItemInline(admin.TabularInline):
@@ -15,4 +21,22 @@ class OrderItemInline(admin.TabularInline):
 @admin.register(Order)
 class OrderAdmin(admin.ModelAdmin):
     list_display = ("id", "user_id", "total_amount", "status", "created_at")
-    inlines = [OrderItemInline]
\ No newline at end of file
+    inlines = [OrderItemInline]
+
+
+class ReservationItemInline(admin.TabularInline):
+    model = ReservationItem
+    extra = 0
+
+
+@admin.register(Reservation)
+class ReservationAdmin(admin.ModelAdmin):
+    list_display = ("id", "user_id", "status", "expires_at", "created_at")
+    list_filter = ("status",)
+    inlines = [ReservationItemInline]
+
+
+@admin.register(OutboxEvent)
+class OutboxEventAdmin(admin.ModelAdmin):
+    list_display = ("id", "event_type", "created_at")
+    list_filter = ("event_type",)
@@ -0,0 +1,30 @@
+"""Conditional GET support for detail endpoints.
+
+Validators come from a single primary-key lookup of the row's version
+timestamp, so a request whose ``If-None-Match`` or ``If-Modified-Since``
+still matches is answered with 304 before the object is loaded or
+serialized.
+"""
+
+from django.utils.decorators import method_decorator
+from django.views.decorators.http import condition
+
+
+def conditional_detail(model, field: str = 'updated_at', lookup_kwarg: str = 'pk'):
+    """Class decorator adding ETag/Last-Modified handling to a view's ``get``."""
+
+    def version(request, *args, **kwargs):
+        # condition() asks for the ETag and Last-Modified separately; query once.
+        if not hasattr(request, '_conditional_version'):
+            request._conditional_version = (
+                model.objects.filter(pk=kwargs[lookup_kwarg]).values_list(field, flat=True).first()
+            )
+        return request._conditional_version
+
+    def etag(request, *args, **kwargs):
+        value = version(request, *args, **kwargs)
+        if value is None:
+            return None
+        return str(int(value.timestamp() * 1_000_000))
+
+    return method_decorator(condition(etag_func=etag, last_modified_func=version), name='get')
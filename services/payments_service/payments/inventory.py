@@ -0,0 +1,104 @@
+"""Ticket inventory updates shared by orders and reservations.
+
+Both helpers must run inside ``transaction.atomic()``.  Rows are updated in a
+fixed order so concurrent transactions cannot deadlock on lock ordering.
+Ticket types with ``shard_count`` take and return stock through their
+:class:`~payments.models.TicketInventoryShard` rows instead of
+``TicketType.quantity``.
+"""
+
+import random
+import uuid
+from typing import Dict
+
+from django.db import transaction
+from django.db.models import F
+from rest_framework import serializers
+
+from .models import TicketInventoryShard, TicketType
+
+
+def _insufficient(ticket_type: TicketType) -> serializers.ValidationError:
+    remaining = TicketType.objects.with_stock().filter(pk=ticket_type.pk).values_list('stock', flat=True).first()
+    return serializers.ValidationError(
+        f"Not enough tickets available for {ticket_type.name}. Only {remaining or 0} left."
+    )
+
+
+def _take_from_shards(ticket_type: TicketType, quantity: int) -> None:
+    # Fast path: a single randomly chosen shard covers the whole request.
+    updated = TicketInventoryShard.objects.filter(
+        ticket_type_id=ticket_type.pk,
+        index=random.randrange(ticket_type.shard_count),
+        quantity__gte=quantity,
+    ).update(quantity=F('quantity') - quantity)
+    if updated:
+        return
+
+    # Slow path: drain shards, fullest first, until the request is covered.
+    needed = quantity
+    shards = TicketInventoryShard.objects.filter(
+        ticket_type_id=ticket_type.pk, quantity__gt=0,
+    ).order_by('-quantity').values_list('pk', 'quantity')
+    for shard_id, available in shards:
+        take = min(available, needed)
+        if TicketInventoryShard.objects.filter(pk=shard_id, quantity__gte=take).update(quantity=F('quantity') - take):
+            needed -= take
+        if not needed:
+            return
+    raise _insufficient(ticket_type)
+
+
+def take_tickets(requested: Dict[uuid.UUID, int], ticket_types: Dict[uuid.UUID, TicketType]) -> None:
+    """Decrement stock for every requested ticket type or raise ``ValidationError``.
+
+    Earlier stock checks are advisory; this conditional decrement is what
+    prevents overselling under concurrent requests.
+    """
+    for ticket_type_id in sorted(requested):
+        quantity = requested[ticket_type_id]
+        ticket_type = ticket_types[ticket_type_id]
+        if ticket_type.shard_count:
+            _take_from_shards(ticket_type, quantity)
+            continue
+        updated = TicketType.objects.filter(
+            pk=ticket_type_id, quantity__gte=quantity,
+        ).update(quantity=F('quantity') - quantity)
+        if not updated:
+            raise _insufficient(ticket_type)
+
+
+def release_tickets(quantities: Dict[uuid.UUID, int]) -> None:
+    """Return previously taken tickets to stock."""
+    shard_counts = dict(TicketType.objects.filter(pk__in=list(quantities)).values_list('pk', 'shard_count'))
+    for ticket_type_id in sorted(quantities):
+        quantity = quantities[ticket_type_id]
+        shard_count = shard_counts.get(ticket_type_id)
+        if shard_count:
+            TicketInventoryShard.objects.filter(
+                ticket_type_id=ticket_type_id, index=random.randrange(shard_count),
+            ).update(quantity=F('quantity') + quantity)
+        else:
+            TicketType.objects.filter(pk=ticket_type_id).update(quantity=F('quantity') + quantity)
+
+
+def shard_ticket_type(ticket_type_id: uuid.UUID, shard_count: int) -> TicketType:
+    """Spread a ticket type's stock evenly over ``shard_count`` shards.
+
+    ``shard_count=0`` merges the shards back into ``TicketType.quantity``.
+    """
+    with transaction.atomic():
+        ticket_type = TicketType.objects.with_stock().get(pk=ticket_type_id)
+        total = ticket_type.stock
+        TicketInventoryShard.objects.filter(ticket_type=ticket_type).delete()
+        if shard_count:
+            base, extra = divmod(total, shard_count)
+            TicketInventoryShard.objects.bulk_create([
+                TicketInventoryShard(ticket_type=ticket_type, index=index, quantity=base + (index < extra))
+                for index in range(shard_count)
+            ])
+            remainder = 0
+        else:
+            remainder = total
+        TicketType.objects.filter(pk=ticket_type.pk).update(quantity=remainder, shard_count=shard_count)
+    return TicketType.objects.with_stock().get(pk=ticket_type_id)
@@ -0,0 +1,74 @@
+"""Compare concurrent order throughput for single-row and sharded inventory."""
+
+import threading
+import time
+import uuid
+
+from django.core.management.base import BaseCommand
+from django.db import OperationalError, connection, transaction
+
+from payments.inventory import shard_ticket_type
+from payments.models import TicketType
+from payments.serializers import OrderInputSerializer
+
+from ._benchmark import benchmark_database
+
+
+class Command(BaseCommand):
+    help = 'Benchmark parallel orders against one hot ticket type in a throwaway database'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--threads', type=int, default=16)
+        parser.add_argument('--orders-per-thread', type=int, default=50)
+        parser.add_argument('--shards', type=int, default=8)
+
+    def handle(self, *args, **options):
+        threads = options['threads']
+        per_thread = options['orders_per_thread']
+
+        with benchmark_database():
+            self.stdout.write(f"{'inventory':<14}{'orders':>8}{'errors':>8}{'seconds':>10}{'orders/s':>10}")
+            for label, shards in (('single row', 0), (f"{options['shards']} shards", options['shards'])):
+                ticket_type = TicketType.objects.create(
+                    event_id=uuid.uuid4(), name='Hot', price=10.0, quantity=threads * per_thread,
+                )
+                if shards:
+                    shard_ticket_type(ticket_type.pk, shards)
+                completed, errors, elapsed = self.run(ticket_type.pk, threads, per_thread)
+                self.stdout.write(
+                    f"{label:<14}{completed:>8}{errors:>8}{elapsed:>10.2f}{completed / elapsed:>10.1f}"
+                )
+
+    def run(self, ticket_type_id, threads, per_thread):
+        payload = {'userId': 'bench', 'items': [{'ticketTypeId': str(ticket_type_id), 'quantity': 1}]}
+        counts = {'completed': 0, 'errors': 0}
+        lock = threading.Lock()
+        barrier = threading.Barrier(threads + 1)
+
+        def buyer():
+            completed = errors = 0
+            try:
+                barrier.wait()
+                for _ in range(per_thread):
+                    serializer = OrderInputSerializer(data=payload)
+                    try:
+                        serializer.is_valid(raise_exception=True)
+                        with transaction.atomic():
+                            serializer.save()
+                        completed += 1
+                    except OperationalError:
+                        errors += 1
+            finally:
+                connection.close()
+                with lock:
+                    counts['completed'] += completed
+                    counts['errors'] += errors
+
+        workers = [threading.Thread(target=buyer) for _ in range(threads)]
+        for worker in workers:
+            worker.start()
+        barrier.wait()
+        started = time.perf_counter()
+        for worker in workers:
+            worker.join()
+        return counts['completed'], counts['errors'], time.perf_counter() - started
@@ -0,0 +1,49 @@
+"""Django management command to release expired ticket reservations."""
+
+import logging
+import time
+
+from django.core.management.base import BaseCommand
+from django.db import close_old_connections
+
+from payments.reservations import expire_reservations
+
+logger = logging.getLogger(__name__)
+
+
+class Command(BaseCommand):
+    help = 'Release tickets held by expired reservations'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=500,
+                            help='Maximum number of reservations expired per transaction')
+        parser.add_argument('--interval', type=float, default=5.0,
+                            help='Seconds to sleep when no reservation is due or a sweep fails')
+        parser.add_argument('--once', action='store_true',
+                            help='Expire everything currently due and exit')
+
+    def handle(self, *args, **options):
+        batch_size = options['batch_size']
+        self.stdout.write(self.style.SUCCESS('Starting reservation expiry sweep...'))
+
+        try:
+            while True:
+                try:
+                    expired = expire_reservations(batch_size=batch_size)
+                except Exception as e:
+                    if options['once']:
+                        raise
+                    # Keep sweeping through e.g. "database is locked"; the
+                    # failed batch rolled back and is still due next pass.
+                    logger.error(f"Reservation expiry sweep failed: {e}")
+                    close_old_connections()
+                    time.sleep(options['interval'])
+                    continue
+                if expired:
+                    self.stdout.write(f'Expired {expired} reservations')
+                if expired < batch_size:
+                    if options['once']:
+                        break
+                    time.sleep(options['interval'])
+        except KeyboardInterrupt:
+            self.stdout.write(self.style.SUCCESS('Reservation expiry sweep stopped.'))
@@ -0,0 +1,26 @@
+"""Django management command to shard or merge a ticket type's inventory."""
+
+from django.core.management.base import BaseCommand, CommandError
+
+from payments.inventory import shard_ticket_type
+from payments.models import TicketType
+
+
+class Command(BaseCommand):
+    help = 'Split a ticket type\'s stock over N counter rows (0 merges them back)'
+
+    def add_arguments(self, parser):
+        parser.add_argument('ticket_type_id')
+        parser.add_argument('--shards', type=int, default=8,
+                            help='Number of counter rows; 0 returns to a single quantity column')
+
+    def handle(self, *args, **options):
+        if options['shards'] < 0:
+            raise CommandError('--shards must be zero or positive')
+        try:
+            ticket_type = shard_ticket_type(options['ticket_type_id'], options['shards'])
+        except TicketType.DoesNotExist as exc:
+            raise CommandError(f"Ticket type {options['ticket_type_id']} not found") from exc
+        self.stdout.write(self.style.SUCCESS(
+            f'{ticket_type.name}: {ticket_type.stock} tickets over {ticket_type.shard_count} shards'
+        ))
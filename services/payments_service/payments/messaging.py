@@ -0,0 +1,225 @@
+"""Pooled RabbitMQ publisher for domain events.
+
+Opening a ``pika.BlockingConnection`` costs a TCP and AMQP handshake, so the
+``relay_outbox`` command keeps its connections in a small pool and reuses
+them across batches.  Connections are created lazily, declare the ``events``
+queue once, and are transparently replaced when the broker drops them.
+"""
+
+import logging
+import os
+import queue
+import threading
+import time
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+try:
+    import pika
+    from pika.exceptions import AMQPError
+except ImportError:
+    pika = None
+    AMQPError = Exception
+
+from .envelope import JSON_CODEC, Codec, build_envelope, get_codec
+
+logger = logging.getLogger(__name__)
+
+EVENTS_QUEUE = 'events'
+
+
+class PublisherMetrics:
+    """Thread-safe counters for publish outcomes and latency."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.published = 0
+        self.failed = 0
+        self.reconnects = 0
+        self.total_latency = 0.0
+        self.max_latency = 0.0
+
+    def record_success(self, latency: float) -> None:
+        with self._lock:
+            self.published += 1
+            self.total_latency += latency
+            self.max_latency = max(self.max_latency, latency)
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self.failed += 1
+
+    def record_reconnect(self) -> None:
+        with self._lock:
+            self.reconnects += 1
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Return a copy of the counters; latencies are in milliseconds."""
+        with self._lock:
+            average = self.total_latency / self.published if self.published else 0.0
+            return {
+                'published': self.published,
+                'failed': self.failed,
+                'reconnects': self.reconnects,
+                'avg_latency_ms': average * 1000,
+                'max_latency_ms': self.max_latency * 1000,
+            }
+
+
+def encode_message(
+    event_type: str,
+    data: Dict[str, Any],
+    event_id: Optional[str] = None,
+    occurred_at: Optional[datetime] = None,
+    codec: Codec = JSON_CODEC,
+) -> bytes:
+    """Encode an enveloped message for the events queue (see ``envelope``)."""
+    return codec.dumps(build_envelope(event_type, data, event_id, occurred_at))
+
+
+class _PooledChannel:
+    """A connection/channel pair with the events queue already declared."""
+
+    def __init__(self, parameters, queue_name: str, confirm_delivery: bool = False):
+        self.connection = pika.BlockingConnection(parameters)
+        self.channel = self.connection.channel()
+        self.channel.queue_declare(queue=queue_name, durable=True)
+        if confirm_delivery:
+            self.channel.confirm_delivery()
+
+    @property
+    def is_open(self) -> bool:
+        return self.connection.is_open and self.channel.is_open
+
+    def close(self) -> None:
+        try:
+            if self.connection.is_open:
+                self.connection.close()
+        except Exception:
+            pass
+
+
+class EventPublisher:
+    """Publishes enveloped messages to RabbitMQ over a bounded connection pool.
+
+    ``pika.BlockingConnection`` is not thread-safe, so each pooled channel is
+    used by one thread at a time.  At most ``pool_size`` connections are
+    opened; additional threads wait up to ``acquire_timeout`` seconds for a
+    free one.  With ``confirm_delivery`` every publish blocks until the broker
+    has acknowledged the message.  Bodies are encoded with ``codec`` (see
+    ``envelope.get_codec``), which every published message names in its
+    ``content_type``.
+    """
+
+    def __init__(
+        self,
+        host: Optional[str] = None,
+        user: Optional[str] = None,
+        password: Optional[str] = None,
+        pool_size: Optional[int] = None,
+        acquire_timeout: float = 5.0,
+        queue_name: str = EVENTS_QUEUE,
+        confirm_delivery: bool = False,
+        codec: Optional[str] = None,
+    ):
+        self.host = host or os.environ.get('RABBITMQ_HOST', 'localhost')
+        self.user = user or os.environ.get('RABBITMQ_USER', 'guest')
+        self.password = password or os.environ.get('RABBITMQ_PASS', 'guest')
+        self.pool_size = pool_size or int(os.environ.get('RABBITMQ_POOL_SIZE', '4'))
+        self.acquire_timeout = acquire_timeout
+        self.queue_name = queue_name
+        self.confirm_delivery = confirm_delivery
+        self.codec = get_codec(codec)
+        self.metrics = PublisherMetrics()
+        self._idle: 'queue.LifoQueue[_PooledChannel]' = queue.LifoQueue()
+        self._slots = threading.BoundedSemaphore(self.pool_size)
+
+    def _parameters(self):
+        credentials = pika.PlainCredentials(self.user, self.password)
+        return pika.ConnectionParameters(host=self.host, credentials=credentials)
+
+    def properties(self, **kwargs):
+        """AMQP properties naming this publisher's codec, plus ``kwargs``."""
+        if pika is None:
+            return None
+        return pika.BasicProperties(content_type=self.codec.content_type, **kwargs)
+
+    def _acquire(self) -> _PooledChannel:
+        if not self._slots.acquire(timeout=self.acquire_timeout):
+            raise TimeoutError("Timed out waiting for a pooled RabbitMQ channel")
+        try:
+            pooled = self._idle.get_nowait()
+        except queue.Empty:
+            pooled = None
+        if pooled is not None and pooled.is_open:
+            return pooled
+        try:
+            if pooled is not None:
+                pooled.close()
+                self.metrics.record_reconnect()
+            return _PooledChannel(self._parameters(), self.queue_name, self.confirm_delivery)
+        except Exception:
+            self._slots.release()
+            raise
+
+    def _release(self, pooled: _PooledChannel, healthy: bool) -> None:
+        if healthy:
+            self._idle.put(pooled)
+        else:
+            pooled.close()
+        self._slots.release()
+
+    def publish_many(self, bodies: List[bytes], properties=None) -> int:
+        """Publish ``bodies`` in order on one channel.
+
+        Returns how many leading bodies were accepted by the broker; publishing
+        stops at the first failure so callers can retry the remainder.  The
+        broker may have closed an idle pooled connection, so after an AMQP
+        error the remaining bodies are retried once on a fresh one.
+        """
+        if pika is None or not bodies:
+            return 0
+        sent = 0
+        for attempt in range(2):
+            try:
+                pooled = self._acquire()
+            except Exception as e:
+                logger.warning(f"Could not obtain RabbitMQ channel: {e}")
+                break
+            healthy = True
+            try:
+                for body in bodies[sent:]:
+                    started = time.perf_counter()
+                    pooled.channel.basic_publish(
+                        exchange='',
+                        routing_key=self.queue_name,
+                        body=body,
+                        properties=properties,
+                        mandatory=self.confirm_delivery,
+                    )
+                    self.metrics.record_success(time.perf_counter() - started)
+                    sent += 1
+                return sent
+            except AMQPError as e:
+                healthy = False
+                self.metrics.record_reconnect()
+                logger.info(f"Publish attempt {attempt + 1} stopped after {sent} of {len(bodies)} messages: {e}")
+            except Exception:
+                healthy = False
+                logger.exception("Unexpected error while publishing batch")
+                break
+            finally:
+                self._release(pooled, healthy=healthy)
+        self.metrics.record_failure()
+        logger.warning(f"Batch publish stopped after {sent} of {len(bodies)} messages")
+        return sent
+
+    def close(self) -> None:
+        """Close every idle pooled connection."""
+        while True:
+            try:
+                pooled = self._idle.get_nowait()
+            except queue.Empty:
+                break
+            pooled.close()
+
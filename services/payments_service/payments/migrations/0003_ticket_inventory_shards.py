@@ -0,0 +1,31 @@
+# Generated by Django 4.2.30 on 2026-10-17 18:10
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('payments', '0002_reservation'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='tickettype',
+            name='shard_count',
+            field=models.PositiveSmallIntegerField(default=0),
+        ),
+        migrations.CreateModel(
+            name='TicketInventoryShard',
+            fields=[
+                ('id', models.AutoField(primary_key=True, serialize=False)),
+                ('index', models.PositiveSmallIntegerField()),
+                ('quantity', models.IntegerField(default=0)),
+                ('ticket_type', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='shards', to='payments.tickettype')),
+            ],
+            options={
+                'unique_together': {('ticket_type', 'index')},
+            },
+        ),
+    ]
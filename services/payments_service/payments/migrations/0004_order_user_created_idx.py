@@ -0,0 +1,17 @@
+# Generated by Django 4.2.30 on 2026-10-17 18:25
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('payments', '0003_ticket_inventory_shards'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='order',
+            index=models.Index(fields=['user_id', '-created_at'], name='payments_or_user_id_064188_idx'),
+        ),
+    ]
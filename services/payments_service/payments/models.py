@@ -1,19 +1,66 @@
 import uuid
 from django.db import models
+from django.db.models import OuterRef, Subquery, Sum
+from django.db.models.functions import Coalesce
+
+
+class TicketTypeQuerySet(models.QuerySet):
+
+    def with_stock(self):
+        """Annotate ``stock``: the unsharded quantity plus every shard's quantity."""
+        shard_totals = (
+            TicketInventoryShard.objects
+            .filter(ticket_type=OuterRef('pk'))
+            .values('ticket_type')
+            .annotate(total=Sum('quantity'))
+            .values('total')
+        )
+        return self.annotate(stock=models.F('quantity') + Coalesce(Subquery(shard_totals), 0))
 
 
 class TicketType(models.Model):
-    """Represents a type of ticket for an event."""
+    """Represents a type of ticket for an event.
+
+    With ``shard_count`` greater than zero the available stock is split over
+    that many :class:`TicketInventoryShard` rows so concurrent buyers update
+    different rows, and ``quantity`` holds whatever was not sharded.
+    """
     id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
     event_id = models.UUIDField()
     name = models.CharField(max_length=200)
     price = models.FloatField()
     quantity = models.IntegerField()
+    shard_count = models.PositiveSmallIntegerField(default=0)
+
+    objects = TicketTypeQuerySet.as_manager()
 
     def __str__(self) -> str:
         return f"{self.name} (${self.price:.2f})"
 
 
+class TicketInventoryShard(models.Model):
+    """One of ``TicketType.shard_count`` sub-counters of a ticket type's stock."""
+    id = models.AutoField(primary_key=True)
+    ticket_type = models.ForeignKey(TicketType, related_name='shards', on_delete=models.CASCADE)
+    index = models.PositiveSmallIntegerField()
+    quantity = models.IntegerField(default=0)
+
+    class Meta:
+        unique_together = ('ticket_type', 'index')
+
+    def __str__(self) -> str:
+        return f"{self.ticket_type_id} shard {self.index}: {self.quantity}"
+
+
+class OrderQuerySet(models.QuerySet):
+
+    def with_items(self):
+        """Load line items and their ticket types in one extra query."""
+        return self.prefetch_related(
+            models.Prefetch('items', queryset=OrderItem.objects.select_related('ticket_type'))
+        )
+
+
 class Order(models.Model):
     """Represents an order for one or more tickets."""
     STATUS_CHOICES = [
@@ -27,6 +74,18 @@ class Order(models.Model):
     status = models.CharField(max_length=20, choices=STATUS_CHOICES, default='completed')
     created_at = models.DateTimeField(auto_now_add=True)
 
+    objects = OrderQuerySet.as_manager()
+
+    class Meta:
+        indexes = [
+            # Serves a user's order history newest first.
+            models.Index(fields=['user_id', '-created_at']),
+        ]
+
+    def cache_items(self, items) -> None:
+        """Reuse freshly created line items instead of re-querying ``items``."""
+        self._prefetched_objects_cache = {'items': items}
+
     def __str__(self) -> str:
         return f"Order {self.id}"
 
@@ -39,4 +98,60 @@ class OrderItem(models.Model):
     quantity = models.IntegerField()
 
     def __str__(self) -> str:
-        return f"{self.quantity} x {self.ticket_type.name}"
\ No newline at end of file
+        return f"{self.quantity} x {self.ticket_type.name}"
+
+class Reservation(models.Model):
+    """A short-lived hold on tickets while a user checks out.
+
+    Creating a reservation takes the tickets out of ``TicketType.quantity``;
+    they are returned when the hold is cancelled or swept after
+    ``expires_at``, or kept when the reservation is confirmed into an order.
+    """
+    STATUS_CHOICES = [
+        ('active', 'Active'),
+        ('converted', 'Converted'),
+        ('cancelled', 'Cancelled'),
+        ('expired', 'Expired'),
+    ]
+    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    user_id = models.CharField(max_length=100)
+    status = models.CharField(max_length=20, choices=STATUS_CHOICES, default='active')
+    expires_at = models.DateTimeField()
+    released_at = models.DateTimeField(null=True, blank=True)
+    order = models.OneToOneField(Order, null=True, blank=True, related_name='reservation', on_delete=models.SET_NULL)
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        indexes = [
+            # Lets the expiry sweep find due holds without scanning the table.
+            models.Index(fields=['status', 'expires_at']),
+        ]
+
+    def __str__(self) -> str:
+        return f"Reservation {self.id} ({self.status})"
+
+
+class ReservationItem(models.Model):
+    """Represents a line item within a reservation."""
+    id = models.AutoField(primary_key=True)
+    reservation = models.ForeignKey(Reservation, related_name='items', on_delete=models.CASCADE)
+    ticket_type = models.ForeignKey(TicketType, on_delete=models.CASCADE)
+    quantity = models.IntegerField()
+
+    def __str__(self) -> str:
+        return f"{self.quantity} x {self.ticket_type_id}"
+
+
+class OutboxEvent(models.Model):
+    """A domain event waiting to be relayed to the RabbitMQ 'events' queue.
+
+    Rows are written in the same transaction as the domain change and removed
+    by the ``relay_outbox`` command once the broker has confirmed them.
+    """
+    id = models.BigAutoField(primary_key=True)
+    event_type = models.CharField(max_length=50)
+    payload = models.JSONField()
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    def __str__(self) -> str:
+        return f"{self.event_type} #{self.pk}"
@@ -0,0 +1,110 @@
+"""Ticket reservation lifecycle: confirm, cancel and expire holds.
+
+Every transition is claimed with a conditional ``UPDATE ... WHERE status =
+'active'`` so a hold is converted or released exactly once, even when a
+confirmation races the expiry sweep.
+"""
+
+from collections import defaultdict
+from datetime import timedelta
+from typing import Dict, Iterable, List, Optional
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models import Sum
+from django.utils import timezone
+
+from .inventory import release_tickets
+from .models import Order, OrderItem, Reservation, ReservationItem
+
+
+def hold_expiry():
+    """Expiry time for a reservation created now."""
+    return timezone.now() + timedelta(seconds=settings.TICKET_HOLD_SECONDS)
+
+
+def _quantities(items: Iterable[ReservationItem]) -> Dict:
+    quantities = defaultdict(int)
+    for item in items:
+        quantities[item.ticket_type_id] += item.quantity
+    return quantities
+
+
+def confirm_reservation(reservation: Reservation) -> Optional[Order]:
+    """Turn an active, unexpired hold into a completed order.
+
+    The held tickets were already taken from stock, so inventory is not
+    touched.  Returns ``None`` if the hold is no longer active.
+    """
+    with transaction.atomic():
+        claimed = Reservation.objects.filter(
+            pk=reservation.pk, status='active', expires_at__gt=timezone.now(),
+        ).update(status='converted')
+        if not claimed:
+            return None
+
+        items = list(reservation.items.select_related('ticket_type'))
+        total = sum(item.ticket_type.price * item.quantity for item in items)
+        order = Order.objects.create(user_id=reservation.user_id, total_amount=total, status='completed')
+        order_items = OrderItem.objects.bulk_create([
+            OrderItem(order=order, ticket_type=item.ticket_type, quantity=item.quantity)
+            for item in items
+        ])
+        Reservation.objects.filter(pk=reservation.pk).update(order=order)
+    order.cache_items(order_items)
+    return order
+
+
+def cancel_reservation(reservation: Reservation) -> bool:
+    """Release an active hold; returns ``False`` if it was no longer active."""
+    with transaction.atomic():
+        claimed = Reservation.objects.filter(pk=reservation.pk, status='active').update(
+            status='cancelled', released_at=timezone.now(),
+        )
+        if not claimed:
+            return False
+        release_tickets(_quantities(reservation.items.all()))
+    return True
+
+
+def due_reservation_pks(now, batch_size: int) -> List:
+    """Primary keys of up to ``batch_size`` active holds expired by ``now``, oldest first."""
+    return list(
+        Reservation.objects
+        .filter(status='active', expires_at__lte=now)
+        .order_by('expires_at')
+        .values_list('pk', flat=True)[:batch_size]
+    )
+
+
+def expire_reservations(batch_size: int = 500) -> int:
+    """Release up to ``batch_size`` holds past their expiry; returns how many.
+
+    The due primary keys are read once, the batch is claimed with a single
+    UPDATE by primary key, and stock is returned with one UPDATE per ticket
+    type from the items of the claimed reservations.
+    """
+    now = timezone.now()
+    with transaction.atomic():
+        pks = due_reservation_pks(now, batch_size)
+        if not pks:
+            return 0
+        expired = Reservation.objects.filter(pk__in=pks, status='active').update(status='expired', released_at=now)
+        if not expired:
+            return 0
+        if expired < len(pks):
+            # Some holds were cancelled between the read and the claim; only
+            # release stock for the ones this sweep expired.
+            pks = list(
+                Reservation.objects.filter(pk__in=pks, status='expired', released_at=now)
+                .values_list('pk', flat=True)
+            )
+
+        released = (
+            ReservationItem.objects
+            .filter(reservation_id__in=pks)
+            .values('ticket_type_id')
+            .annotate(total=Sum('quantity'))
+        )
+        release_tickets({row['ticket_type_id']: row['total'] for row in released})
+    return expired
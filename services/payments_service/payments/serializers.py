@@ -1,11 +1,19 @@
 """Serializers for the payments service."""
 
-from typing import List
+import uuid
+from typing import Dict, List
+
+from django.db import transaction
 from rest_framework import serializers
-from .models import TicketType, Order, OrderItem
+from .inventory import take_tickets
+from .models import TicketType, Order, OrderItem, Reservation, ReservationItem
+from .reservations import hold_expiry
 
 
 class TicketTypeSerializer(serializers.ModelSerializer):
+    # Expects a queryset annotated by TicketType.objects.with_stock().
+    quantity = serializers.IntegerField(source='stock', read_only=True)
+
     class Meta:
         model = TicketType
         fields = ['id', 'event_id', 'name', 'price', 'quantity']
@@ -40,29 +48,67 @@ class OrderInputSerializer(serializers.Serializer):
 
     def validate(self, data):
         items_data: List[dict] = data['items']
+        requested: Dict[uuid.UUID, int] = {}
         for item in items_data:
-            try:
-                ticket_type = TicketType.objects.get(pk=item['ticketTypeId'])
-            except TicketType.DoesNotExist as exc:
-                raise serializers.ValidationError(f"Ticket type {item['ticketTypeId']} not found") from exc
-            if item['quantity'] > ticket_type.quantity:
+            requested[item['ticketTypeId']] = requested.get(item['ticketTypeId'], 0) + item['quantity']
+
+        ticket_types = TicketType.objects.with_stock().in_bulk(list(requested))
+        for ticket_type_id, quantity in requested.items():
+            ticket_type = ticket_types.get(ticket_type_id)
+            if ticket_type is None:
+                raise serializers.ValidationError(f"Ticket type {ticket_type_id} not found")
+            if quantity > ticket_type.stock:
                 raise serializers.ValidationError(
-                    f"Not enough tickets available for {ticket_type.name}. Only {ticket_type.quantity} left."
+                    f"Not enough tickets available for {ticket_type.name}. Only {ticket_type.stock} left."
                 )
+        data['ticket_types'] = ticket_types
+        data['requested'] = requested
         return data
 
     def create(self, validated_data):
-        user_id = validated_data['userId']
-        items_data = validated_data['items']
-        total = 0.0
-        order = Order.objects.create(user_id=user_id, total_amount=0, status='completed')
-        for item in items_data:
-            ticket_type = TicketType.objects.get(pk=item['ticketTypeId'])
-            quantity = item['quantity']
-            total += ticket_type.price * quantity
-            OrderItem.objects.create(order=order, ticket_type=ticket_type, quantity=quantity)
-            ticket_type.quantity -= quantity
-            ticket_type.save()
-        order.total_amount = total
-        order.save()
-        return order
\ No newline at end of file
+        ticket_types: Dict[uuid.UUID, TicketType] = validated_data['ticket_types']
+        requested: Dict[uuid.UUID, int] = validated_data['requested']
+        total = sum(ticket_types[item['ticketTypeId']].price * item['quantity'] for item in validated_data['items'])
+
+        with transaction.atomic():
+            take_tickets(requested, ticket_types)
+            order = Order.objects.create(user_id=validated_data['userId'], total_amount=total, status='completed')
+            items = OrderItem.objects.bulk_create([
+                OrderItem(order=order, ticket_type=ticket_types[item['ticketTypeId']], quantity=item['quantity'])
+                for item in validated_data['items']
+            ])
+        order.cache_items(items)
+        return order
+
+
+class ReservationItemSerializer(OrderItemSerializer):
+    class Meta(OrderItemSerializer.Meta):
+        model = ReservationItem
+
+
+class ReservationSerializer(serializers.ModelSerializer):
+    items = ReservationItemSerializer(many=True, read_only=True)
+
+    class Meta:
+        model = Reservation
+        fields = ['id', 'user_id', 'status', 'expires_at', 'created_at', 'items']
+
+
+class ReservationInputSerializer(OrderInputSerializer):
+    """Validates like an order but holds the tickets instead of buying them."""
+
+    def create(self, validated_data):
+        ticket_types: Dict[uuid.UUID, TicketType] = validated_data['ticket_types']
+
+        with transaction.atomic():
+            take_tickets(validated_data['requested'], ticket_types)
+            reservation = Reservation.objects.create(user_id=validated_data['userId'], expires_at=hold_expiry())
+            ReservationItem.objects.bulk_create([
+                ReservationItem(
+                    reservation=reservation,
+                    ticket_type=ticket_types[item['ticketTypeId']],
+                    quantity=item['quantity'],
+                )
+                for item in validated_data['items']
+            ])
+        return reservation
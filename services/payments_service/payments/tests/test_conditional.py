@@ -0,0 +1,54 @@
+"""Conditional GET on the order detail endpoint."""
+
+import uuid
+
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.utils.http import http_date
+from rest_framework.test import APITestCase
+
+from payments.models import Order, OrderItem, TicketType
+
+
+class OrderConditionalGetTests(APITestCase):
+
+    def setUp(self):
+        ticket_type = TicketType.objects.create(event_id=uuid.uuid4(), name='GA', price=10.0, quantity=100)
+        self.order = Order.objects.create(user_id='user-1', total_amount=10.0)
+        OrderItem.objects.create(order=self.order, ticket_type=ticket_type, quantity=1)
+        self.path = f'/orders/{self.order.pk}/'
+
+    def test_response_carries_validators(self):
+        response = self.client.get(self.path)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response['ETag'])
+        self.assertEqual(response['Last-Modified'], http_date(self.order.created_at.timestamp()))
+
+    def test_matching_etag_returns_304_with_one_query(self):
+        etag = self.client.get(self.path)['ETag']
+
+        with CaptureQueriesContext(connection) as context:
+            response = self.client.get(self.path, HTTP_IF_NONE_MATCH=etag)
+
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response.content, b'')
+        self.assertEqual(len(context.captured_queries), 1)
+
+    def test_stale_etag_returns_full_body(self):
+        response = self.client.get(self.path, HTTP_IF_NONE_MATCH='"stale"')
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data['id'], str(self.order.pk))
+
+    def test_if_modified_since_returns_304(self):
+        last_modified = self.client.get(self.path)['Last-Modified']
+
+        response = self.client.get(self.path, HTTP_IF_MODIFIED_SINCE=last_modified)
+
+        self.assertEqual(response.status_code, 304)
+
+    def test_missing_order_is_still_404(self):
+        response = self.client.get(f'/orders/{uuid.uuid4()}/', HTTP_IF_NONE_MATCH='"anything"')
+
+        self.assertEqual(response.status_code, 404)
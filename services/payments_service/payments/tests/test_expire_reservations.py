@@ -0,0 +1,41 @@
+"""Tests for the expire_reservations management command loop."""
+
+import io
+from unittest import mock
+
+from django.core.management import call_command
+from django.db import OperationalError
+from django.test import SimpleTestCase
+
+COMMAND = 'payments.management.commands.expire_reservations'
+
+
+@mock.patch(f'{COMMAND}.time.sleep')
+class ExpireReservationsCommandTests(SimpleTestCase):
+
+    def test_failed_sweep_is_logged_and_retried(self, sleep):
+        outcomes = [OperationalError('database is locked'), 500, 3, KeyboardInterrupt()]
+        out = io.StringIO()
+        with mock.patch(f'{COMMAND}.expire_reservations', side_effect=outcomes) as expire, \
+                self.assertLogs(COMMAND, 'ERROR') as logs:
+            call_command('expire_reservations', '--interval', '2', stdout=out)
+
+        self.assertEqual(expire.call_count, 4)
+        self.assertIn('Reservation expiry sweep failed: database is locked', logs.output[0])
+        self.assertEqual(sleep.call_args_list, [mock.call(2.0), mock.call(2.0)])
+        self.assertIn('Expired 500 reservations', out.getvalue())
+        self.assertIn('Reservation expiry sweep stopped.', out.getvalue())
+
+    def test_once_propagates_failures(self, sleep):
+        with mock.patch(f'{COMMAND}.expire_reservations', side_effect=OperationalError('database is locked')):
+            with self.assertRaises(OperationalError):
+                call_command('expire_reservations', '--once', stdout=io.StringIO())
+
+        sleep.assert_not_called()
+
+    def test_once_stops_when_nothing_is_left(self, sleep):
+        with mock.patch(f'{COMMAND}.expire_reservations', side_effect=[500, 0]) as expire:
+            call_command('expire_reservations', '--once', stdout=io.StringIO())
+
+        self.assertEqual(expire.call_count, 2)
+        sleep.assert_not_called()
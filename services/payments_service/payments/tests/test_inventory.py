@@ -0,0 +1,62 @@
+"""Tests for sharded ticket inventory."""
+
+import uuid
+
+from django.db import transaction
+from rest_framework.test import APITestCase
+
+from payments.inventory import release_tickets, shard_ticket_type
+from payments.models import TicketInventoryShard, TicketType
+
+
+class ShardedInventoryTests(APITestCase):
+
+    def setUp(self):
+        self.event_id = uuid.uuid4()
+        ticket_type = TicketType.objects.create(event_id=self.event_id, name='General', price=5.0, quantity=10)
+        self.ticket_type = shard_ticket_type(ticket_type.pk, 4)
+
+    def shard_quantities(self):
+        return list(TicketInventoryShard.objects.filter(ticket_type=self.ticket_type)
+                    .order_by('index').values_list('quantity', flat=True))
+
+    def order(self, quantity):
+        payload = {'userId': 'user-1', 'items': [{'ticketTypeId': str(self.ticket_type.id), 'quantity': quantity}]}
+        return self.client.post('/orders/', payload, format='json')
+
+    def test_sharding_spreads_stock_evenly(self):
+        self.assertEqual(self.shard_quantities(), [3, 3, 2, 2])
+        self.assertEqual(self.ticket_type.quantity, 0)
+        self.assertEqual(self.ticket_type.stock, 10)
+
+    def test_ticket_list_reports_summed_stock(self):
+        self.order(1)
+
+        response = self.client.get(f'/events/{self.event_id}/tickets/')
+
+        self.assertEqual(response.data[0]['quantity'], 9)
+
+    def test_order_larger_than_any_shard_drains_several(self):
+        self.assertEqual(self.order(7).status_code, 201)
+
+        self.assertEqual(sum(self.shard_quantities()), 3)
+        self.assertTrue(all(quantity >= 0 for quantity in self.shard_quantities()))
+
+    def test_order_beyond_total_stock_is_rejected(self):
+        self.assertEqual(self.order(11).status_code, 400)
+        self.assertEqual(sum(self.shard_quantities()), 10)
+
+    def test_released_tickets_return_to_a_shard(self):
+        self.order(4)
+        with transaction.atomic():
+            release_tickets({self.ticket_type.pk: 4})
+
+        self.assertEqual(sum(self.shard_quantities()), 10)
+
+    def test_merging_restores_single_row_counter(self):
+        self.order(3)
+
+        ticket_type = shard_ticket_type(self.ticket_type.pk, 0)
+
+        self.assertEqual((ticket_type.quantity, ticket_type.shard_count), (7, 0))
+        self.assertEqual(self.shard_quantities(), [])
@@ -0,0 +1,128 @@
+"""Tests for the pooled RabbitMQ publisher."""
+
+from unittest import mock
+
+from django.test import SimpleTestCase
+from pika.exceptions import AMQPError, StreamLostError
+
+from payments.messaging import EventPublisher, PublisherMetrics
+
+
+def fake_connection(*args, **kwargs):
+    connection = mock.MagicMock(name='BlockingConnection')
+    connection.is_open = True
+    connection.channel.return_value.is_open = True
+    return connection
+
+
+@mock.patch('payments.messaging.pika.BlockingConnection', side_effect=fake_connection)
+class EventPublisherPoolTests(SimpleTestCase):
+
+    def test_released_channel_is_reused(self, connect):
+        publisher = EventPublisher(pool_size=1, acquire_timeout=0.01)
+
+        self.assertEqual(publisher.publish_many([b'a']), 1)
+        self.assertEqual(publisher.publish_many([b'b', b'c']), 2)
+
+        connect.assert_called_once()
+        pooled = publisher._idle.queue[0]
+        published = [call.kwargs['body'] for call in pooled.channel.basic_publish.call_args_list]
+        self.assertEqual(published, [b'a', b'b', b'c'])
+        self.assertEqual(publisher.metrics.snapshot()['published'], 3)
+        self.assertEqual(publisher.metrics.snapshot()['reconnects'], 0)
+
+    def test_acquire_times_out_when_the_pool_is_exhausted(self, connect):
+        publisher = EventPublisher(pool_size=1, acquire_timeout=0.01)
+        pooled = publisher._acquire()
+
+        with self.assertRaises(TimeoutError):
+            publisher._acquire()
+        publisher._release(pooled, healthy=True)
+        self.assertIs(publisher._acquire(), pooled)
+
+    def test_closed_channel_is_replaced(self, connect):
+        publisher = EventPublisher(pool_size=1)
+        publisher.publish_many([b'a'])
+        stale = publisher._idle.queue[0]
+        stale.channel.is_open = False
+
+        self.assertEqual(publisher.publish_many([b'b']), 1)
+
+        self.assertEqual(connect.call_count, 2)
+        stale.connection.close.assert_called_once_with()
+        self.assertIsNot(publisher._idle.queue[0], stale)
+        self.assertEqual(publisher.metrics.snapshot()['reconnects'], 1)
+
+    def test_broker_error_retries_the_remainder_on_a_fresh_channel(self, connect):
+        publisher = EventPublisher(pool_size=1, confirm_delivery=True)
+        publisher.publish_many([b'warm-up'])
+        stale = publisher._idle.queue[0]
+        stale.channel.basic_publish.side_effect = [None, StreamLostError('connection reset')]
+
+        self.assertEqual(publisher.publish_many([b'a', b'b', b'c']), 3)
+
+        fresh = publisher._idle.queue[0]
+        self.assertIsNot(fresh, stale)
+        stale.connection.close.assert_called_once_with()
+        published = [call.kwargs['body'] for call in fresh.channel.basic_publish.call_args_list]
+        self.assertEqual(published, [b'b', b'c'])
+        self.assertTrue(all(call.kwargs['mandatory'] for call in fresh.channel.basic_publish.call_args_list))
+        metrics = publisher.metrics.snapshot()
+        self.assertEqual((metrics['published'], metrics['failed'], metrics['reconnects']), (4, 0, 1))
+
+    def test_publish_stops_after_a_second_broker_error(self, connect):
+        publisher = EventPublisher(pool_size=1)
+        publisher.publish_many([b'warm-up'])
+        publisher._idle.queue[0].channel.basic_publish.side_effect = AMQPError('gone')
+        connect.side_effect = None
+        connect.return_value = fake_connection()
+        connect.return_value.channel.return_value.basic_publish.side_effect = [None, AMQPError('gone')]
+
+        self.assertEqual(publisher.publish_many([b'a', b'b', b'c']), 1)
+
+        metrics = publisher.metrics.snapshot()
+        self.assertEqual((metrics['published'], metrics['failed'], metrics['reconnects']), (2, 1, 2))
+        self.assertEqual(len(publisher._idle.queue), 0)
+
+    def test_unreachable_broker_publishes_nothing(self, connect):
+        connect.side_effect = AMQPError('connection refused')
+        publisher = EventPublisher(pool_size=1)
+
+        with self.assertLogs('payments.messaging', 'WARNING'):
+            self.assertEqual(publisher.publish_many([b'a']), 0)
+
+        self.assertEqual(publisher.metrics.snapshot()['failed'], 1)
+        # The slot taken for the failed connection attempt was given back.
+        self.assertTrue(publisher._slots.acquire(blocking=False))
+
+    def test_close_closes_idle_connections(self, connect):
+        publisher = EventPublisher(pool_size=2)
+        publisher.publish_many([b'a'])
+        pooled = publisher._idle.queue[0]
+
+        publisher.close()
+
+        pooled.connection.close.assert_called_once_with()
+        self.assertEqual(len(publisher._idle.queue), 0)
+
+
+class PublisherMetricsTests(SimpleTestCase):
+
+    def test_snapshot_reports_latency_in_milliseconds(self):
+        metrics = PublisherMetrics()
+        metrics.record_success(0.002)
+        metrics.record_success(0.004)
+        metrics.record_failure()
+        metrics.record_reconnect()
+
+        snapshot = metrics.snapshot()
+
+        self.assertEqual(
+            {key: snapshot[key] for key in ('published', 'failed', 'reconnects')},
+            {'published': 2, 'failed': 1, 'reconnects': 1},
+        )
+        self.assertAlmostEqual(snapshot['avg_latency_ms'], 3.0)
+        self.assertAlmostEqual(snapshot['max_latency_ms'], 4.0)
+
+    def test_empty_snapshot_has_zero_latency(self):
+        self.assertEqual(PublisherMetrics().snapshot()['avg_latency_ms'], 0.0)
@@ -0,0 +1,106 @@
+"""Tests for order creation and ticket inventory."""
+
+import threading
+import uuid
+
+from django.db import connection
+from django.test import TransactionTestCase
+from rest_framework import serializers
+from rest_framework.test import APIClient, APITestCase
+
+from payments.inventory import shard_ticket_type
+from payments.models import Order, OrderItem, TicketType
+from payments.serializers import OrderInputSerializer
+
+
+def order_payload(*items, user_id='user-1'):
+    return {
+        'userId': user_id,
+        'items': [{'ticketTypeId': str(ticket_type.id), 'quantity': quantity} for ticket_type, quantity in items],
+    }
+
+
+class OrderCreateTests(APITestCase):
+
+    def setUp(self):
+        event_id = uuid.uuid4()
+        self.general = TicketType.objects.create(event_id=event_id, name='General', price=10.0, quantity=5)
+        self.vip = TicketType.objects.create(event_id=event_id, name='VIP', price=50.0, quantity=2)
+
+    def test_order_decrements_inventory_and_totals_items(self):
+        response = self.client.post('/orders/', order_payload((self.general, 3), (self.vip, 1)), format='json')
+
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(response.data['total_amount'], 80.0)
+        self.general.refresh_from_db()
+        self.vip.refresh_from_db()
+        self.assertEqual((self.general.quantity, self.vip.quantity), (2, 1))
+
+    def test_repeated_ticket_type_is_checked_against_combined_quantity(self):
+        response = self.client.post('/orders/', order_payload((self.vip, 1), (self.vip, 2)), format='json')
+
+        self.assertEqual(response.status_code, 400)
+        self.vip.refresh_from_db()
+        self.assertEqual(self.vip.quantity, 2)
+
+    def test_stock_sold_after_validation_leaves_no_partial_order(self):
+        serializer = OrderInputSerializer(data=order_payload((self.general, 1), (self.vip, 1)))
+        self.assertTrue(serializer.is_valid())
+        # Another buyer takes the last VIP tickets between validation and creation.
+        TicketType.objects.filter(pk=self.vip.pk).update(quantity=0)
+
+        with self.assertRaises(serializers.ValidationError):
+            serializer.save()
+
+        self.general.refresh_from_db()
+        self.assertEqual(self.general.quantity, 5)
+        self.assertFalse(Order.objects.exists())
+
+    def test_unknown_ticket_type_is_rejected(self):
+        payload = {'userId': 'user-1', 'items': [{'ticketTypeId': str(uuid.uuid4()), 'quantity': 1}]}
+
+        response = self.client.post('/orders/', payload, format='json')
+
+        self.assertEqual(response.status_code, 400)
+
+
+class ConcurrentOrderTests(TransactionTestCase):
+    """Stress test: parallel buyers racing for the same ticket type."""
+
+    def test_parallel_orders_never_oversell(self):
+        ticket_type = TicketType.objects.create(event_id=uuid.uuid4(), name='Flash', price=5.0, quantity=10)
+        self.assert_no_oversell(ticket_type, stock=10, buyers=25)
+
+    def test_parallel_orders_never_oversell_sharded_inventory(self):
+        ticket_type = TicketType.objects.create(event_id=uuid.uuid4(), name='Flash', price=5.0, quantity=10)
+        ticket_type = shard_ticket_type(ticket_type.pk, 4)
+        self.assert_no_oversell(ticket_type, stock=10, buyers=25)
+
+    def assert_no_oversell(self, ticket_type, stock, buyers):
+        barrier = threading.Barrier(buyers)
+        statuses = []
+        lock = threading.Lock()
+
+        def buy(index):
+            try:
+                barrier.wait()
+                response = APIClient().post(
+                    '/orders/', order_payload((ticket_type, 1), user_id=f'user-{index}'), format='json',
+                )
+                with lock:
+                    statuses.append(response.status_code)
+            finally:
+                connection.close()
+
+        threads = [threading.Thread(target=buy, args=(index,)) for index in range(buyers)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        remaining = TicketType.objects.with_stock().get(pk=ticket_type.pk).stock
+        sold = sum(OrderItem.objects.values_list('quantity', flat=True))
+        self.assertEqual(sorted(statuses), [201] * stock + [400] * (buyers - stock))
+        self.assertEqual(remaining, 0)
+        self.assertEqual(sold, stock)
+        self.assertEqual(Order.objects.count(), stock)
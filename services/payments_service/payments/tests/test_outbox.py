@@ -0,0 +1,65 @@
+"""Tests for relaying outbox events to the broker."""
+
+from django.test import TestCase
+
+from payments.envelope import JSON_CODEC, decode_message
+from payments.models import OutboxEvent
+from payments.outbox import enqueue_event, outbox_event_id, relay_batch
+
+
+class FakePublisher:
+    """Records published bodies and confirms only the first ``accept`` of each batch."""
+
+    codec = JSON_CODEC
+
+    def __init__(self, accept=None):
+        self.accept = accept
+        self.batches = []
+
+    def properties(self, **kwargs):
+        return None
+
+    def publish_many(self, bodies, properties=None):
+        self.batches.append(list(bodies))
+        return len(bodies) if self.accept is None else min(self.accept, len(bodies))
+
+
+class RelayBatchTests(TestCase):
+
+    def setUp(self):
+        self.events = [enqueue_event('order.created', {'n': n}) for n in range(5)]
+
+    def test_partial_publish_deletes_only_the_confirmed_prefix(self):
+        sent = relay_batch(FakePublisher(accept=2))
+
+        self.assertEqual(sent, 2)
+        remaining = list(OutboxEvent.objects.order_by('id').values_list('pk', flat=True))
+        self.assertEqual(remaining, [event.pk for event in self.events[2:]])
+
+    def test_unconfirmed_events_are_published_in_id_order(self):
+        publisher = FakePublisher(accept=2)
+        relay_batch(publisher)
+        relay_batch(publisher)
+
+        first, second = publisher.batches
+        self.assertEqual([decode_message(body).data['n'] for body in first], [0, 1, 2, 3, 4])
+        self.assertEqual([decode_message(body).data['n'] for body in second], [2, 3, 4])
+
+    def test_republished_event_keeps_its_event_id(self):
+        publisher = FakePublisher(accept=0)
+        self.assertEqual(relay_batch(publisher), 0)
+        publisher.accept = None
+        self.assertEqual(relay_batch(publisher), 5)
+
+        first, second = publisher.batches
+        self.assertEqual(
+            [decode_message(body).event_id for body in first],
+            [decode_message(body).event_id for body in second],
+        )
+        self.assertEqual(decode_message(second[0]).event_id, outbox_event_id(self.events[0]))
+        self.assertFalse(OutboxEvent.objects.exists())
+
+    def test_batch_size_limits_the_events_read(self):
+        publisher = FakePublisher()
+        self.assertEqual(relay_batch(publisher, batch_size=3), 3)
+        self.assertEqual(OutboxEvent.objects.count(), 2)
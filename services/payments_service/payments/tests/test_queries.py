@@ -0,0 +1,87 @@
+"""Query-count budgets for the order endpoints."""
+
+import uuid
+
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APITestCase
+
+from payments.models import Order, OrderItem, TicketType
+
+
+class OrderQueryBudgetTests(APITestCase):
+
+    def setUp(self):
+        event_id = uuid.uuid4()
+        self.ticket_types = [
+            TicketType.objects.create(event_id=event_id, name=f'Tier {index}', price=10.0 + index, quantity=100)
+            for index in range(5)
+        ]
+
+    def make_order(self, lines):
+        order = Order.objects.create(user_id='user-1', total_amount=0)
+        OrderItem.objects.bulk_create([
+            OrderItem(order=order, ticket_type=ticket_type, quantity=1)
+            for ticket_type in self.ticket_types[:lines]
+        ])
+        return order
+
+    def count_queries(self, method, path, data=None):
+        with CaptureQueriesContext(connection) as context:
+            response = getattr(self.client, method)(path, data, format='json')
+        self.assertLess(response.status_code, 300, response.data)
+        return len(context.captured_queries)
+
+    def test_order_detail_is_constant_in_line_items(self):
+        one_line = self.make_order(1)
+        five_lines = self.make_order(5)
+
+        # Conditional-GET validator, order row, items joined to ticket types.
+        self.assertEqual(self.count_queries('get', f'/orders/{one_line.pk}/'), 3)
+        self.assertEqual(self.count_queries('get', f'/orders/{five_lines.pk}/'), 3)
+
+    def test_order_create_does_not_reread_its_items(self):
+        payload = {
+            'userId': 'user-1',
+            'items': [{'ticketTypeId': str(ticket_type.id), 'quantity': 1} for ticket_type in self.ticket_types],
+        }
+
+        queries = self.count_queries('post', '/orders/', payload)
+
+        # Stock lookup, one decrement per ticket type, order and item inserts,
+        # the outbox insert, plus two savepoints and their releases.
+        self.assertEqual(queries, 1 + len(self.ticket_types) + 2 + 1 + 4)
+
+    def test_reservation_confirm_does_not_reread_order_items(self):
+        payload = {'userId': 'user-1', 'items': [{'ticketTypeId': str(self.ticket_types[0].id), 'quantity': 1}]}
+        reservation_id = self.client.post('/reservations/', payload, format='json').data['id']
+
+        queries = self.count_queries('post', f'/reservations/{reservation_id}/confirm/')
+
+        # Reservation lookup, claim, held items, order and item inserts, order
+        # link, outbox insert, plus two savepoints and their releases.
+        self.assertEqual(queries, 7 + 4)
+
+
+class UserOrderHistoryTests(APITestCase):
+
+    def setUp(self):
+        self.ticket_type = TicketType.objects.create(event_id=uuid.uuid4(), name='General', price=5.0, quantity=100)
+        self.orders = []
+        for _ in range(3):
+            order = Order.objects.create(user_id='heavy-buyer', total_amount=5.0)
+            OrderItem.objects.create(order=order, ticket_type=self.ticket_type, quantity=1)
+            self.orders.append(order)
+        Order.objects.create(user_id='someone-else', total_amount=0)
+
+    def test_history_is_newest_first_and_paginated(self):
+        first = self.client.get('/users/heavy-buyer/orders/', {'page_size': 2})
+        second = self.client.get(first.data['next'])
+
+        ids = [row['id'] for row in first.data['results'] + second.data['results']]
+        self.assertEqual(ids, [str(order.pk) for order in reversed(self.orders)])
+        self.assertEqual(first.data['results'][0]['items'][0]['ticketTypeName'], 'General')
+
+    def test_history_page_uses_two_queries(self):
+        with self.assertNumQueries(2):
+            self.client.get('/users/heavy-buyer/orders/')
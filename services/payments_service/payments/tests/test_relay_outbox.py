@@ -0,0 +1,65 @@
+"""Tests for the relay_outbox management command loop."""
+
+import io
+from unittest import mock
+
+from django.core.management import call_command
+from django.test import SimpleTestCase
+
+from payments.messaging import PublisherMetrics
+
+COMMAND = 'payments.management.commands.relay_outbox'
+
+
+@mock.patch(f'{COMMAND}.time.sleep')
+@mock.patch(f'{COMMAND}.EventPublisher')
+class RelayOutboxCommandTests(SimpleTestCase):
+
+    def setUp(self):
+        self.metrics = PublisherMetrics()
+
+    def publisher(self, publisher_class):
+        publisher_class.return_value.metrics = self.metrics
+        return publisher_class.return_value
+
+    def test_failed_batch_is_logged_and_retried(self, publisher_class, sleep):
+        self.publisher(publisher_class)
+        outcomes = [ConnectionError('broker down'), 100, 0, KeyboardInterrupt()]
+        with mock.patch(f'{COMMAND}.relay_batch', side_effect=outcomes) as relay_batch, \
+                self.assertLogs(COMMAND, 'ERROR') as logs:
+            call_command('relay_outbox', '--interval', '2', stdout=io.StringIO())
+
+        self.assertEqual(relay_batch.call_count, 4)
+        self.assertIn('Outbox relay batch failed: broker down', logs.output[0])
+        self.assertEqual(sleep.call_args_list, [mock.call(2.0), mock.call(2.0)])
+        publisher_class.return_value.close.assert_called_once_with()
+
+    def test_once_propagates_failures(self, publisher_class, sleep):
+        self.publisher(publisher_class)
+        with mock.patch(f'{COMMAND}.relay_batch', side_effect=ConnectionError('broker down')):
+            with self.assertRaises(ConnectionError):
+                call_command('relay_outbox', '--once', stdout=io.StringIO())
+
+        sleep.assert_not_called()
+        publisher_class.return_value.close.assert_called_once_with()
+
+    def test_metrics_are_logged_every_n_batches_and_on_exit(self, publisher_class, sleep):
+        self.publisher(publisher_class)
+        self.metrics.record_success(0.003)
+        outcomes = [10, 10, 0, 10, 10, KeyboardInterrupt()]
+        with mock.patch(f'{COMMAND}.relay_batch', side_effect=outcomes), \
+                self.assertLogs(COMMAND, 'INFO') as logs:
+            call_command('relay_outbox', '--batch-size', '10', '--metrics-every', '2', stdout=io.StringIO())
+
+        self.assertEqual(len(logs.output), 3)
+        self.assertIn('Publisher metrics: published=1 failed=0 reconnects=0 avg_latency_ms=3.00', logs.output[0])
+
+    def test_metrics_every_zero_logs_only_on_exit(self, publisher_class, sleep):
+        self.publisher(publisher_class)
+        with mock.patch(f'{COMMAND}.relay_batch', side_effect=[10, 10, 0]), \
+                self.assertLogs(COMMAND, 'INFO') as logs:
+            call_command('relay_outbox', '--batch-size', '10', '--metrics-every', '0', '--once',
+                         stdout=io.StringIO())
+
+        self.assertEqual(len(logs.output), 1)
+        self.assertIn('Publisher metrics: published=0', logs.output[0])
@@ -0,0 +1,115 @@
+"""Tests for ticket reservation holds."""
+
+import uuid
+from datetime import timedelta
+from unittest import mock
+
+from django.utils import timezone
+from rest_framework.test import APITestCase
+
+from payments.models import Order, OutboxEvent, Reservation, TicketType
+from payments.reservations import due_reservation_pks, expire_reservations
+
+
+class ReservationTests(APITestCase):
+
+    def setUp(self):
+        self.ticket_type = TicketType.objects.create(
+            event_id=uuid.uuid4(), name='General', price=12.5, quantity=10,
+        )
+
+    def reserve(self, quantity=3, user_id='user-1'):
+        payload = {'userId': user_id, 'items': [{'ticketTypeId': str(self.ticket_type.id), 'quantity': quantity}]}
+        return self.client.post('/reservations/', payload, format='json')
+
+    def remaining(self):
+        self.ticket_type.refresh_from_db()
+        return self.ticket_type.quantity
+
+    def expire(self, reservation_id):
+        Reservation.objects.filter(pk=reservation_id).update(expires_at=timezone.now() - timedelta(seconds=1))
+
+    def test_reservation_holds_inventory(self):
+        response = self.reserve(3)
+
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(response.data['status'], 'active')
+        self.assertEqual(response.data['items'][0]['quantity'], 3)
+        self.assertEqual(self.remaining(), 7)
+
+    def test_reservation_cannot_exceed_stock(self):
+        response = self.reserve(11)
+
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(self.remaining(), 10)
+
+    def test_confirm_converts_hold_into_order(self):
+        reservation_id = self.reserve(2).data['id']
+
+        response = self.client.post(f'/reservations/{reservation_id}/confirm/')
+
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(response.data['total_amount'], 25.0)
+        self.assertEqual(self.remaining(), 8)
+        reservation = Reservation.objects.get(pk=reservation_id)
+        self.assertEqual(reservation.status, 'converted')
+        self.assertEqual(str(reservation.order_id), response.data['id'])
+        self.assertTrue(OutboxEvent.objects.filter(event_type='order_created').exists())
+
+    def test_confirm_is_single_use(self):
+        reservation_id = self.reserve(2).data['id']
+        self.client.post(f'/reservations/{reservation_id}/confirm/')
+
+        response = self.client.post(f'/reservations/{reservation_id}/confirm/')
+
+        self.assertEqual(response.status_code, 409)
+        self.assertEqual(Order.objects.count(), 1)
+
+    def test_expired_hold_cannot_be_confirmed(self):
+        reservation_id = self.reserve(2).data['id']
+        self.expire(reservation_id)
+
+        response = self.client.post(f'/reservations/{reservation_id}/confirm/')
+
+        self.assertEqual(response.status_code, 409)
+        self.assertFalse(Order.objects.exists())
+
+    def test_cancel_releases_inventory_once(self):
+        reservation_id = self.reserve(4).data['id']
+
+        self.assertEqual(self.client.delete(f'/reservations/{reservation_id}/').status_code, 204)
+        self.assertEqual(self.client.delete(f'/reservations/{reservation_id}/').status_code, 409)
+        self.assertEqual(self.remaining(), 10)
+
+    def test_sweep_releases_only_expired_holds(self):
+        expired_ids = [self.reserve(2, user_id=f'user-{index}').data['id'] for index in range(3)]
+        self.reserve(1, user_id='still-shopping')
+        for reservation_id in expired_ids:
+            self.expire(reservation_id)
+
+        self.assertEqual(expire_reservations(batch_size=2), 2)
+        self.assertEqual(expire_reservations(batch_size=2), 1)
+        self.assertEqual(expire_reservations(batch_size=2), 0)
+
+        self.assertEqual(self.remaining(), 9)
+        self.assertEqual(Reservation.objects.filter(status='expired').count(), 3)
+        self.assertEqual(Reservation.objects.filter(status='active').count(), 1)
+
+    def test_sweep_skips_holds_cancelled_after_the_read(self):
+        cancelled_id, expired_id = (self.reserve(2, user_id=f'user-{index}').data['id'] for index in range(2))
+        for reservation_id in (cancelled_id, expired_id):
+            self.expire(reservation_id)
+
+        def cancel_after_read(now, batch_size):
+            pks = due_reservation_pks(now, batch_size)
+            # A concurrent DELETE claims the hold and returns its stock.
+            Reservation.objects.filter(pk=cancelled_id).update(status='cancelled', released_at=timezone.now())
+            TicketType.objects.filter(pk=self.ticket_type.pk).update(quantity=8)
+            return pks
+
+        with mock.patch('payments.reservations.due_reservation_pks', side_effect=cancel_after_read):
+            self.assertEqual(expire_reservations(), 1)
+
+        self.assertEqual(self.remaining(), 10)
+        self.assertEqual(Reservation.objects.get(pk=cancelled_id).status, 'cancelled')
+        self.assertEqual(str(Reservation.objects.get(status='expired').pk), expired_id)
@@ -0,0 +1,48 @@
+"""Tests for the idempotent seed loading command."""
+
+from io import StringIO
+from pathlib import Path
+
+from django.core.management import call_command
+from django.test import TestCase
+
+from payments.models import TicketType
+
+SEED_FIXTURE = Path(__file__).resolve().parents[2] / 'seed_data.json'
+
+
+class LoadSeedDataTests(TestCase):
+
+    def run_command(self, *args):
+        out = StringIO()
+        call_command('load_seed_data', str(SEED_FIXTURE), *args, stdout=out)
+        return out.getvalue()
+
+    def test_loads_fixture_into_empty_database(self):
+        output = self.run_command()
+
+        self.assertIn('Loaded seed data', output)
+        self.assertEqual(TicketType.objects.count(), 4)
+
+    def test_skips_when_data_already_exists(self):
+        TicketType.objects.create(event_id='33333333-3333-3333-3333-333333333333',
+                                  name='Existing', price=1, quantity=1)
+
+        output = self.run_command()
+
+        self.assertIn('Seed data skipped', output)
+        self.assertEqual(TicketType.objects.count(), 1)
+
+    def test_force_loads_over_existing_data(self):
+        TicketType.objects.create(event_id='33333333-3333-3333-3333-333333333333',
+                                  name='Existing', price=1, quantity=1)
+
+        self.run_command('--force')
+
+        self.assertEqual(TicketType.objects.count(), 5)
+
+    def test_missing_fixture_is_not_an_error(self):
+        out = StringIO()
+        call_command('load_seed_data', 'does-not-exist.json', stdout=out)
+
+        self.assertIn('No seed fixture', out.getvalue())
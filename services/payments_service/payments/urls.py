@@ -7,4 +7,8 @@ urlpatterns = [
     path('events/<uuid:event_id>/tickets/', views.EventTicketsListView.as_view(), name='event-tickets'),
     path('orders/', views.OrderCreateView.as_view(), name='order-create'),
     path('orders/<uuid:pk>/', views.OrderDetailView.as_view(), name='order-detail'),
+    path('users/<str:user_id>/orders/', views.UserOrderListView.as_view(), name='user-orders'),
+    path('reservations/', views.ReservationCreateView.as_view(), name='reservation-create'),
+    path('reservations/<uuid:pk>/', views.ReservationDetailView.as_view(), name='reservation-detail'),
+    path('reservations/<uuid:pk>/confirm/', views.ReservationConfirmView.as_view(), name='reservation-confirm'),
 ]
\ No newline at end of file
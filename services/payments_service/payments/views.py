@@ -1,35 +1,41 @@
 """API views for the payments service."""
 
 from rest_framework import generics, status
+from rest_framework.views import APIView
 from rest_framework.response import Response
+from django.db import transaction
 from django.shortcuts import get_object_or_404
 
-from .models import TicketType, Order
-from .serializers import TicketTypeSerializer, OrderSerializer, OrderInputSerializer
-
-import os
-import json
-try:
-    import pika
-except ImportError:
-    pika = None
-
-def publish_event(event_type: str, data: dict) -> None:
-    if pika is None:
-        return
-    host = os.environ.get('RABBITMQ_HOST', 'localhost')
-    user = os.environ.get('RABBITMQ_USER', 'guest')
-    password = os.environ.get('RABBITMQ_PASS', 'guest')
-    try:
-        credentials = pika.PlainCredentials(user, password)
-        connection = pika.BlockingConnection(pika.ConnectionParameters(host=host, credentials=credentials))
-        channel = connection.channel()
-        channel.queue_declare(queue='events', durable=True)
-        message = json.dumps({'type': event_type, 'data': data})
-        channel.basic_publish(exchange='', routing_key='events', body=message)
-        connection.close()
-    except Exception:
-        pass
+from .conditional import conditional_detail
+from .models import TicketType, Order, Reservation
+from .outbox import enqueue_event
+from .pagination import OrderCursorPagination
+from .reservations import cancel_reservation, confirm_reservation
+from .serializers import (
+    TicketTypeSerializer,
+    OrderSerializer,
+    OrderInputSerializer,
+    ReservationSerializer,
+    ReservationInputSerializer,
+)
+
+
+def enqueue_order_created(order: Order) -> None:
+    """Record the order_created event for ``order`` in the outbox."""
+    items = []
+    for item in order.items.all():
+        try:
+            items.append({
+                'ticket_type_id': str(item.ticket_type_id),
+                'quantity': item.quantity,
+            })
+        except Exception:
+            pass
+    enqueue_event('order_created', {
+        'id': str(order.id),
+        'user_id': order.user_id,
+        'items': items,
+    })
 
 
 class EventTicketsListView(generics.ListAPIView):
@@ -38,7 +44,7 @@ class EventTicketsListView(generics.ListAPIView):
 
     def get_queryset(self):
         event_id = self.kwargs.get('event_id')
-        return TicketType.objects.filter(event_id=event_id)
+        return TicketType.objects.with_stock().filter(event_id=event_id)
 
 
 class OrderCreateView(generics.CreateAPIView):
@@ -48,27 +54,75 @@ class OrderCreateView(generics.CreateAPIView):
     def create(self, request, *args, **kwargs):
         serializer = OrderInputSerializer(data=request.data)
         serializer.is_valid(raise_exception=True)
-        order = serializer.save()
-        items = []
-        for item in order.items.all():
-            try:
-                items.append({
-                    'ticket_type_id': str(item.ticket_type_id),
-                    'quantity': item.quantity,
-                })
-            except Exception:
-                pass
-        publish_event('order_created', {
-            'id': str(order.id),
-            'user_id': order.user_id,
-            'items': items,
-        })
+        with transaction.atomic():
+            order = serializer.save()
+            enqueue_order_created(order)
         output = OrderSerializer(order)
         return Response(output.data, status=status.HTTP_201_CREATED)
 
 
+# Orders are written once and never updated, so created_at is their version.
+@conditional_detail(Order, field='created_at')
 class OrderDetailView(generics.RetrieveAPIView):
 
-    queryset = Order.objects.all()
+    queryset = Order.objects.with_items()
+    serializer_class = OrderSerializer
+    lookup_field = 'pk'
+
+
+class UserOrderListView(generics.ListAPIView):
+    """A user's orders, newest first, with their line items."""
+
     serializer_class = OrderSerializer
-    lookup_field = 'pk'
\ No newline at end of file
+    pagination_class = OrderCursorPagination
+
+    def get_queryset(self):
+        user_id = self.kwargs.get('user_id')
+        return Order.objects.with_items().filter(user_id=user_id)
+
+
+class ReservationCreateView(generics.CreateAPIView):
+    """Hold tickets for ``TICKET_HOLD_SECONDS`` while the user checks out."""
+
+    serializer_class = ReservationInputSerializer
+
+    def create(self, request, *args, **kwargs):
+        serializer = ReservationInputSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        reservation = serializer.save()
+        output = ReservationSerializer(reservation)
+        return Response(output.data, status=status.HTTP_201_CREATED)
+
+
+class ReservationDetailView(generics.RetrieveDestroyAPIView):
+    """Retrieve a reservation, or cancel it and release its tickets."""
+
+    queryset = Reservation.objects.prefetch_related('items__ticket_type')
+    serializer_class = ReservationSerializer
+    lookup_field = 'pk'
+
+    def destroy(self, request, *args, **kwargs):
+        reservation = self.get_object()
+        if not cancel_reservation(reservation):
+            return Response(
+                {"detail": "Reservation is no longer active."},
+                status=status.HTTP_409_CONFLICT,
+            )
+        return Response(status=status.HTTP_204_NO_CONTENT)
+
+
+class ReservationConfirmView(APIView):
+    """Convert an active reservation into a completed order."""
+
+    def post(self, request, pk: str, *args, **kwargs) -> Response:
+        reservation = get_object_or_404(Reservation, pk=pk)
+        with transaction.atomic():
+            order = confirm_reservation(reservation)
+            if order is None:
+                return Response(
+                    {"detail": "Reservation has expired or is no longer active."},
+                    status=status.HTTP_409_CONFLICT,
+                )
+            enqueue_order_created(order)
+        output = OrderSerializer(order)
+        return Response(output.data, status=status.HTTP_201_CREATED)
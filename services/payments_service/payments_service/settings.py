@@ -3,12 +3,14 @@
 import os
 from pathlib import Path
 
+from payments_service.database import sqlite_profile
+
 BASE_DIR = Path(__file__).resolve().parent.parent
 
 SECRET_KEY = os.environ.get('DJANGO_SECRET_KEY')
 if not SECRET_KEY:
     raise ValueError("DJANGO_SECRET_KEY environment variable is required")
-DEBUG = True
+DEBUG = os.environ.get('DJANGO_DEBUG', 'false').lower() in ('1', 'true', 'yes')
 
 ALLOWED_HOSTS = ['*']
 
@@ -57,9 +59,21 @@ DATABASES = {
     'default': {
         'ENGINE': 'django.db.backends.sqlite3',
         'NAME': BASE_DIR / 'db.sqlite3',
+        # On-disk test database so concurrency tests exercise real locking.
+        'TEST': {'NAME': BASE_DIR / 'test_db.sqlite3'},
     }
 }
 
+# PRAGMA profile applied to each SQLite connection: 'default' or 'tuned' (see database.py)
+SQLITE_PROFILE = os.environ.get('SQLITE_PROFILE', 'default')
+sqlite_profile(SQLITE_PROFILE)  # fail at startup on an unknown profile
+
+# Persistent connections, so the tuned profile's page cache and memory map
+# survive between requests and its PRAGMAs run once per connection
+if SQLITE_PROFILE == 'tuned':
+    DATABASES['default']['CONN_MAX_AGE'] = int(os.environ.get('DB_CONN_MAX_AGE', 60))
+    DATABASES['default']['CONN_HEALTH_CHECKS'] = True
+
 AUTH_PASSWORD_VALIDATORS = []
 
 LANGUAGE_CODE = 'en-us'
@@ -70,3 +84,6 @@ USE_TZ = True
 STATIC_URL = 'static/'
 
 DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
+
+# How long a ticket reservation holds inventory before the sweep releases it
+TICKET_HOLD_SECONDS = int(os.environ.get('TICKET_HOLD_SECONDS', '600'))
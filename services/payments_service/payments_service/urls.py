@@ -1,9 +1,14 @@
 """payments_service URL Configuration"""
 
-from django.contrib import admin
+from django.apps import apps
 from django.urls import path, include
 
 urlpatterns = [
-    path('admin/', admin.site.urls),
     path('', include('payments.urls')),
-]
\ No newline at end of file
+]
+
+# The API-only settings profile does not install the admin.
+if apps.is_installed('django.contrib.admin'):
+    from django.contrib import admin
+
+    urlpatterns.insert(0, path('admin/', admin.site.urls))